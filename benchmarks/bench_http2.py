@@ -0,0 +1,127 @@
+"""Compare the throughput of HTTP/1.1 pooling and HTTP/2 multiplexing.
+
+Starts two local stub servers that answer every request after a fixed latency,
+one speaking HTTP/1.1 and one speaking HTTP/2 without TLS (requires
+``pushpad[http2]``), then sends the same notifications to both with
+``notifications.create_many`` from a pool of threads.
+
+    python benchmarks/bench_http2.py [requests] [threads] [latency_ms]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+import h2.config
+import h2.connection
+import h2.events
+
+from pushpad import HTTP2Transport, Pushpad
+
+BODY = b'{"id":1,"scheduled":1}'
+
+
+class Stub:
+    latency = 0.01
+    connections = 0
+
+
+class HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        Stub.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(Stub.latency)
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class HTTP2Protocol(asyncio.Protocol):
+    def connection_made(self, transport):
+        Stub.connections += 1
+        self.transport = transport
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        self.conn.initiate_connection()
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.get_running_loop().call_later(Stub.latency, self.respond, event.stream_id)
+        self.transport.write(self.conn.data_to_send())
+
+    def respond(self, stream_id):
+        headers = [(":status", "201"), ("content-type", "application/json"), ("content-length", str(len(BODY)))]
+        self.conn.send_headers(stream_id, headers)
+        self.conn.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def start_http1() -> tuple[str, Callable[[], None]]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HTTP1Handler)
+    threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}", server.shutdown
+
+
+def start_http2() -> tuple[str, Callable[[], None]]:
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(HTTP2Protocol, "127.0.0.1", 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    port = server.sockets[0].getsockname()[1]
+    return f"http://127.0.0.1:{port}", lambda: loop.call_soon_threadsafe(loop.stop)
+
+
+def run(client: Pushpad, count: int, threads: int) -> float:
+    payloads = [{"body": f"Hello {i}", "uids": [f"user-{i}"]} for i in range(count)]
+    start = time.perf_counter()
+    results = client.notifications.create_many(payloads, concurrency=threads)
+    elapsed = time.perf_counter() - start
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        raise errors[0]
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    Stub.latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 10) / 1000
+
+    print(f"{count} requests, {threads} threads, {Stub.latency * 1000:.0f}ms server latency")
+    print(f"{'transport':<24}{'req/s':>10}{'connections':>14}")
+    cases = [
+        ("HTTP/1.1 pool", start_http1, lambda url: Pushpad("token", 1, base_url=url, pool_maxsize=threads)),
+        (
+            "HTTP/2 multiplexed",
+            start_http2,
+            lambda url: Pushpad("token", 1, base_url=url, transport=HTTP2Transport(http1=False, max_connections=1)),
+        ),
+    ]
+    for name, start_server, make_client in cases:
+        url, stop = start_server()
+        Stub.connections = 0
+        with make_client(url) as client:
+            elapsed = run(client, count, threads)
+        stop()
+        print(f"{name:<24}{count / elapsed:>10.0f}{Stub.connections:>14}")
+
+
+if __name__ == "__main__":
+    main()
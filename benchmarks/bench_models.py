@@ -0,0 +1,96 @@
+"""Compare the memory use and decode time of the model classes.
+
+Decodes the same JSON list of subscriptions with a plain dataclass (how the
+models were defined before ``slots=True``), with the slotted
+:class:`Subscription` and with :class:`LazySubscription`, used by
+``Pushpad(lazy_models=True)``. The time includes the JSON decoding, and the
+memory is that kept by the objects, including the decoded data that lazy
+models keep alive.
+
+    python benchmarks/bench_models.py [count]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from pushpad.types import LazySubscription, Subscription
+
+
+@dataclass
+class PlainSubscription:
+    """The :class:`Subscription` model as it was defined before ``slots=True``."""
+
+    id: int
+    project_id: int
+    endpoint: str
+    p256dh: str | None
+    auth: str | None
+    uid: str | None
+    tags: list[str] | None
+    last_click_at: str | None
+    created_at: str
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "PlainSubscription":
+        return cls(
+            id=data.get("id"),
+            project_id=data.get("project_id"),
+            endpoint=data.get("endpoint"),
+            p256dh=data.get("p256dh"),
+            auth=data.get("auth"),
+            uid=data.get("uid"),
+            tags=data.get("tags"),
+            last_click_at=data.get("last_click_at"),
+            created_at=data.get("created_at"),
+        )
+
+
+def make_payload(count: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "project_id": 1,
+            "endpoint": f"https://push.example.com/send/{i:012d}",
+            "p256dh": "BCQVDTlYWdl05lal3lG5SKr3VxTrEWpZErbkxWrzknHrIKFwihDoZpc_2sH6Sh08h-CacUYI-H8gW4jH-uMYZQ4=",
+            "auth": "cdKMlhgVeSPzCXZ3V7FtgQ==",
+            "uid": f"user-{i}",
+            "tags": ["paid", "newsletter"],
+            "last_click_at": None,
+            "created_at": "2025-01-01T00:00:00.000Z",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(model: type, body: bytes) -> tuple[float, int]:
+    """Return the time to decode ``body`` into models and the memory kept by them, including the data they keep."""
+    start = time.perf_counter()
+    [model.from_api(data) for data in json.loads(body)]
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    objects = [model.from_api(data) for data in json.loads(body)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return elapsed, size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    body = json.dumps(make_payload(count)).encode()
+    print(f"{count} subscriptions")
+    print(f"{'model':<20}{'decode (ms)':>14}{'memory (KiB)':>16}")
+    for model in (PlainSubscription, Subscription, LazySubscription):
+        elapsed, size = measure(model, body)
+        print(f"{model.__name__:<20}{elapsed * 1000:>14.1f}{size / 1024:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
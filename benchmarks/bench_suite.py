@@ -0,0 +1,289 @@
+"""Measure the throughput, latency and memory of the client against a fake API.
+
+Runs each benchmark against the in-process fake API of ``fake_api.py``, over
+HTTP from a local server (``--transport http``, the default) or in memory
+(``--transport memory``, to measure the client alone), and prints one line per
+benchmark. With ``--output`` the results are also written as JSON, which can
+be compared with the results of another release with ``--compare``:
+
+    python benchmarks/bench_suite.py --output new.json
+    python benchmarks/bench_suite.py --output new.json --compare old.json --max-regression 0.1
+
+``--max-regression`` makes the command fail when the throughput of a benchmark
+is lower than in the compared results by more than that fraction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from fake_api import FakePushpadAPI, make_subscription
+
+from pushpad import Hook, Pushpad, PushpadError, RetryPolicy, __version__
+from pushpad.types import LazySubscription, Subscription
+
+
+class LatencyRecorder(Hook):
+    """Keep the latency of every request and count the failed attempts."""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def after_response(self, event: Any) -> None:
+        with self._lock:
+            self.latencies.append(event.latency)
+            if event.status >= 400:
+                self.errors += 1
+
+    def on_error(self, event: Any) -> None:
+        with self._lock:
+            self.latencies.append(event.latency)
+            self.errors += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latencies = []
+            self.errors = 0
+
+
+def percentile(values: list[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Suite:
+    def __init__(self, options: argparse.Namespace, client: Pushpad, recorder: LatencyRecorder) -> None:
+        self.options = options
+        self.client = client
+        self.recorder = recorder
+        # Sends and listings that failed even after the retries, in the current run.
+        self.errors = 0
+
+    def benchmarks(self) -> Dict[str, tuple[str, Callable[[], int]]]:
+        """Return the benchmarks by name, with the unit counted and the function running them."""
+        return {
+            "send": ("notifications", self.send),
+            "send_concurrent": ("notifications", self.send_concurrent),
+            "paginate": ("subscriptions", self.paginate),
+            "paginate_stream": ("subscriptions", self.paginate_stream),
+            "export_concurrent": ("subscriptions", self.export_concurrent),
+            "export_table": ("subscriptions", self.export_table),
+            "decode_models": ("subscriptions", self.decode_models),
+            "decode_lazy_models": ("subscriptions", self.decode_lazy_models),
+        }
+
+    def send(self) -> int:
+        sent = 0
+        for i in range(self.options.requests):
+            try:
+                self.client.notifications.create(body=f"Hello {i}", uids=[f"user-{i}"])
+            except PushpadError:
+                self.errors += 1
+            else:
+                sent += 1
+        return sent
+
+    def send_concurrent(self) -> int:
+        payloads = [{"body": f"Hello {i}", "uids": [f"user-{i}"]} for i in range(self.options.requests)]
+        results = self.client.notifications.create_many(payloads, concurrency=self.options.workers)
+        failed = sum(1 for result in results if isinstance(result, PushpadError))
+        self.errors += failed
+        return len(results) - failed
+
+    def paginate(self) -> int:
+        return self._count(lambda: self.client.subscriptions.iter_all(per_page=self.options.per_page))
+
+    def paginate_stream(self) -> int:
+        return self._count(lambda: self.client.subscriptions.iter_all(per_page=self.options.per_page, stream=True))
+
+    def export_concurrent(self) -> int:
+        options = self.options
+        return self._count(lambda: self.client.subscriptions.export(per_page=options.per_page, workers=options.workers))
+
+    def export_table(self) -> int:
+        options = self.options
+        return self._count(
+            lambda: self.client.subscriptions.export_table(per_page=options.per_page, workers=options.workers)
+        )
+
+    def _count(self, listing: Callable[[], Iterable[Any]]) -> int:
+        """Count the subscriptions listed; a listing failing after the retries cannot resume and counts as an error."""
+        count = 0
+        try:
+            for _ in listing():
+                count += 1
+        except PushpadError:
+            self.errors += 1
+        return count
+
+    def decode_models(self) -> int:
+        return self._decode(Subscription)
+
+    def decode_lazy_models(self) -> int:
+        return self._decode(LazySubscription)
+
+    def _decode(self, model: type) -> int:
+        # From the JSON body, so that the memory includes the data kept by the lazy models.
+        objects = [model.from_api(data) for data in json.loads(self.body)]
+        return len(objects)
+
+    @property
+    def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            self._body = json.dumps([make_subscription(i + 1) for i in range(self.options.subscriptions)]).encode()
+        return self._body
+
+    def run(self, name: str) -> Dict[str, Any]:
+        unit, function = self.benchmarks()[name]
+        # The fastest of the runs is kept, as the others were slowed down by something else.
+        elapsed = float("inf")
+        for _ in range(self.options.repeat):
+            self.recorder.reset()
+            self.errors = 0
+            start = time.perf_counter()
+            count = function()
+            seconds = time.perf_counter() - start
+            if seconds < elapsed:
+                elapsed = seconds
+                latencies = list(self.recorder.latencies)
+                failed_attempts = self.recorder.errors
+                errors = self.errors
+
+        # Measured on a second run: tracing the allocations slows the code down.
+        tracemalloc.start()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        p50 = percentile(latencies, 0.5)
+        p99 = percentile(latencies, 0.99)
+        return {
+            "name": name,
+            "unit": unit,
+            "count": count,
+            "seconds": round(elapsed, 6),
+            "per_second": round(count / elapsed, 1) if elapsed else None,
+            "requests": len(latencies),
+            "failed_attempts": failed_attempts,
+            "errors": errors,
+            "p50_ms": round(p50 * 1000, 3) if p50 is not None else None,
+            "p99_ms": round(p99 * 1000, 3) if p99 is not None else None,
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else None,
+            "peak_memory_kib": round(peak / 1024, 1),
+        }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: Optional[float]) -> bool:
+    """Print the change of each benchmark against ``baseline`` and tell whether none regressed too much."""
+    previous = {b["name"]: b for b in baseline["benchmarks"]}
+    ok = True
+    print(f"\ncompared with pushpad {baseline['pushpad_version']} ({baseline['transport']})")
+    print(f"{'benchmark':<22}{'throughput':>12}{'p50':>10}{'memory':>10}")
+    for result in results["benchmarks"]:
+        old = previous.get(result["name"])
+        if old is None or not old["per_second"] or not result["per_second"]:
+            continue
+        ratio = result["per_second"] / old["per_second"]
+        latency = _change(result["p50_ms"], old["p50_ms"])
+        memory = _change(result["peak_memory_kib"], old["peak_memory_kib"])
+        flag = ""
+        if max_regression is not None and ratio < 1 - max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{result['name']:<22}{ratio - 1:>+12.1%}{latency:>10}{memory:>10}{flag}")
+    return ok
+
+
+def _change(new: Optional[float], old: Optional[float]) -> str:
+    if not new or not old:
+        return "-"
+    return f"{new / old - 1:+.1%}"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--transport", choices=("http", "memory"), default="http")
+    parser.add_argument("--requests", type=int, default=1000, help="notifications sent by the send benchmarks")
+    parser.add_argument("--subscriptions", type=int, default=10_000, help="subscriptions listed and decoded")
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=8, help="threads used by the concurrent benchmarks")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added by the fake API to each request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with a 503")
+    parser.add_argument("--no-total-count", action="store_true", help="do not send the X-Total-Count header")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark, the fastest is reported")
+    parser.add_argument("--only", action="append", help="run only the given benchmark (can be repeated)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results to compare with")
+    parser.add_argument("--max-regression", type=float, help="fail if a throughput drops by more than this fraction")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    options = parse_args(argv)
+    api = FakePushpadAPI(
+        subscriptions=options.subscriptions,
+        latency=options.latency_ms / 1000,
+        error_rate=options.error_rate,
+        total_count=not options.no_total_count,
+    )
+    recorder = LatencyRecorder()
+    retry = None
+    if options.error_rate:
+        retry = RetryPolicy(max_attempts=5, backoff_factor=0, retry_unprocessed_creates=True)
+    with ExitStack() as stack:
+        if options.transport == "http":
+            base_url = stack.enter_context(api.serve())
+            client = Pushpad("token", 1, base_url=base_url, pool_maxsize=options.workers, retry=retry, hooks=[recorder])
+        else:
+            client = Pushpad("token", 1, transport=api.transport(), retry=retry, hooks=[recorder])
+        stack.enter_context(client)
+        suite = Suite(options, client, recorder)
+        names = options.only or list(suite.benchmarks())
+        if options.no_total_count:
+            # Without X-Total-Count the pages cannot be requested in parallel.
+            names = [name for name in names if not name.startswith("export")]
+
+        print(f"pushpad {__version__}, {options.transport} transport, {options.latency_ms:g}ms latency")
+        print(f"{'benchmark':<22}{'per second':>12}{'p50 (ms)':>10}{'p99 (ms)':>10}{'memory (KiB)':>14}{'errors':>8}")
+        benchmarks = []
+        for name in names:
+            result = suite.run(name)
+            benchmarks.append(result)
+            p50 = f"{result['p50_ms']:.2f}" if result["p50_ms"] is not None else "-"
+            p99 = f"{result['p99_ms']:.2f}" if result["p99_ms"] is not None else "-"
+            memory = result["peak_memory_kib"]
+            print(f"{name:<22}{result['per_second']:>12.0f}{p50:>10}{p99:>10}{memory:>14.0f}{result['errors']:>8}")
+
+    results = {
+        "pushpad_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "transport": options.transport,
+        "options": {k: v for k, v in vars(options).items() if k not in ("output", "compare", "max_regression", "only")},
+        "benchmarks": benchmarks,
+    }
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if options.compare:
+        with open(options.compare) as file:
+            if not compare(results, json.load(file), options.max_regression):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,214 @@
+"""In-process fake of the Pushpad API used by the benchmarks.
+
+The same :class:`FakePushpadAPI` answers the requests either over HTTP, from a
+local server started with :meth:`FakePushpadAPI.serve`, or without any socket
+through :meth:`FakePushpadAPI.transport` (a :class:`pushpad.MemoryTransport`),
+to measure the client alone. It implements the endpoints used by the
+benchmarks: creating notifications, getting a notification and listing,
+counting and getting subscriptions, with ``page``/``per_page`` pagination and
+the ``X-Total-Count`` header.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from pushpad import MemoryResponse, MemoryTransport
+
+Query = Dict[str, list]
+Reply = Tuple[int, Dict[str, str], bytes]
+
+DEFAULT_PER_PAGE = 25
+
+_ROUTES = [
+    ("POST", re.compile(r"/projects/(\d+)/notifications"), "create_notification"),
+    ("GET", re.compile(r"/notifications/(\d+)"), "get_notification"),
+    ("GET", re.compile(r"/projects/(\d+)/subscriptions"), "list_subscriptions"),
+    ("GET", re.compile(r"/projects/(\d+)/subscriptions/(\d+)"), "get_subscription"),
+]
+
+
+def make_subscription(i: int, project_id: int = 1) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "project_id": project_id,
+        "endpoint": f"https://push.example.com/send/{i:012d}",
+        "p256dh": "BCQVDTlYWdl05lal3lG5SKr3VxTrEWpZErbkxWrzknHrIKFwihDoZpc_2sH6Sh08h-CacUYI-H8gW4jH-uMYZQ4=",
+        "auth": "cdKMlhgVeSPzCXZ3V7FtgQ==",
+        "uid": f"user-{i}",
+        "tags": ["paid", "newsletter"] if i % 3 else ["newsletter"],
+        "last_click_at": "2025-01-02T03:04:05.000Z" if i % 2 else None,
+        "created_at": "2025-01-01T00:00:00.000Z",
+    }
+
+
+class FakePushpadAPI:
+    """Fake Pushpad API with ``subscriptions`` subscriptions in every project.
+
+    Each request waits ``latency`` seconds and fails with a 503 with
+    probability ``error_rate`` (drawn from a generator seeded with ``seed``).
+    Without ``total_count`` the subscription lists do not send the
+    ``X-Total-Count`` header.
+    """
+
+    def __init__(
+        self,
+        *,
+        subscriptions: int = 10_000,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        total_count: bool = True,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.total_count = total_count
+        self.subscriptions = [make_subscription(i + 1) for i in range(subscriptions)]
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._pages: Dict[Tuple[Any, ...], Tuple[bytes, int]] = {}
+        self._lock = threading.Lock()
+
+    def handle(self, method: str, path: str, query: Query, body: Optional[bytes], headers: Dict[str, str]) -> Reply:
+        """Answer a request with its status, headers and body."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            failed = self.error_rate and self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        if failed:
+            return 503, {}, b"Service Unavailable"
+        if body and headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        for route_method, pattern, name in _ROUTES:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                return getattr(self, name)(*map(int, match.groups()), query=query, body=body)
+        return 404, {}, b"Not Found"
+
+    def create_notification(self, project_id: int, *, query: Query, body: Optional[bytes]) -> Reply:
+        payload = json.loads(body or b"{}")
+        with self._lock:
+            notification_id = self.requests
+        scheduled = len(payload.get("uids") or ()) or len(self.subscriptions)
+        return _json(201, {"id": notification_id, "scheduled": scheduled})
+
+    def get_notification(self, notification_id: int, *, query: Query, body: Optional[bytes]) -> Reply:
+        return _json(200, {"id": notification_id, "project_id": 1, "title": "Hello", "body": "Hello world"})
+
+    def get_subscription(self, project_id: int, subscription_id: int, *, query: Query, body: Optional[bytes]) -> Reply:
+        if not 0 < subscription_id <= len(self.subscriptions):
+            return 404, {}, b"Not Found"
+        return _json(200, self.subscriptions[subscription_id - 1])
+
+    def list_subscriptions(self, project_id: int, *, query: Query, body: Optional[bytes]) -> Reply:
+        page = int(_first(query, "page", 1))
+        per_page = int(_first(query, "per_page", DEFAULT_PER_PAGE))
+        uids = tuple(query.get("uids[]", ()))
+        tags = tuple(query.get("tags[]", ()))
+        key = (page, per_page, uids, tags)
+        cached = self._pages.get(key)
+        if cached is None:
+            # Pages are encoded once, so that the fake costs little to the client measured.
+            matching = self._matching(uids, tags)
+            start = (page - 1) * per_page
+            cached = self._pages[key] = (json.dumps(matching[start : start + per_page]).encode(), len(matching))
+        content, total = cached
+        headers = {"Content-Type": "application/json"}
+        if self.total_count:
+            headers["X-Total-Count"] = str(total)
+        return 200, headers, content
+
+    def _matching(self, uids: Tuple[str, ...], tags: Tuple[str, ...]) -> list:
+        if not uids and not tags:
+            return self.subscriptions
+        return [
+            s
+            for s in self.subscriptions
+            if (not uids or s["uid"] in uids) and (not tags or any(tag in s["tags"] for tag in tags))
+        ]
+
+    def transport(self) -> MemoryTransport:
+        """Return a transport answering the requests of a client in memory."""
+
+        def handler(request: Any) -> MemoryResponse:
+            url = urlsplit(request.url)
+            query = {k: v if isinstance(v, list) else [v] for k, v in (request.params or {}).items()}
+            status, headers, content = self.handle(
+                request.method, url.path.removeprefix("/api/v1"), query, request.content, request.headers
+            )
+            return MemoryResponse(status, content=content, headers=headers)
+
+        transport = MemoryTransport(handler)
+        # Requests are not kept: the benchmarks send too many of them.
+        transport.requests = _Discard()
+        return transport
+
+    @contextmanager
+    def serve(self) -> Iterator[str]:
+        """Serve the API over HTTP/1.1 from a local thread and yield its base URL."""
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately: avoid waiting for the delayed ACK.
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                self._reply()
+
+            def do_POST(self) -> None:
+                self._reply()
+
+            def _reply(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                status, headers, content = api.handle(
+                    self.command, url.path, parse_qs(url.query), body, dict(self.headers)
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class _Discard(list):
+    def append(self, item: Any) -> None:
+        pass
+
+
+def _first(query: Query, name: str, default: Any) -> Any:
+    values = query.get(name)
+    return values[0] if values else default
+
+
+def _json(status: int, payload: Any) -> Reply:
+    return status, {"Content-Type": "application/json"}, json.dumps(payload).encode()
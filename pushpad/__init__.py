@@ -1,20 +1,90 @@
 # -*- coding: utf-8 -*-
 """Public package interface."""
 
+from ._cache import CacheStats, ResponseCache
+from ._circuit import CircuitBreaker, CircuitState
+from ._compression import CompressionStats
+from ._hooks import Hook, OpenTelemetryHook, PrometheusHook, RequestEvent
+from ._http2 import HTTP2Transport
+from ._json import JSONCodec, OrjsonCodec, UjsonCodec
+from ._pool import PoolStats
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
+from ._snapshot import SubscriptionChange, SubscriptionSnapshot
+from ._table import SubscriptionTable
+from ._timeout import Timeout
+from ._transport import (
+    AsyncHTTPXTransport,
+    AsyncMemoryTransport,
+    AsyncTransport,
+    MemoryResponse,
+    MemoryTransport,
+    RequestsTransport,
+    Transport,
+    TransportError,
+    TransportRequest,
+)
 from ._version import __version__
-from .exceptions import PushpadAPIError, PushpadClientError, PushpadError
+from ._watch import AsyncNotificationWatcher, NotificationChange, NotificationWatcher
+from .async_pushpad import AsyncPushpad
+from .exceptions import CircuitOpenError, DeadlineExceededError, PushpadAPIError, PushpadClientError, PushpadError
 from .pushpad import Pushpad
-from .types import Notification, NotificationCreateResult, Project, Sender, Subscription
+from .types import (
+    BulkUpdateResult,
+    ChunkedNotificationCreateResult,
+    Notification,
+    NotificationCreateResult,
+    Project,
+    Sender,
+    Subscription,
+)
 
 __all__ = [
     "__version__",
     "Pushpad",
+    "AsyncPushpad",
     "PushpadError",
     "PushpadClientError",
     "PushpadAPIError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "PoolStats",
+    "CompressionStats",
+    "Hook",
+    "RequestEvent",
+    "PrometheusHook",
+    "OpenTelemetryHook",
+    "Transport",
+    "AsyncTransport",
+    "RequestsTransport",
+    "AsyncHTTPXTransport",
+    "HTTP2Transport",
+    "MemoryTransport",
+    "AsyncMemoryTransport",
+    "MemoryResponse",
+    "TransportRequest",
+    "TransportError",
+    "JSONCodec",
+    "OrjsonCodec",
+    "UjsonCodec",
+    "RetryPolicy",
+    "Timeout",
+    "RateLimiter",
+    "CircuitBreaker",
+    "CircuitState",
+    "ResponseCache",
+    "CacheStats",
+    "NotificationWatcher",
+    "AsyncNotificationWatcher",
+    "NotificationChange",
     "Notification",
     "NotificationCreateResult",
+    "ChunkedNotificationCreateResult",
     "Subscription",
+    "BulkUpdateResult",
+    "SubscriptionTable",
+    "SubscriptionSnapshot",
+    "SubscriptionChange",
     "Project",
     "Sender",
 ]
@@ -0,0 +1,239 @@
+"""Configuration and helpers shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional, Tuple, Union
+
+from ._cache import ResponseCache
+from ._circuit import CircuitBreaker
+from ._compression import ACCEPT_ENCODING, DEFAULT_COMPRESSION_THRESHOLD, CompressionStats, Compressor
+from ._conditional import DEFAULT_CONDITIONAL_CACHE_SIZE, CachedResponse, ConditionalStore, copy_data
+from ._hooks import Hook
+from ._json import JSONCodec, default_codec
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
+from ._signer import Signer
+from ._timeout import Timeout, TimeoutTypes
+from ._transport import TransportError
+from ._version import __version__
+from .exceptions import DeadlineExceededError, PushpadAPIError, PushpadClientError
+
+JSONDict = MutableMapping[str, Any]
+
+
+APIResponse = Union[Dict[str, Any], list[Dict[str, Any]], None]
+
+
+class BaseClient:
+    """State and response handling common to :class:`Pushpad` and :class:`AsyncPushpad`."""
+
+    DEFAULT_BASE_URL = "https://pushpad.xyz/api/v1"
+
+    def __init__(
+        self,
+        auth_token: str,
+        project_id: Optional[int] = None,
+        *,
+        base_url: Optional[str] = None,
+        timeout: TimeoutTypes = 30,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        signature_cache_size: int = 1024,
+        lazy_models: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        hooks: Iterable[Hook] = (),
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
+        conditional_cache_size: int = DEFAULT_CONDITIONAL_CACHE_SIZE,
+    ) -> None:
+        if not auth_token:
+            raise ValueError("auth_token is required")
+        self._auth_token = auth_token
+        self._signer = Signer(auth_token, cache_size=signature_cache_size)
+        self._project_id = project_id
+        self._base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
+        self._timeout = Timeout.coerce(timeout)
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self._lazy_models = lazy_models
+        self._json = json_codec if json_codec is not None else default_codec()
+        self._compressor = Compressor(compression, threshold=compression_threshold)
+        self._hooks: Tuple[Hook, ...] = tuple(hooks)
+        self.cache = cache
+        self._conditional = ConditionalStore(conditional_cache_size) if conditional_requests else None
+
+    def _set_resource_timeouts(self, resource_timeouts: Optional[Mapping[str, TimeoutTypes]]) -> None:
+        for name, timeout in (resource_timeouts or {}).items():
+            if name not in ("notifications", "subscriptions", "projects", "senders"):
+                raise ValueError(f"unknown resource: {name}")
+            getattr(self, name).timeout = timeout
+
+    def _default_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._auth_token}",
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Content-Type": "application/json",
+            "User-Agent": f"pushpad-python/{__version__}",
+        }
+
+    def signature_for(self, data: str) -> str:
+        """Return the HMAC signature for a user identifier."""
+        return self._signer.sign(data)
+
+    def signatures_for(self, data: Iterable[str]) -> Iterator[str]:
+        """Yield the HMAC signature for each user identifier, in order."""
+        return self._signer.sign_many(data)
+
+    def signature_cache_info(self) -> Any:
+        """Return the hits, misses and size of the cache used by :meth:`signature_for`."""
+        return self._signer.cache_info()
+
+    def _resolve_project_id(self, project_id: Optional[int]) -> int:
+        pid = project_id if project_id is not None else self._project_id
+        if pid is None:
+            raise ValueError("project_id is required for this operation")
+        return pid
+
+    def _url(self, path: str) -> str:
+        return f"{self._base_url}{path}"
+
+    @staticmethod
+    def _reason(response: Any) -> Optional[str]:
+        return response.reason
+
+    @staticmethod
+    def _is_connect_error(exc: BaseException) -> bool:
+        """Tell whether a transport error happened before the request could be sent."""
+        return isinstance(exc, TransportError) and exc.connect
+
+    @staticmethod
+    def _client_error(exc: TransportError) -> PushpadClientError:
+        original = exc.__cause__ if exc.__cause__ is not None else exc
+        return PushpadClientError(str(exc), original_exception=original)
+
+    def _start_call(self, timeout: Optional[TimeoutTypes]) -> Tuple[Timeout, Optional[float]]:
+        """Return the timeout of a call and its deadline on the monotonic clock, if any."""
+        resolved = Timeout.coerce(timeout) if timeout is not None else self._timeout
+        deadline = time.monotonic() + resolved.total if resolved.total is not None else None
+        return resolved, deadline
+
+    @staticmethod
+    def _time_left(deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded before a response was received")
+        return remaining
+
+    def _record_outcome(self, *, error: Optional[BaseException] = None, response: Any = None) -> None:
+        """Feed the result of an attempt to the rate limiter and the circuit breaker.
+
+        Without ``error`` nor ``response`` the attempt was interrupted (by the
+        deadline, a cancellation or an unexpected exception) and the probe it
+        may have taken from a half-open circuit is released.
+        """
+        if response is not None and self._rate_limiter is not None:
+            self._rate_limiter.update_from_headers(response.headers)
+        if self.circuit_breaker is not None:
+            if error is None and response is None:
+                self.circuit_breaker.release()
+            elif error is not None or response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        guarded: bool = False,
+        deadline: Optional[float] = None,
+        error: Optional[BaseException] = None,
+        response: Any = None,
+    ) -> Optional[float]:
+        """Return the seconds to wait before retrying a failed attempt, or ``None`` to stop.
+
+        Raise :class:`DeadlineExceededError` from ``error`` if the deadline cut
+        the attempt short or leaves no time to retry it.
+        """
+        if error is not None and deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceededError("Deadline exceeded before a response was received") from error
+        if self._retry is None:
+            return None
+        if error is not None:
+            if not self._retry.should_retry(
+                method, attempt, error=error, connect_error=self._is_connect_error(error), guarded=guarded
+            ):
+                return None
+            delay = self._retry.delay(attempt)
+            if delay is not None and deadline is not None and time.monotonic() + delay >= deadline:
+                raise DeadlineExceededError("Deadline exceeded before the request could be retried") from error
+        else:
+            if response.status_code < 400:
+                return None
+            if not self._retry.should_retry(method, attempt, status=response.status_code, guarded=guarded):
+                return None
+            delay = self._retry.delay(attempt, response.headers.get("Retry-After"))
+        if delay is not None and deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def add_hook(self, hook: Hook) -> None:
+        """Call ``hook`` around each request sent from now on (see :class:`Hook`)."""
+        self._hooks = self._hooks + (hook,)
+
+    def compression_stats(self) -> CompressionStats:
+        """Return the bytes sent and received so far, before and after compression."""
+        return self._compressor.stats()
+
+    def _encode_body(
+        self, payload: Optional[JSONDict], headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+        """Return the body of a request and its headers, with the ones describing its encoding."""
+        body, encoding = self._compressor.compress(self._json.dumps(payload) if payload is not None else None)
+        if encoding is not None:
+            headers = {**(headers or {}), "Content-Encoding": encoding}
+        return body, headers
+
+    def _conditional_request(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, Optional[CachedResponse], Optional[Dict[str, str]]]:
+        """Return the key of a GET request with conditional requests enabled, its cached response and headers."""
+        if self._conditional is None or method != "GET":
+            return None, None, None
+        key = self._conditional.key(path, params)
+        cached = self._conditional.get(key)
+        return key, cached, cached.headers() if cached is not None else None
+
+    def _decode_conditional(self, response: Any, key: Any, cached: Optional[CachedResponse]) -> APIResponse:
+        """Decode a response, or return the cached one on 304 Not Modified."""
+        if key is None:
+            return self._decode_response(response)
+        if response.status_code == 304 and cached is not None:
+            return copy_data(cached.data)
+        data = self._decode_response(response)
+        self._conditional.put(key, response.headers, data)
+        return data
+
+    def _check_response(self, response: Any) -> None:
+        if response.status_code >= 400:
+            raise PushpadAPIError(response.status_code, reason=self._reason(response), response_body=response.text)
+
+    def _decode_response(self, response: Any) -> APIResponse:
+        if response.status_code in (202, 204) or not response.content:
+            return None
+
+        self._compressor.record_response(response)
+        try:
+            data = self._json.loads(response.content)
+        except ValueError as exc:  # pragma: no cover - unexpected API behaviour
+            raise PushpadClientError("Invalid JSON in response", original_exception=exc) from exc
+        return data
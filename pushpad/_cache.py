@@ -0,0 +1,190 @@
+"""Read-through cache of the projects, senders and notifications looked up by id."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+CACHED_RESOURCES = ("projects", "senders", "notifications")
+
+Key = Tuple[str, int]
+
+
+@dataclass
+class CacheStats:
+    """Counters of a :class:`ResponseCache`.
+
+    ``stale_hits`` are also counted in ``hits``; ``refresh_errors`` counts the
+    background refreshes that failed, leaving the stale value in the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class ResponseCache:
+    """Keep the objects returned by ``projects.get``, ``senders.get`` and ``notifications.get``.
+
+    An object is returned from the cache for ``ttl`` seconds after it was
+    received, or for the seconds given for its resource in ``ttls`` (e.g.
+    ``{"notifications": 5}``; ``0`` disables the cache for that resource).
+    Then, for ``stale_while_revalidate`` more seconds, the stale object is
+    still returned at once while a fresh copy is fetched in the background.
+    At most ``maxsize`` objects are kept, evicting the least recently used.
+
+    The cached objects are invalidated when they are updated, deleted or
+    cancelled through a client using the cache. The same instance can be
+    shared by many threads and clients, as long as they use the same account.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        maxsize: int = 1024,
+        stale_while_revalidate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        unknown = set(ttls or ()) - set(CACHED_RESOURCES)
+        if unknown:
+            raise ValueError(f"unknown resource: {', '.join(sorted(unknown))}")
+        self._ttls = {name: (ttls or {}).get(name, ttl) for name in CACHED_RESOURCES}
+        self._maxsize = maxsize
+        self._stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        # Key -> (data, time when it expires)
+        self._entries: OrderedDict[Key, Tuple[Any, float]] = OrderedDict()
+        # Bumped by each invalidation, so that a response fetched before it is not stored.
+        self._versions: Dict[Key, int] = {}
+        self._refreshing: set[Key] = set()
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, resource: str, id: int, fetch: Callable[[], Any]) -> Any:
+        """Return the cached data of an object, calling ``fetch`` when it is missing or expired."""
+        key = (resource, id)
+        found, data, version = self._lookup(key)
+        if found == "stale" and self._begin_refresh(key):
+            threading.Thread(target=self._refresh, args=(key, version, fetch), daemon=True).start()
+        if found is not None:
+            return data
+        return self._store(key, version, fetch())
+
+    async def aget(self, resource: str, id: int, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Like :meth:`get`, with a coroutine function ``fetch``; refreshes run as tasks."""
+        key = (resource, id)
+        found, data, version = self._lookup(key)
+        if found == "stale" and self._begin_refresh(key):
+            task = asyncio.get_running_loop().create_task(self._arefresh(key, version, fetch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if found is not None:
+            return data
+        return self._store(key, version, await fetch())
+
+    def invalidate(self, resource: str, id: Optional[int] = None) -> None:
+        """Drop the cached object ``id`` of ``resource``, or all the objects of ``resource``."""
+        with self._lock:
+            keys = [(resource, id)] if id is not None else [key for key in self._entries if key[0] == resource]
+            for key in keys:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                if self._entries.pop(key, None) is not None:
+                    self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all the cached objects."""
+        for resource in CACHED_RESOURCES:
+            self.invalidate(resource)
+
+    def stats(self) -> CacheStats:
+        """Return the hits, misses and other counters of the cache so far."""
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def _lookup(self, key: Key) -> Tuple[Optional[str], Any, int]:
+        """Return whether the key is ``"fresh"``, ``"stale"`` or missing (``None``), its data and version."""
+        with self._lock:
+            version = self._versions.get(key, 0)
+            entry = self._entries.get(key)
+            if entry is not None and self._ttls[key[0]] > 0:
+                data, expires = entry
+                now = self._clock()
+                if now < expires:
+                    found = "fresh"
+                elif now < expires + self._stale_while_revalidate:
+                    found = "stale"
+                    self._stats.stale_hits += 1
+                else:
+                    found = None
+                if found is not None:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    # A deep copy, as the models share the lists of the data and lazy models write to it.
+                    return found, copy.deepcopy(data), version
+            self._stats.misses += 1
+            return None, None, version
+
+    def _store(self, key: Key, version: int, data: Any) -> Any:
+        ttl = self._ttls[key[0]]
+        if ttl <= 0 or not isinstance(data, dict):
+            return data
+        with self._lock:
+            if self._versions.get(key, 0) == version:
+                self._entries[key] = (copy.deepcopy(data), self._clock() + ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._stats.evictions += 1
+        return data
+
+    def _begin_refresh(self, key: Key) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._stats.refreshes += 1
+            return True
+
+    def _end_refresh(self, key: Key, failed: bool) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+            if failed:
+                self._stats.refresh_errors += 1
+
+    def _refresh(self, key: Key, version: int, fetch: Callable[[], Any]) -> None:
+        failed = True
+        try:
+            self._store(key, version, fetch())
+            failed = False
+        except Exception:
+            pass  # the stale value stays until it expires
+        finally:
+            self._end_refresh(key, failed)
+
+    async def _arefresh(self, key: Key, version: int, fetch: Callable[[], Awaitable[Any]]) -> None:
+        failed = True
+        try:
+            self._store(key, version, await fetch())
+            failed = False
+        except Exception:
+            pass  # the stale value stays until it expires
+        finally:
+            self._end_refresh(key, failed)
+
+
+__all__ = ["CACHED_RESOURCES", "CacheStats", "ResponseCache"]
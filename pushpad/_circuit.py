@@ -0,0 +1,135 @@
+"""Circuit breaker that stops sending requests while the API is failing."""
+
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque
+
+from .exceptions import CircuitOpenError
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while the API is unavailable, instead of waiting for timeouts.
+
+    The outcome of the last ``window`` requests is recorded: network errors and
+    5xx responses count as failures. When at least ``minimum_calls`` outcomes
+    are known and the share of failures reaches ``failure_threshold``, the
+    circuit opens and requests raise :class:`CircuitOpenError` without being
+    sent. After ``recovery_timeout`` seconds the circuit becomes half open and
+    lets up to ``half_open_max_calls`` probe requests through at a time: it
+    closes again once ``half_open_max_calls`` probes have succeeded and reopens
+    as soon as one of them fails.
+
+    The same instance can be shared by many threads, asyncio tasks and clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window: int = 20,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be between 0 and 1")
+        if window < 1 or minimum_calls < 1 or half_open_max_calls < 1:
+            raise ValueError("window, minimum_calls and half_open_max_calls must be at least 1")
+        self._failure_threshold = failure_threshold
+        self._minimum_calls = min(minimum_calls, window)
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failures among the recorded outcomes."""
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return self._outcomes.count(False) / len(self._outcomes)
+
+    def before_request(self) -> None:
+        """Raise :class:`CircuitOpenError` if a request must not be sent now."""
+        with self._lock:
+            self._refresh()
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.HALF_OPEN and self._probes < self._half_open_max_calls:
+                self._probes += 1
+                return
+            retry_after = max(0.0, self._opened_at + self._recovery_timeout - self._clock())
+        raise CircuitOpenError(retry_after=retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                self._probe_successes += 1
+                if self._probe_successes < self._half_open_max_calls:
+                    return
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(False)
+            if self._state is CircuitState.CLOSED and len(self._outcomes) >= self._minimum_calls:
+                if self._outcomes.count(False) / len(self._outcomes) >= self._failure_threshold:
+                    self._open()
+
+    def release(self) -> None:
+        """Give back the probe taken by :meth:`before_request` for a request that ended without an outcome."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recorded outcomes."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+            self._probes = 0
+            self._probe_successes = 0
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probes = 0
+
+    def _refresh(self) -> None:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self._recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            self._probe_successes = 0
+
+
+__all__ = ["CircuitBreaker", "CircuitState"]
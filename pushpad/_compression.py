@@ -0,0 +1,97 @@
+"""Compression of the request bodies and accounting of the bytes saved."""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+ENCODINGS = ("gzip", "br")
+
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+# Response encodings decoded by requests and httpx; br only when brotli is installed.
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+@dataclass
+class CompressionStats:
+    """Bytes sent and received by a client, before and after compression.
+
+    Response sizes are counted for the responses whose body is read at once
+    and that state their compressed size in ``Content-Length``.
+    """
+
+    requests_compressed: int = 0
+    request_bytes: int = 0
+    request_bytes_sent: int = 0
+    responses_compressed: int = 0
+    response_bytes: int = 0
+    response_bytes_received: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes that did not go over the wire thanks to compression, in both directions."""
+        return self.request_bytes - self.request_bytes_sent + self.response_bytes - self.response_bytes_received
+
+
+class Compressor:
+    """Compress request bodies larger than ``threshold`` bytes with ``encoding`` and keep the stats."""
+
+    def __init__(self, encoding: Optional[str], *, threshold: int = DEFAULT_COMPRESSION_THRESHOLD) -> None:
+        if encoding is not None and encoding not in ENCODINGS:
+            raise ValueError(f"unsupported compression: {encoding}")
+        if encoding == "br" and brotli is None:
+            raise ImportError("brotli compression requires brotli: pip install brotli")
+        self.encoding = encoding
+        self.threshold = threshold
+        self._stats = CompressionStats()
+        self._lock = threading.Lock()
+
+    def compress(self, body: Optional[bytes]) -> Tuple[Optional[bytes], Optional[str]]:
+        """Return the body to send and its ``Content-Encoding``, if it was compressed."""
+        if body is None:
+            return None, None
+        encoding = self.encoding if len(body) >= self.threshold else None
+        if encoding == "gzip":
+            sent = gzip.compress(body, compresslevel=6)
+        elif encoding == "br":
+            sent = brotli.compress(body, quality=5)
+        else:
+            sent = body
+        with self._lock:
+            self._stats.request_bytes += len(body)
+            self._stats.request_bytes_sent += len(sent)
+            if encoding is not None:
+                self._stats.requests_compressed += 1
+        return sent, encoding
+
+    def record_response(self, response: Any) -> None:
+        """Count the size of a response body received at once, on the wire and decoded."""
+        size = len(response.content)
+        received = size
+        encoding = response.headers.get("Content-Encoding")
+        compressed = bool(encoding) and encoding != "identity"
+        if compressed:
+            length = response.headers.get("Content-Length")
+            if length is None or not length.isdigit():
+                return
+            received = int(length)
+        with self._lock:
+            self._stats.response_bytes += size
+            self._stats.response_bytes_received += received
+            if compressed:
+                self._stats.responses_compressed += 1
+
+    def stats(self) -> CompressionStats:
+        with self._lock:
+            return replace(self._stats)
+
+
+__all__ = ["ACCEPT_ENCODING", "CompressionStats", "Compressor", "DEFAULT_COMPRESSION_THRESHOLD"]
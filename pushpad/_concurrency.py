@@ -0,0 +1,73 @@
+"""Bounded, order-preserving concurrent map used by the bulk operations."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Deque, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int,
+    prefetch: Optional[int] = None,
+) -> Iterator[R]:
+    """Yield ``fn(item)`` for each item, in input order, using a pool of threads.
+
+    At most ``prefetch`` calls (``workers`` by default) are queued or running
+    at any time, so results that the consumer has not reached yet never pile
+    up in memory. Closing the iterator cancels the calls that have not started.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    prefetch = max(prefetch or workers, workers)
+    iterator = iter(items)
+    pending: Deque[Future[R]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for item in islice(iterator, prefetch):
+                pending.append(executor.submit(fn, item))
+            while pending:
+                result = pending.popleft().result()
+                for item in islice(iterator, 1):
+                    pending.append(executor.submit(fn, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def async_ordered_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """Async counterpart of :func:`ordered_map` with at most ``concurrency`` calls in flight."""
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    iterator = iter(items)
+    pending: Deque[asyncio.Future[R]] = deque()
+    try:
+        for item in islice(iterator, concurrency):
+            pending.append(asyncio.ensure_future(fn(item)))
+        while pending:
+            result = await pending.popleft()
+            for item in islice(iterator, 1):
+                pending.append(asyncio.ensure_future(fn(item)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+__all__ = ["ordered_map", "async_ordered_map"]
@@ -0,0 +1,79 @@
+"""Validators of the responses to GET requests, for conditional requests."""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+DEFAULT_CONDITIONAL_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Decoded body of a response, with the validators sent by the API for it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Any
+
+    def headers(self) -> Dict[str, str]:
+        """Return the headers asking the API to answer 304 if the response did not change."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalStore:
+    """Keep the last response with an ``ETag`` or ``Last-Modified`` of up to ``maxsize`` GET requests.
+
+    When the same request is sent again with the validators and the API
+    answers 304 Not Modified, the body kept is used instead of downloading
+    and decoding it again.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CONDITIONAL_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, params: Optional[Mapping[str, Any]]) -> Hashable:
+        if not params:
+            return path
+        return path, tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, headers: Mapping[str, str], data: Any) -> None:
+        """Keep ``data`` if the response has validators, otherwise forget any previous response."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if etag is None and last_modified is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = CachedResponse(etag, last_modified, copy_data(data))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+def copy_data(data: Any) -> Any:
+    """Copy decoded objects deeply, since the models share the lists of the data and lazy models write to it."""
+    return copy.deepcopy(data)
+
+
+__all__ = ["CachedResponse", "ConditionalStore", "DEFAULT_CONDITIONAL_CACHE_SIZE", "copy_data"]
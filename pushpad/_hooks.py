@@ -0,0 +1,232 @@
+"""Hooks called around each request sent to the API, and adapters for metrics and tracing."""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from ._version import __version__
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - depends on the environment
+    prometheus_client = None
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - depends on the environment
+    trace = None
+
+_PROJECT_SEGMENT = re.compile(r"^/projects/\d+(?=/)")
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def path_template(path: str) -> str:
+    """Replace the ids in an API path with placeholders, e.g. ``/projects/{pid}/subscriptions/{id}``."""
+    return _ID_SEGMENT.sub("/{id}", _PROJECT_SEGMENT.sub("/projects/{pid}", path))
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """One attempt of a request, passed to the :class:`Hook` methods.
+
+    ``path`` is the path template of the endpoint (``/projects/{pid}/subscriptions``),
+    ``attempt`` starts from 1 and ``bytes_sent`` is the size of the body on the
+    wire. The other fields are filled when the attempt ends: ``latency`` in
+    seconds until the response (its body too, unless streamed) was received,
+    the ``status`` and ``bytes_received`` when a response was received, or the
+    ``error`` otherwise. ``connection_reused`` is ``None`` when the transport
+    cannot tell. Hooks can keep their own data in ``context``.
+    """
+
+    method: str
+    path: str
+    url: str
+    attempt: int
+    bytes_sent: int
+    status: Optional[int] = None
+    latency: Optional[float] = None
+    bytes_received: Optional[int] = None
+    connection_reused: Optional[bool] = None
+    error: Optional[BaseException] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+    _started: float = field(default=0.0, repr=False, compare=False)
+
+    @property
+    def retries(self) -> int:
+        """Number of attempts that preceded this one."""
+        return self.attempt - 1
+
+
+class Hook:
+    """Base class of the hooks given to the clients with ``hooks``.
+
+    ``before_request`` is called before each attempt, then either
+    ``after_response`` when a response was received (whatever its status) or
+    ``on_error`` when the attempt failed without one, with the same event.
+    The hooks run in the thread (or event loop) sending the request and their
+    exceptions are not caught.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        pass
+
+    def after_response(self, event: RequestEvent) -> None:
+        pass
+
+    def on_error(self, event: RequestEvent) -> None:
+        pass
+
+
+def start_event(
+    hooks: tuple[Hook, ...], method: str, path: str, url: str, attempt: int, body: Optional[bytes]
+) -> RequestEvent:
+    event = RequestEvent(method, path_template(path), url, attempt, len(body) if body else 0)
+    for hook in hooks:
+        hook.before_request(event)
+    event._started = time.perf_counter()
+    return event
+
+
+def finish_event(
+    hooks: tuple[Hook, ...],
+    event: RequestEvent,
+    *,
+    response: Any = None,
+    error: Optional[BaseException] = None,
+    stream: bool = False,
+    connection_reused: Optional[bool] = None,
+) -> None:
+    event.latency = time.perf_counter() - event._started
+    if error is not None:
+        event.error = error
+        for hook in hooks:
+            hook.on_error(event)
+        return
+    event.status = response.status_code
+    event.bytes_received = _bytes_received(response, stream)
+    event.connection_reused = connection_reused
+    for hook in hooks:
+        hook.after_response(event)
+
+
+def _bytes_received(response: Any, stream: bool) -> Optional[int]:
+    length = response.headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length)
+    return None if stream else len(response.content)
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PrometheusHook(Hook):
+    """Export the requests of the client as Prometheus metrics (install ``prometheus-client``).
+
+    The metrics are registered in ``registry`` (the default registry of
+    ``prometheus_client`` if not given) with the ``namespace`` prefix and are
+    labelled with the method and the path template of the endpoint:
+    ``requests_total`` (also by status), ``errors_total``,
+    ``request_duration_seconds``, ``request_bytes_total``,
+    ``response_bytes_total``, ``retries_total`` and
+    ``connections_reused_total``.
+    """
+
+    def __init__(
+        self, registry: Any = None, *, namespace: str = "pushpad", buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        if prometheus_client is None:
+            raise ImportError("PrometheusHook requires prometheus-client: pip install prometheus-client")
+        options = {
+            "namespace": namespace,
+            "registry": registry if registry is not None else prometheus_client.REGISTRY,
+        }
+        labels = ("method", "path")
+        self.requests = prometheus_client.Counter(
+            "requests", "Requests that received a response", labels + ("status",), **options
+        )
+        self.errors = prometheus_client.Counter("errors", "Requests that failed without a response", labels, **options)
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds", "Time spent waiting for the responses", labels, buckets=buckets, **options
+        )
+        self.bytes_sent = prometheus_client.Counter("request_bytes", "Bytes of the request bodies", labels, **options)
+        self.bytes_received = prometheus_client.Counter(
+            "response_bytes", "Bytes of the response bodies", labels, **options
+        )
+        self.retries = prometheus_client.Counter("retries", "Attempts retrying a failed attempt", labels, **options)
+        self.connections_reused = prometheus_client.Counter(
+            "connections_reused", "Requests sent over a connection already open", labels, **options
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.requests.labels(event.method, event.path, str(event.status)).inc()
+        self._observe(event)
+        if event.bytes_received:
+            self.bytes_received.labels(event.method, event.path).inc(event.bytes_received)
+        if event.connection_reused:
+            self.connections_reused.labels(event.method, event.path).inc()
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.errors.labels(event.method, event.path).inc()
+        self._observe(event)
+
+    def _observe(self, event: RequestEvent) -> None:
+        self.duration.labels(event.method, event.path).observe(event.latency)
+        if event.bytes_sent:
+            self.bytes_sent.labels(event.method, event.path).inc(event.bytes_sent)
+        if event.attempt > 1:
+            self.retries.labels(event.method, event.path).inc()
+
+
+class OpenTelemetryHook(Hook):
+    """Trace each attempt as an OpenTelemetry client span (install ``opentelemetry-api``).
+
+    Spans are created with ``tracer`` (by default the ``pushpad`` tracer of the
+    global tracer provider), named after the method and the path template,
+    with the HTTP semantic convention attributes.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if trace is None:
+            raise ImportError("OpenTelemetryHook requires opentelemetry-api: pip install opentelemetry-api")
+        self.tracer = tracer if tracer is not None else trace.get_tracer("pushpad", __version__)
+
+    def before_request(self, event: RequestEvent) -> None:
+        attributes = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "url.template": event.path,
+            "http.request.body.size": event.bytes_sent,
+        }
+        if event.retries:
+            attributes["http.request.resend_count"] = event.retries
+        event.context["span"] = self.tracer.start_span(
+            f"{event.method} {event.path}", kind=trace.SpanKind.CLIENT, attributes=attributes
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        span = event.context.pop("span", None)
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", event.status)
+        if event.bytes_received is not None:
+            span.set_attribute("http.response.body.size", event.bytes_received)
+        if event.status >= 400:
+            span.set_attribute("error.type", str(event.status))
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end()
+
+    def on_error(self, event: RequestEvent) -> None:
+        span = event.context.pop("span", None)
+        if span is None:
+            return
+        error = event.error.__cause__ or event.error
+        span.set_attribute("error.type", type(error).__qualname__)
+        span.record_exception(error)
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(event.error)))
+        span.end()
+
+
+__all__ = ["Hook", "OpenTelemetryHook", "PrometheusHook", "RequestEvent", "path_template"]
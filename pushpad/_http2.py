@@ -0,0 +1,103 @@
+"""HTTP/2 transport for the sync client, backed by ``httpx``."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Optional
+
+from ._transport import Transport, TransportError, TransportTimeout
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - depends on the environment
+    h2 = None
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+
+class HTTP2Transport(Transport):
+    """Transport sending the requests over HTTP/2 with an ``httpx.Client``.
+
+    Requests made at the same time by different threads are multiplexed over a
+    single connection per host, instead of taking one connection each from the
+    pool. Extra ``options`` are passed to ``httpx.Client`` (e.g. ``http1=False``
+    to use HTTP/2 without TLS).
+    """
+
+    def __init__(self, *, max_connections: int = DEFAULT_MAX_CONNECTIONS, **options: Any) -> None:
+        if httpx is None or h2 is None:
+            raise ImportError("HTTP/2 requires httpx and h2: pip install pushpad[http2]")
+        options.setdefault("limits", httpx.Limits(max_connections=max_connections))
+        self._client = httpx.Client(http2=True, **options)
+        self.headers = self._client.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> "HTTP2Response":
+        connect, read = timeout
+        try:
+            request = self._client.build_request(
+                method,
+                url,
+                params=params,
+                content=content,
+                headers=headers,
+                timeout=httpx.Timeout(read, connect=connect),
+            )
+            response = self._client.send(request, stream=stream)
+        except httpx.HTTPError as exc:
+            raise _transport_error(exc) from exc
+        return HTTP2Response(response)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class HTTP2Response:
+    """``httpx.Response`` exposing the attributes of ``requests.Response`` used by the client."""
+
+    def __init__(self, response: Any) -> None:
+        self.raw = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.reason = response.reason_phrase
+        self.http_version = response.http_version
+
+    @property
+    def content(self) -> bytes:
+        try:
+            return self.raw.read()
+        except httpx.HTTPError as exc:
+            raise _transport_error(exc) from exc
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.raw.encoding or "utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        try:
+            yield from self.raw.iter_bytes(chunk_size)
+        except httpx.HTTPError as exc:
+            raise _transport_error(exc) from exc
+
+    def close(self) -> None:
+        self.raw.close()
+
+
+def _transport_error(exc: Exception) -> TransportError:
+    return TransportError(str(exc), connect=isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout)))
+
+
+__all__ = ["HTTP2Transport", "HTTP2Response"]
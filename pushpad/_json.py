@@ -0,0 +1,77 @@
+"""JSON codecs used to encode the request payloads and decode the responses."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the environment
+    ujson = None
+
+
+class JSONCodec:
+    """Encode payloads to JSON bytes and decode JSON bytes, with the standard library.
+
+    Subclass it, or pass any object with the same ``dumps`` and ``loads`` methods
+    as ``json_codec`` to the clients, to use a different parser. ``loads`` must
+    raise :class:`ValueError` on invalid input.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson``, which reads and writes bytes directly."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """Codec backed by ``ujson``."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        if ujson is None:
+            raise ImportError("UjsonCodec requires ujson: pip install ujson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return ujson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """Return the fastest codec available: orjson, then ujson, then the standard library."""
+    if orjson is not None:
+        return OrjsonCodec()
+    if ujson is not None:
+        return UjsonCodec()
+    return JSONCodec()
+
+
+__all__ = ["JSONCodec", "OrjsonCodec", "UjsonCodec", "default_codec"]
@@ -0,0 +1,26 @@
+"""Helpers for walking paginated list endpoints."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def total_count(response: Any) -> Optional[int]:
+    """Return the value of the ``X-Total-Count`` header, if the API sent it."""
+
+    total = response.headers.get(TOTAL_COUNT_HEADER)
+    return int(total) if total is not None else None
+
+
+def is_last_page(response: Any, count: int, fetched: int) -> bool:
+    """Tell whether a page of ``count`` items is the last one, given the number of items fetched so far."""
+
+    if not count:
+        return True
+    total = total_count(response)
+    return total is not None and fetched >= total
+
+
+__all__ = ["TOTAL_COUNT_HEADER", "total_count", "is_last_page"]
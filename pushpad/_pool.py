@@ -0,0 +1,70 @@
+"""Connection pool configuration and statistics for the ``requests`` session."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@dataclass
+class PoolStats:
+    """Usage of the connection pool kept for one host.
+
+    ``connections_created`` greater than ``maxsize`` means that some connections
+    could not be put back into a full pool and were discarded: increase
+    ``pool_maxsize`` (or enable ``pool_block``) in that case.
+    """
+
+    scheme: str
+    host: str
+    port: int | None
+    maxsize: int
+    idle: int
+    connections_created: int
+    requests: int
+
+
+def mount_pool(session: Any, *, pool_connections: int, pool_maxsize: int, pool_block: bool) -> None:
+    """Replace the HTTP(S) adapters of ``session`` with adapters using the given pool settings."""
+
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix,
+            HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block),
+        )
+
+
+def collect_pool_stats(session: Any) -> list[PoolStats]:
+    """Return the statistics of the connection pools opened so far by ``session``."""
+
+    stats = []
+    for adapter in getattr(session, "adapters", {}).values():
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:  # pragma: no cover - evicted by another thread
+                continue
+            queued = list(pool.pool.queue) if pool.pool is not None else []
+            stats.append(
+                PoolStats(
+                    scheme=pool.scheme,
+                    host=pool.host,
+                    port=pool.port,
+                    maxsize=pool.pool.maxsize if pool.pool is not None else 0,
+                    idle=sum(1 for conn in queued if conn is not None),
+                    connections_created=pool.num_connections,
+                    requests=pool.num_requests,
+                )
+            )
+    return stats
+
+
+__all__ = ["PoolStats", "mount_pool", "collect_pool_stats", "DEFAULT_POOL_CONNECTIONS", "DEFAULT_POOL_MAXSIZE"]
@@ -0,0 +1,116 @@
+"""Client-side rate limiting of the API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional
+
+REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+
+# Values of the reset header above this are epoch timestamps, not seconds.
+_EPOCH_THRESHOLD = 10**9
+
+
+class RateLimiter:
+    """Token bucket that spaces out the requests sent by one or more clients.
+
+    The bucket holds up to ``burst`` tokens (``rate`` rounded up by default) and
+    refills at ``rate`` tokens per second; each request takes one token and
+    waits for it if the bucket is empty. The same instance can be shared by
+    many threads, by asyncio tasks and by several clients.
+
+    When ``adaptive`` is enabled, the rate is lowered to what the API allows
+    according to the ``RateLimit-*``/``X-RateLimit-*`` response headers, if
+    they are present, and no request is sent until the limit window resets
+    once the API reports that no requests are remaining.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        *,
+        adaptive: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._max_rate = rate
+        self._rate = rate
+        self._capacity = burst if burst is not None else math.ceil(rate)
+        if self._capacity < 1:
+            raise ValueError("burst must be at least 1")
+        self._adaptive = adaptive
+        self._clock = clock
+        self._tokens = float(self._capacity)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate, in requests per second."""
+        return self._rate
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before sending the request."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> None:
+        """Block the current thread until a request can be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request can be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping[str, Any]) -> None:
+        """Adjust the rate to the limits advertised by the API in a response."""
+        if not self._adaptive:
+            return
+        remaining = _number(headers, REMAINING_HEADERS)
+        reset = _number(headers, RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+        if reset > _EPOCH_THRESHOLD:
+            reset -= time.time()
+        reset = max(reset, 0.0)
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if reset == 0:
+                self._rate = self._max_rate
+            elif remaining <= 0:
+                self._blocked_until = max(self._blocked_until, now + reset)
+            else:
+                self._rate = min(self._max_rate, remaining / reset)
+
+
+def _number(headers: Mapping[str, Any], names: tuple[str, ...]) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+__all__ = ["RateLimiter"]
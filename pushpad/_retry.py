@@ -0,0 +1,95 @@
+"""Retry policy applied by the clients to failed requests."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Statuses telling that the API rejected the request without processing it.
+UNPROCESSED_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Configure how failed requests are retried.
+
+    Requests using one of ``retry_methods`` are retried on network errors and on
+    ``retry_statuses``, up to ``max_attempts`` attempts in total. The delay
+    between attempts grows exponentially (``backoff_factor * 2 ** (attempt - 1)``,
+    capped at ``max_backoff``) and, with ``jitter``, is picked at random between
+    zero and that value. A ``Retry-After`` header sent by the API takes precedence;
+    if it asks to wait longer than ``max_backoff``, the error is raised instead.
+
+    Creating a notification is not idempotent, so it is never retried unless
+    ``retry_unprocessed_creates`` is enabled. Even then it is retried only when
+    the API surely did not process it: when the connection could not be opened,
+    or when the API answered 429 or 503.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    retry_unprocessed_creates: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        connect_error: bool = False,
+        guarded: bool = False,
+    ) -> bool:
+        """Tell whether the request that failed at ``attempt`` (starting from 1) should be retried."""
+
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() in self.retry_methods:
+            return error is not None or status in self.retry_statuses
+        if guarded and self.retry_unprocessed_creates:
+            return connect_error or status in UNPROCESSED_STATUSES
+        return False
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Return the seconds to wait before the next attempt, or ``None`` to give up."""
+
+        if self.respect_retry_after and retry_after is not None:
+            wait = parse_retry_after(retry_after)
+            if wait is not None:
+                return wait if wait <= self.max_backoff else None
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a ``Retry-After`` header, given either in seconds or as an HTTP date."""
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+__all__ = ["RetryPolicy", "parse_retry_after", "IDEMPOTENT_METHODS", "RETRY_STATUSES", "UNPROCESSED_STATUSES"]
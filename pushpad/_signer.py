@@ -0,0 +1,42 @@
+"""HMAC signatures of the user identifiers."""
+
+from __future__ import annotations
+
+import hmac
+from functools import lru_cache
+from hashlib import sha256
+from typing import Any, Iterable, Iterator
+
+
+class Signer:
+    """Compute the HMAC-SHA256 signatures of user identifiers with a key.
+
+    The keyed HMAC state is prepared once and copied for each signature. The
+    signatures of the last ``cache_size`` identifiers are kept in an LRU cache
+    (``0`` disables it); :meth:`cache_info` reports its hits and misses.
+    """
+
+    def __init__(self, key: str, *, cache_size: int = 1024) -> None:
+        self._mac = hmac.new(key.encode(), digestmod=sha256)
+        self.sign = lru_cache(maxsize=cache_size)(self._sign) if cache_size else self._sign
+
+    def _sign(self, data: str) -> str:
+        mac = self._mac.copy()
+        mac.update(data.encode())
+        return mac.hexdigest()
+
+    def sign_many(self, values: Iterable[str]) -> Iterator[str]:
+        """Yield the signature of each value, without going through the cache."""
+        copy = self._mac.copy
+        for value in values:
+            mac = copy()
+            mac.update(value.encode())
+            yield mac.hexdigest()
+
+    def cache_info(self) -> Any:
+        """Return the ``(hits, misses, maxsize, currsize)`` statistics of the cache."""
+        cache_info = getattr(self.sign, "cache_info", None)
+        return cache_info() if cache_info is not None else None
+
+
+__all__ = ["Signer"]
@@ -0,0 +1,164 @@
+"""Local snapshot of the subscriptions, for incremental syncs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from .types import Subscription
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+# Below the default SQLITE_MAX_VARIABLE_NUMBER of old SQLite versions.
+_MAX_VARIABLES = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (id INTEGER PRIMARY KEY, hash BLOB NOT NULL, run INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+@dataclass
+class SubscriptionChange:
+    """Subscription added, changed or removed since the previous sync.
+
+    ``kind`` is ``"added"``, ``"changed"`` or ``"removed"``; ``subscription``
+    is ``None`` for the removed ones.
+    """
+
+    kind: str
+    id: int
+    subscription: Optional[Subscription] = None
+
+
+def content_hash(item: Mapping[str, Any]) -> bytes:
+    """Hash the fields of a subscription that can change: ``uid``, ``tags`` and ``last_click_at``."""
+    content = [item.get("uid"), sorted(item.get("tags") or ()), item.get("last_click_at")]
+    return hashlib.blake2b(json.dumps(content).encode(), digest_size=16).digest()
+
+
+class SubscriptionSnapshot:
+    """SQLite database with the id and a content hash of each subscription seen by the last sync.
+
+    Each sync walks all the pages and compares them with the snapshot, so that
+    only the subscriptions added, changed or removed since the previous sync
+    are reported. The snapshot is updated and checkpointed one page at a
+    time: when a sync is interrupted, the next one resumes from the page after
+    the last checkpoint, reporting again the changes of the page that was in
+    progress. Use ``":memory:"`` as ``path`` for a snapshot that is not saved.
+
+    A snapshot is bound to the project and filters of its first sync. If
+    subscriptions are created or deleted while a sync is walking the pages,
+    some of them may move to a page already fetched; they are reported as
+    removed and are added back by the next sync.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]] = ":memory:") -> None:
+        self._db = sqlite3.connect(os.fspath(path))
+        self._db.executescript(_SCHEMA)
+        self._run = 0
+
+    def __enter__(self) -> "SubscriptionSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM subscriptions").fetchone()[0]
+
+    def __contains__(self, id: object) -> bool:
+        return self._db.execute("SELECT 1 FROM subscriptions WHERE id = ?", (id,)).fetchone() is not None
+
+    def close(self) -> None:
+        self._db.close()
+
+    @property
+    def resume_page(self) -> Optional[int]:
+        """Page after the last checkpoint of an interrupted sync, or ``None``."""
+        page = self._get("page")
+        return None if page is None else page + 1
+
+    def begin(self, scope: Mapping[str, Any], per_page: int) -> int:
+        """Start or resume a sync and return the first page to fetch."""
+        self._db.rollback()
+        stored = self._get("scope")
+        if stored is None:
+            self._set("scope", dict(scope))
+        elif stored != json.loads(json.dumps(scope)):
+            raise ValueError(f"snapshot was created for {stored}, not for {dict(scope)}")
+        self._run = self._get("run") or 0
+        page = self._get("page")
+        if page is None or self._get("per_page") != per_page:
+            if page is None:
+                self._run += 1
+                self._set("run", self._run)
+            page = 0
+            self._set("page", page)
+            self._set("per_page", per_page)
+        self._db.commit()
+        return page + 1
+
+    def compare(self, items: Iterable[Dict[str, Any]]) -> list[tuple[str, Dict[str, Any]]]:
+        """Record a page of subscriptions and return the kind of change of those added or changed.
+
+        The records are kept only when the page is checkpointed.
+        """
+        items = list(items)
+        hashes = {item["id"]: content_hash(item) for item in items}
+        stored = {}
+        ids = list(hashes)
+        for start in range(0, len(ids), _MAX_VARIABLES):
+            chunk = ids[start : start + _MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._db.execute(f"SELECT id, hash FROM subscriptions WHERE id IN ({placeholders})", chunk)
+            stored.update(rows)
+        self._db.executemany(
+            "INSERT INTO subscriptions (id, hash, run) VALUES (?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET hash = excluded.hash, run = excluded.run",
+            [(id, digest, self._run) for id, digest in hashes.items()],
+        )
+        changes = []
+        for item in items:
+            previous = stored.get(item["id"])
+            if previous is None:
+                changes.append((ADDED, item))
+            elif previous != hashes[item["id"]]:
+                changes.append((CHANGED, item))
+        return changes
+
+    def checkpoint(self, page: int) -> None:
+        """Save the records of the pages up to ``page``."""
+        self._set("page", page)
+        self._db.commit()
+
+    def removed(self) -> list[int]:
+        """Return the subscriptions of the snapshot that the current sync has not seen."""
+        rows = self._db.execute("SELECT id FROM subscriptions WHERE run != ? ORDER BY id", (self._run,))
+        return [id for (id,) in rows]
+
+    def finish(self) -> None:
+        """Forget the removed subscriptions and end the sync."""
+        self._db.execute("DELETE FROM subscriptions WHERE run != ?", (self._run,))
+        self._db.execute("DELETE FROM state WHERE key = 'page'")
+        self._db.commit()
+
+    def rollback(self) -> None:
+        """Discard the records since the last checkpoint."""
+        self._db.rollback()
+
+    def _get(self, key: str) -> Any:
+        row = self._db.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def _set(self, key: str, value: Any) -> None:
+        self._db.execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+
+__all__ = ["ADDED", "CHANGED", "REMOVED", "SubscriptionChange", "SubscriptionSnapshot", "content_hash"]
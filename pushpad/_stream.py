@@ -0,0 +1,98 @@
+"""Incremental parsing of the JSON arrays returned by the list endpoints."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable
+
+# Where an element of the array may end, depending on how it starts: the
+# closing bracket or the last character of a scalar, followed by a separator.
+_OBJECT_END = re.compile(rb"}[ \t\r\n]*[,\]]")
+_ARRAY_END = re.compile(rb"][ \t\r\n]*[,\]]")
+_SCALAR_END = re.compile(rb'["\w][ \t\r\n]*[,\]]')
+
+_NON_WHITESPACE = re.compile(rb"[^ \t\r\n]")
+
+_WHITESPACE = b" \t\r\n"
+
+STREAM_CHUNK_SIZE = 8192
+
+
+class JSONArrayParser:
+    """Split a JSON array into its elements while the body is being received.
+
+    Feed the body in chunks of any size: :meth:`feed` returns the elements that
+    have been completed so far, each decoded with ``loads``. Only the bytes of the
+    element being received are kept in memory. :meth:`close` raises
+    :class:`ValueError` if the body ended before the array was closed.
+
+    An element ends at the first closing bracket (or end of a scalar) followed
+    by a separator where the bytes read so far decode successfully. A complete
+    JSON value is never a prefix of another one that continues with a separator,
+    so a separator inside a string only costs a failed decoding attempt.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any]) -> None:
+        self._loads = loads
+        self._buffer = bytearray()
+        self._pos = 0
+        self._pattern: Any = None
+        self._started = False
+        self._done = False
+        self._count = 0
+
+    def feed(self, data: bytes) -> list[Any]:
+        if self._done:
+            return []
+        buffer = self._buffer
+        buffer += data
+        items: list[Any] = []
+        start = 0
+        if not self._started:
+            first = _NON_WHITESPACE.search(buffer)
+            if first is None:
+                return items
+            if buffer[first.start()] != 0x5B:
+                raise ValueError("response is not a JSON array")
+            self._started = True
+            start = self._pos = first.end()
+        while True:
+            if self._pattern is None:
+                first = _NON_WHITESPACE.search(buffer, start)
+                if first is None:
+                    break
+                char = buffer[first.start()]
+                if char == 0x5D and not self._count:
+                    self._done = True
+                    break
+                self._pattern = {0x7B: _OBJECT_END, 0x5B: _ARRAY_END}.get(char, _SCALAR_END)
+                self._pos = first.start()
+            match = self._pattern.search(buffer, self._pos)
+            if match is None:
+                tail = len(buffer) - len(buffer.rstrip(_WHITESPACE))
+                self._pos = max(self._pos, len(buffer) - tail - 1)
+                break
+            try:
+                item = self._loads(bytes(buffer[start : match.start() + 1]))
+            except ValueError:
+                self._pos = match.start() + 1
+                continue
+            items.append(item)
+            self._count += 1
+            self._pattern = None
+            start = match.end()
+            if buffer[match.end() - 1] == 0x5D:
+                self._done = True
+                break
+        del buffer[:start]
+        self._pos = max(self._pos - start, 0)
+        return items
+
+    def close(self) -> None:
+        if self._done:
+            return
+        if self._started or self._buffer.strip(_WHITESPACE):
+            raise ValueError("incomplete JSON array")
+
+
+__all__ = ["JSONArrayParser", "STREAM_CHUNK_SIZE"]
@@ -0,0 +1,372 @@
+"""Columnar container for large lists of subscriptions."""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+from .types import Subscription
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+Timestamp = Union[datetime, float, int, str]
+
+
+class SubscriptionTable:
+    """Subscriptions stored as one column per field instead of one object each.
+
+    Numbers are kept in :mod:`array` columns (``ids``, ``project_ids`` and
+    ``last_click_ts``, the ``last_click_at`` time as a POSIX timestamp, NaN when
+    missing) and strings in lists. Each distinct tag is stored once in
+    ``tag_names``; the tags of row ``i`` are the codes
+    ``tag_codes[tag_offsets[i]:tag_offsets[i + 1]]``, indexes into ``tag_names``.
+
+    Use :meth:`filter` to select rows by tag, uid or click time, :meth:`tag_counts`
+    to aggregate the tags, and :meth:`to_numpy`/:meth:`to_arrow` to hand the
+    columns to NumPy or Arrow without copying the numeric ones. Once a column has
+    been exported this way the table can no longer grow.
+
+    When NumPy is installed, :meth:`filter` and :meth:`take` work on whole
+    columns with masks and fancy indexing; otherwise they loop over the rows
+    in Python.
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.project_ids = array("q")
+        self.endpoints: list[str] = []
+        self.p256dh: list[Optional[str]] = []
+        self.auth: list[Optional[str]] = []
+        self.uids: list[Optional[str]] = []
+        self.last_click_at: list[Optional[str]] = []
+        self.last_click_ts = array("d")
+        self.created_at: list[str] = []
+        self.tag_names: list[str] = []
+        self.tag_offsets = array("i", [0])
+        self.tag_codes = array("i")
+        self._tag_index: Dict[str, int] = {}
+        self._rows_by_tag: Optional[Dict[int, array]] = None
+        self._rows_by_uid: Optional[Dict[str, list[int]]] = None
+
+    @classmethod
+    def from_api(cls, items: Iterable[Mapping[str, Any]]) -> "SubscriptionTable":
+        """Build a table from subscriptions as returned by the API."""
+        table = cls()
+        table.extend(items)
+        return table
+
+    @classmethod
+    def from_subscriptions(cls, subscriptions: Iterable[Subscription]) -> "SubscriptionTable":
+        """Build a table from :class:`Subscription` objects."""
+        table = cls()
+        for subscription in subscriptions:
+            table._append(
+                subscription.id,
+                subscription.project_id,
+                subscription.endpoint,
+                subscription.p256dh,
+                subscription.auth,
+                subscription.uid,
+                subscription.tags,
+                subscription.last_click_at,
+                subscription.created_at,
+            )
+        return table
+
+    def extend(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """Append subscriptions as returned by the API."""
+        for data in items:
+            self._append(
+                data.get("id"),
+                data.get("project_id"),
+                data.get("endpoint"),
+                data.get("p256dh"),
+                data.get("auth"),
+                data.get("uid"),
+                data.get("tags"),
+                data.get("last_click_at"),
+                data.get("created_at"),
+            )
+
+    def _append(
+        self,
+        id: Optional[int],
+        project_id: Optional[int],
+        endpoint: str,
+        p256dh: Optional[str],
+        auth: Optional[str],
+        uid: Optional[str],
+        tags: Optional[Sequence[str]],
+        last_click_at: Optional[str],
+        created_at: str,
+    ) -> None:
+        self.ids.append(id if id is not None else -1)
+        self.project_ids.append(project_id if project_id is not None else -1)
+        self.endpoints.append(endpoint)
+        self.p256dh.append(p256dh)
+        self.auth.append(auth)
+        self.uids.append(uid)
+        self.last_click_at.append(last_click_at)
+        self.last_click_ts.append(_timestamp(last_click_at) if last_click_at is not None else math.nan)
+        self.created_at.append(created_at)
+        for tag in tags or ():
+            code = self._tag_index.get(tag)
+            if code is None:
+                code = self._tag_index[tag] = len(self.tag_names)
+                self.tag_names.append(sys.intern(tag))
+            self.tag_codes.append(code)
+        self.tag_offsets.append(len(self.tag_codes))
+        self._rows_by_tag = None
+        self._rows_by_uid = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, row: int) -> Subscription:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("row out of range")
+        return Subscription(
+            id=self.ids[row] if self.ids[row] != -1 else None,
+            project_id=self.project_ids[row] if self.project_ids[row] != -1 else None,
+            endpoint=self.endpoints[row],
+            p256dh=self.p256dh[row],
+            auth=self.auth[row],
+            uid=self.uids[row],
+            tags=self.tags(row),
+            last_click_at=self.last_click_at[row],
+            created_at=self.created_at[row],
+        )
+
+    def __iter__(self) -> Iterator[Subscription]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def tags(self, row: int) -> list[str]:
+        """Return the tags of a row."""
+        names = self.tag_names
+        return [names[code] for code in self.tag_codes[self.tag_offsets[row] : self.tag_offsets[row + 1]]]
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Return the number of subscriptions with each tag."""
+        return {self.tag_names[code]: len(rows) for code, rows in self._tag_rows().items()}
+
+    def filter(
+        self,
+        *,
+        tags: Union[str, Iterable[str], None] = None,
+        uids: Union[str, Iterable[str], None] = None,
+        last_click_after: Optional[Timestamp] = None,
+        last_click_before: Optional[Timestamp] = None,
+    ) -> "SubscriptionTable":
+        """Return a table with the rows matching all the given conditions.
+
+        A row matches ``tags`` and ``uids`` when it has any of the given values;
+        chain calls to require several tags. The click time range includes
+        ``last_click_after`` and excludes ``last_click_before``; rows that were
+        never clicked never match it.
+        """
+        if np is not None:
+            return self.take(self._select_numpy(tags, uids, last_click_after, last_click_before))
+        rows: Optional[Iterable[int]] = None
+        if tags is not None:
+            index = self._tag_rows()
+            codes = [self._tag_index[tag] for tag in _as_list(tags) if tag in self._tag_index]
+            rows = _union(index.get(code, ()) for code in codes)
+        if uids is not None:
+            index = self._uid_rows()
+            uid_rows = _union(index.get(uid, ()) for uid in _as_list(uids))
+            rows = uid_rows if rows is None else sorted(set(rows).intersection(uid_rows))
+        if last_click_after is not None or last_click_before is not None:
+            low = _timestamp(last_click_after) if last_click_after is not None else -math.inf
+            high = _timestamp(last_click_before) if last_click_before is not None else math.inf
+            clicks = self.last_click_ts
+            candidates = range(len(self)) if rows is None else rows
+            rows = [row for row in candidates if low <= clicks[row] < high]
+        return self.take(range(len(self)) if rows is None else rows)
+
+    def _select_numpy(
+        self,
+        tags: Union[str, Iterable[str], None],
+        uids: Union[str, Iterable[str], None],
+        last_click_after: Optional[Timestamp],
+        last_click_before: Optional[Timestamp],
+    ) -> Any:
+        """Return the indexes of the rows matching the conditions of :meth:`filter`, computed with masks."""
+        mask = np.ones(len(self), dtype=bool)
+        if tags is not None:
+            codes = [self._tag_index[tag] for tag in _as_list(tags) if tag in self._tag_index]
+            hits = np.flatnonzero(np.isin(_column(self.tag_codes, np.int32), codes))
+            # The row of each matching tag is found from the offsets of the rows' tags.
+            tagged = np.zeros(len(self), dtype=bool)
+            tagged[np.searchsorted(_column(self.tag_offsets, np.int32), hits, side="right") - 1] = True
+            mask &= tagged
+        if uids is not None:
+            index = self._uid_rows()
+            named = np.zeros(len(self), dtype=bool)
+            for uid in _as_list(uids):
+                named[index.get(uid, [])] = True
+            mask &= named
+        if last_click_after is not None or last_click_before is not None:
+            clicks = _column(self.last_click_ts, np.float64)
+            if last_click_after is not None:
+                mask &= clicks >= _timestamp(last_click_after)
+            if last_click_before is not None:
+                mask &= clicks < _timestamp(last_click_before)
+        return np.flatnonzero(mask)
+
+    def take(self, rows: Iterable[int]) -> "SubscriptionTable":
+        """Return a table with the given rows, in the given order."""
+        table = SubscriptionTable()
+        table.tag_names = list(self.tag_names)
+        table._tag_index = dict(self._tag_index)
+        if np is not None:
+            self._take_numpy(table, np.asarray(rows if isinstance(rows, Sequence) else list(rows), dtype=np.intp))
+            return table
+        for row in rows:
+            if row < 0:
+                row += len(self)
+            table.ids.append(self.ids[row])
+            table.project_ids.append(self.project_ids[row])
+            table.endpoints.append(self.endpoints[row])
+            table.p256dh.append(self.p256dh[row])
+            table.auth.append(self.auth[row])
+            table.uids.append(self.uids[row])
+            table.last_click_at.append(self.last_click_at[row])
+            table.last_click_ts.append(self.last_click_ts[row])
+            table.created_at.append(self.created_at[row])
+            table.tag_codes.extend(self.tag_codes[self.tag_offsets[row] : self.tag_offsets[row + 1]])
+            table.tag_offsets.append(len(table.tag_codes))
+        return table
+
+    def _take_numpy(self, table: "SubscriptionTable", rows: Any) -> None:
+        if len(rows) and (rows.min() < -len(self) or rows.max() >= len(self)):
+            raise IndexError("row out of range")
+        rows = rows % max(len(self), 1)
+        table.ids.frombytes(_column(self.ids, np.int64)[rows].tobytes())
+        table.project_ids.frombytes(_column(self.project_ids, np.int64)[rows].tobytes())
+        table.last_click_ts.frombytes(_column(self.last_click_ts, np.float64)[rows].tobytes())
+        # Converting the string columns to object arrays would cost more than picking their rows.
+        picked = rows.tolist()
+        for name in ("endpoints", "p256dh", "auth", "uids", "last_click_at", "created_at"):
+            setattr(table, name, list(map(getattr(self, name).__getitem__, picked)))
+
+        offsets = _column(self.tag_offsets, np.int32)
+        starts = offsets[rows]
+        counts = offsets[rows + 1] - starts
+        new_offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+        np.cumsum(counts, out=new_offsets[1:])
+        # Position in tag_codes of each tag kept: the start of its row, plus its rank in the row.
+        positions = np.repeat(starts - new_offsets[:-1], counts) + np.arange(new_offsets[-1])
+        table.tag_codes.frombytes(_column(self.tag_codes, np.int32)[positions].tobytes())
+        table.tag_offsets = array("i", new_offsets.tobytes())
+
+    def _tag_rows(self) -> Dict[int, array]:
+        if self._rows_by_tag is None:
+            index: Dict[int, array] = {}
+            offsets = self.tag_offsets
+            codes = self.tag_codes
+            for row in range(len(self)):
+                for code in codes[offsets[row] : offsets[row + 1]]:
+                    rows = index.get(code)
+                    if rows is None:
+                        rows = index[code] = array("q")
+                    rows.append(row)
+            self._rows_by_tag = index
+        return self._rows_by_tag
+
+    def _uid_rows(self) -> Dict[str, list[int]]:
+        if self._rows_by_uid is None:
+            index: Dict[str, list[int]] = {}
+            for row, uid in enumerate(self.uids):
+                if uid is not None:
+                    index.setdefault(uid, []).append(row)
+            self._rows_by_uid = index
+        return self._rows_by_uid
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Return the columns as NumPy arrays; numeric columns share memory with the table."""
+        if np is None:  # pragma: no cover - depends on the environment
+            raise ImportError("to_numpy requires numpy: pip install numpy")
+        return {
+            "id": np.frombuffer(self.ids, dtype=np.int64),
+            "project_id": np.frombuffer(self.project_ids, dtype=np.int64),
+            "endpoint": np.array(self.endpoints, dtype=object),
+            "p256dh": np.array(self.p256dh, dtype=object),
+            "auth": np.array(self.auth, dtype=object),
+            "uid": np.array(self.uids, dtype=object),
+            "last_click_at": np.array(self.last_click_at, dtype=object),
+            "last_click_ts": np.frombuffer(self.last_click_ts, dtype=np.float64),
+            "created_at": np.array(self.created_at, dtype=object),
+            "tag_names": np.array(self.tag_names, dtype=object),
+            "tag_offsets": np.frombuffer(self.tag_offsets, dtype=np.int32),
+            "tag_codes": np.frombuffer(self.tag_codes, dtype=np.int32),
+        }
+
+    def to_arrow(self) -> Any:
+        """Return a ``pyarrow.Table``; numeric columns and tag codes share memory with the table.
+
+        Tags become a list of dictionary-encoded strings.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ImportError("to_arrow requires pyarrow: pip install pyarrow") from exc
+
+        def column(values: array, type: Any) -> Any:
+            return pa.Array.from_buffers(type, len(values), [None, pa.py_buffer(values)])
+
+        tag_values = pa.DictionaryArray.from_arrays(
+            column(self.tag_codes, pa.int32()),
+            pa.array(self.tag_names, pa.string()),
+        )
+        return pa.table(
+            {
+                "id": column(self.ids, pa.int64()),
+                "project_id": column(self.project_ids, pa.int64()),
+                "endpoint": pa.array(self.endpoints, pa.string()),
+                "p256dh": pa.array(self.p256dh, pa.string()),
+                "auth": pa.array(self.auth, pa.string()),
+                "uid": pa.array(self.uids, pa.string()),
+                "tags": pa.ListArray.from_arrays(column(self.tag_offsets, pa.int32()), tag_values),
+                "last_click_at": pa.array(self.last_click_at, pa.string()),
+                "last_click_ts": column(self.last_click_ts, pa.float64()),
+                "created_at": pa.array(self.created_at, pa.string()),
+            }
+        )
+
+
+def _timestamp(value: Timestamp) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _column(values: array, dtype: Any) -> Any:
+    """Return a NumPy view of an array column, released as soon as it is no longer used."""
+    return np.frombuffer(values, dtype=dtype) if len(values) else np.empty(0, dtype=dtype)
+
+
+def _as_list(value: Union[str, Iterable[str]]) -> list[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _union(groups: Iterable[Iterable[int]]) -> list[int]:
+    rows: set[int] = set()
+    for group in groups:
+        rows.update(group)
+    return sorted(rows)
+
+
+__all__ = ["SubscriptionTable"]
@@ -0,0 +1,51 @@
+"""Timeouts applied to the API requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Timeouts, in seconds, for a call to the API.
+
+    ``connect`` and ``read`` limit each attempt: the time to open a connection
+    and the time to wait for data from the server. ``total`` is a deadline for
+    the whole call, including retries and the waits between them: ``read`` is
+    shortened to the time left before the deadline, and once it expires, or
+    leaves no time for the next retry, no further attempt is made and
+    :class:`DeadlineExceededError` is raised, chained from the last network
+    error. An error response of the API is raised as :class:`PushpadAPIError`
+    even if the deadline prevents retrying it. ``None`` means no limit.
+    """
+
+    connect: Optional[float] = None
+    read: Optional[float] = None
+    total: Optional[float] = None
+
+    @classmethod
+    def coerce(cls, value: "TimeoutTypes") -> "Timeout":
+        """Build a :class:`Timeout` from a number of seconds or a ``(connect, read)`` tuple."""
+        if isinstance(value, Timeout):
+            return value
+        if isinstance(value, tuple):
+            connect, read = value
+            return cls(connect=connect, read=read)
+        return cls(connect=value, read=value)
+
+    def for_attempt(self, remaining: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+        """Return the ``(connect, read)`` timeouts of an attempt, given the time left before the deadline."""
+        if remaining is None:
+            return self.connect, self.read
+        return _min(self.connect, remaining), _min(self.read, remaining)
+
+
+TimeoutTypes = Union[float, Tuple[Optional[float], Optional[float]], Timeout]
+
+
+def _min(value: Optional[float], limit: float) -> float:
+    return limit if value is None else min(value, limit)
+
+
+__all__ = ["Timeout", "TimeoutTypes"]
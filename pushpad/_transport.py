@@ -0,0 +1,434 @@
+"""Transports sending the HTTP requests of the clients."""
+
+from __future__ import annotations
+
+import abc
+import inspect
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, MutableMapping, Optional, Tuple
+
+import requests
+from requests import RequestException
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import NewConnectionError
+
+from ._pool import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, PoolStats, collect_pool_stats, mount_pool
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None
+
+TransportTimeout = Tuple[Optional[float], Optional[float]]
+
+
+class TransportError(Exception):
+    """Raised by a transport when no response could be received.
+
+    ``connect`` tells that the connection could not be opened, so the request
+    surely did not reach the server. The error of the underlying HTTP library,
+    if any, is chained as ``__cause__``.
+    """
+
+    def __init__(self, message: str, *, connect: bool = False) -> None:
+        super().__init__(message)
+        self.connect = connect
+
+
+class Transport(abc.ABC):
+    """Interface of the transports used by :class:`Pushpad` to send the requests.
+
+    ``request`` sends a request with the default ``headers`` of the transport
+    plus the given ones, and ``timeout`` as a ``(connect, read)`` tuple. It
+    returns an object with the same ``status_code``, ``headers``, ``reason``,
+    ``content``, ``text``, ``iter_content`` and ``close`` attributes as
+    ``requests.Response``, whose body is read only when accessed if ``stream``
+    is true. Errors preventing a response must be raised as
+    :class:`TransportError`, also from :meth:`iter_bytes`. Subclasses must
+    implement ``request``; the other methods have defaults.
+    """
+
+    headers: MutableMapping[str, str]
+
+    @abc.abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> Any:
+        """Send a request and return its response."""
+
+    def iter_bytes(self, response: Any, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the body of a streamed response as it is received."""
+        return response.iter_content(chunk_size)
+
+    def connection_reused(self, response: Any) -> Optional[bool]:
+        """Tell whether a response was received over a connection already open, or ``None`` if unknown."""
+        return None
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Return the usage statistics of the connection pools, when the transport keeps any."""
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncTransport(abc.ABC):
+    """Interface of the transports used by :class:`AsyncPushpad` to send the requests.
+
+    Like :class:`Transport`, but ``request`` is a coroutine returning an object
+    with the same ``status_code``, ``headers``, ``reason_phrase``, ``content``,
+    ``text``, ``aread``, ``aiter_bytes`` and ``aclose`` attributes as
+    ``httpx.Response``.
+    """
+
+    headers: MutableMapping[str, str]
+
+    @abc.abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> Any:
+        """Send a request and return its response."""
+
+    def aiter_bytes(self, response: Any) -> AsyncIterator[bytes]:
+        """Yield the body of a streamed response as it is received."""
+        return response.aiter_bytes()
+
+    def connection_reused(self, response: Any) -> Optional[bool]:
+        """Tell whether a response was received over a connection already open, or ``None`` if unknown."""
+        return None
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """Default transport of :class:`Pushpad`, sending the requests with a ``requests.Session``.
+
+    Without a ``session``, one is created with a connection pool configured by
+    ``pool_connections``, ``pool_maxsize`` and ``pool_block``; ``keep_alive=False``
+    closes the connections after each request.
+    """
+
+    def __init__(
+        self,
+        session: Optional[Any] = None,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        if session is None:
+            session = requests.Session()
+            mount_pool(
+                session,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+        self.session = session
+        self.headers = session.headers
+        self._connections_seen: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> Any:
+        try:
+            return self.session.request(
+                method,
+                url,
+                params=params,
+                data=content,
+                headers=headers,
+                timeout=timeout,
+                stream=stream,
+            )
+        except RequestException as exc:
+            raise TransportError(str(exc), connect=self._is_connect_error(exc)) from exc
+
+    def iter_bytes(self, response: Any, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(chunk_size)
+        except RequestException as exc:
+            raise TransportError(str(exc)) from exc
+
+    @staticmethod
+    def _is_connect_error(exc: BaseException) -> bool:
+        if isinstance(exc, requests.ConnectTimeout):
+            return True
+        reason = getattr(exc.args[0], "reason", None) if exc.args else None
+        return isinstance(exc, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def connection_reused(self, response: Any) -> Optional[bool]:
+        # A connection was reused if the pool has not opened any since the
+        # previous response taken from it (approximate with many threads).
+        pool = getattr(getattr(response, "raw", None), "_pool", None)
+        if pool is None:
+            return None
+        with self._lock:
+            seen = self._connections_seen.get(pool)
+            self._connections_seen[pool] = pool.num_connections
+        return seen is not None and seen == pool.num_connections
+
+    def pool_stats(self) -> list[PoolStats]:
+        return collect_pool_stats(self.session)
+
+    def close(self) -> None:
+        close = getattr(self.session, "close", None)
+        if callable(close):
+            close()
+
+
+class AsyncHTTPXTransport(AsyncTransport):
+    """Default transport of :class:`AsyncPushpad`, sending the requests with an ``httpx.AsyncClient``.
+
+    Without a ``client``, one is created that opens up to ``pool_maxsize``
+    connections and, when ``keep_alive`` is enabled, keeps them open for
+    ``keepalive_expiry`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        *,
+        pool_maxsize: int = 100,
+        keep_alive: bool = True,
+        keepalive_expiry: float = 5.0,
+    ) -> None:
+        if client is None:
+            if httpx is None:
+                raise ImportError("AsyncPushpad requires httpx: pip install pushpad[async]")
+            limits = httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+                keepalive_expiry=keepalive_expiry,
+            )
+            client = httpx.AsyncClient(limits=limits)
+        self.client = client
+        self.headers = client.headers
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> Any:
+        connect, read = timeout
+        options = {
+            "params": params,
+            "content": content,
+            "headers": headers,
+            "timeout": httpx.Timeout(read, connect=connect) if httpx is not None else timeout,
+        }
+        try:
+            if stream:
+                return await self.client.send(self.client.build_request(method, url, **options), stream=True)
+            return await self.client.request(method, url, **options)
+        except _HTTPX_ERRORS as exc:
+            raise TransportError(str(exc), connect=_is_httpx_connect_error(exc)) from exc
+
+    async def aiter_bytes(self, response: Any) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        except _HTTPX_ERRORS as exc:
+            raise TransportError(str(exc)) from exc
+
+    async def aclose(self) -> None:
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if callable(close):
+            await close()
+
+
+_HTTPX_ERRORS: tuple[type[BaseException], ...] = (httpx.HTTPError,) if httpx is not None else ()
+
+
+def _is_httpx_connect_error(exc: BaseException) -> bool:
+    return httpx is not None and isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+@dataclass
+class TransportRequest:
+    """Request received by a :class:`MemoryTransport`."""
+
+    method: str
+    url: str
+    params: Optional[Dict[str, Any]]
+    content: Optional[bytes]
+    headers: Dict[str, str]
+    timeout: TransportTimeout
+    stream: bool
+
+    def json(self) -> Any:
+        """Decode the JSON body of the request."""
+        return json.loads(self.content) if self.content else None
+
+
+class MemoryResponse:
+    """Response returned by the handler of a :class:`MemoryTransport` or :class:`AsyncMemoryTransport`.
+
+    The body is given as ``content`` bytes or encoded from ``json``. It has the
+    attributes of both ``requests.Response`` and ``httpx.Response`` used by the
+    clients.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        *,
+        json: Any = None,
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.content = content if json is None else _dumps(json)
+        self.headers: MutableMapping[str, str] = CaseInsensitiveDict(headers or {})
+        if json is not None:
+            self.headers.setdefault("Content-Type", "application/json")
+        try:
+            default_reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            default_reason = ""
+        self.reason = self.reason_phrase = reason if reason is not None else default_reason
+        self.closed = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        size = chunk_size or len(self.content) or 1
+        for start in range(0, len(self.content), size):
+            yield self.content[start : start + size]
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def aread(self) -> bytes:
+        return self.content
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        for chunk in self.iter_content():
+            yield chunk
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+Handler = Callable[[TransportRequest], Any]
+
+
+class MemoryTransport(Transport):
+    """Transport that answers the requests in memory, for tests and benchmarks.
+
+    ``handler`` receives each :class:`TransportRequest` and returns a
+    :class:`MemoryResponse`, or raises :class:`TransportError` to simulate a
+    network failure. The requests received are kept in ``requests``.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.headers: MutableMapping[str, str] = CaseInsensitiveDict()
+        self.requests: list[TransportRequest] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> MemoryResponse:
+        request = TransportRequest(method, url, params, content, {**self.headers, **(headers or {})}, timeout, stream)
+        self.requests.append(request)
+        return self.handler(request)
+
+
+class AsyncMemoryTransport(AsyncTransport):
+    """Asyncio version of :class:`MemoryTransport`; ``handler`` may also be a coroutine function."""
+
+    def __init__(self, handler: Handler) -> None:
+        self._transport = MemoryTransport(handler)
+        self.headers = self._transport.headers
+        self.requests = self._transport.requests
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TransportTimeout = (None, None),
+        stream: bool = False,
+    ) -> MemoryResponse:
+        response = self._transport.request(
+            method,
+            url,
+            params=params,
+            content=content,
+            headers=headers,
+            timeout=timeout,
+            stream=stream,
+        )
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+__all__ = [
+    "AsyncHTTPXTransport",
+    "AsyncMemoryTransport",
+    "AsyncTransport",
+    "MemoryResponse",
+    "MemoryTransport",
+    "RequestsTransport",
+    "Transport",
+    "TransportError",
+    "TransportRequest",
+]
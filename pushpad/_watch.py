@@ -0,0 +1,384 @@
+"""Polling of the delivery stats of notifications on an adaptive schedule."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional
+
+from ._ratelimit import RateLimiter
+from ._timeout import TimeoutTypes
+from .exceptions import PushpadAPIError, PushpadError
+from .types import Notification
+
+STATS_FIELDS = ("successfully_sent_count", "opened_count", "scheduled_count", "cancelled")
+
+DEFAULT_MAX_AGE = 3 * 24 * 3600
+
+
+@dataclass
+class NotificationChange:
+    """New stats of a watched notification.
+
+    ``previous`` is ``None`` for the first refresh of the notification, and
+    ``changed`` lists the fields of :data:`STATS_FIELDS` that changed since.
+    ``finished`` tells that the notification is no longer watched, because
+    it was cancelled or is older than ``max_age``.
+    """
+
+    notification: Notification
+    previous: Optional[Notification]
+    changed: tuple[str, ...]
+    finished: bool = False
+
+    @property
+    def id(self) -> int:
+        return self.notification.id
+
+
+class WatchSchedule:
+    """Decide when each watched notification is refreshed next.
+
+    A notification is refreshed every ``min_interval`` seconds while it is
+    new; the interval then grows with its age (by ``age_factor`` seconds per
+    second of age) up to ``max_interval``. Each refresh that finds the stats
+    unchanged, or that fails, multiplies the interval by ``backoff`` (up to
+    ``max_interval``) and a change brings it back to the interval for its age.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+        age_factor: float,
+        max_age: Optional[float],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and not greater than max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.age_factor = age_factor
+        self.max_age = max_age
+        self._clock = clock
+        self._intervals: Dict[int, float] = {}
+        self._notifications: Dict[int, Notification] = {}
+        self._queue: list[tuple[float, int, int]] = []
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, id: int) -> None:
+        """Watch a notification, refreshing it as soon as possible."""
+        with self._lock:
+            if id not in self._intervals:
+                self._intervals[id] = self.min_interval
+                self._push(id, self._clock())
+
+    def remove(self, id: int) -> None:
+        with self._lock:
+            self._intervals.pop(id, None)
+            self._notifications.pop(id, None)
+
+    def due(self, limit: int) -> list[int]:
+        """Return up to ``limit`` notifications to refresh now, the most overdue first."""
+        now = self._clock()
+        ids = []
+        with self._lock:
+            while self._queue and len(ids) < limit and self._queue[0][0] <= now:
+                _, _, id = heapq.heappop(self._queue)
+                if id in self._intervals:
+                    ids.append(id)
+        return ids
+
+    def wait_time(self) -> Optional[float]:
+        """Return the seconds until the next refresh, or ``None`` when nothing is watched."""
+        with self._lock:
+            while self._queue and self._queue[0][2] not in self._intervals:
+                heapq.heappop(self._queue)
+            if not self._queue:
+                return None
+            return max(0.0, self._queue[0][0] - self._clock())
+
+    def record(self, id: int, result: Notification | PushpadError) -> Optional[NotificationChange]:
+        """Schedule the next refresh after ``result`` and return the change of stats, if any."""
+        with self._lock:
+            if id not in self._intervals:
+                return None
+            if isinstance(result, PushpadError):
+                if isinstance(result, PushpadAPIError) and result.status_code == 404:
+                    del self._intervals[id]
+                    self._notifications.pop(id, None)
+                else:
+                    self._reschedule(id, self._intervals[id] * self.backoff)
+                return None
+
+            previous = self._notifications.get(id)
+            self._notifications[id] = result
+            if previous is None:
+                changed = STATS_FIELDS
+            else:
+                changed = tuple(name for name in STATS_FIELDS if getattr(result, name) != getattr(previous, name))
+            age = _age(result)
+            if result.cancelled or (self.max_age is not None and age is not None and age > self.max_age):
+                del self._intervals[id]
+                del self._notifications[id]
+                return NotificationChange(result, previous, changed, finished=True)
+
+            base = self.min_interval if age is None else max(self.min_interval, age * self.age_factor)
+            interval = base if changed else max(base, self._intervals[id] * self.backoff)
+            self._reschedule(id, interval)
+        return NotificationChange(result, previous, changed) if changed else None
+
+    def _reschedule(self, id: int, interval: float) -> None:
+        interval = min(interval, self.max_interval)
+        self._intervals[id] = interval
+        self._push(id, self._clock() + interval)
+
+    def _push(self, id: int, when: float) -> None:
+        self._counter += 1
+        heapq.heappush(self._queue, (when, self._counter, id))
+
+
+def _age(notification: Notification) -> Optional[float]:
+    """Return the seconds elapsed since a notification was created, if known."""
+    if not notification.created_at:
+        return None
+    try:
+        created = datetime.fromisoformat(notification.created_at.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return max(0.0, (datetime.now(timezone.utc) - created).total_seconds())
+
+
+class _BaseWatcher:
+    def __init__(
+        self,
+        resource: Any,
+        ids: Iterable[int],
+        *,
+        on_change: Optional[Callable[[NotificationChange], Any]] = None,
+        on_error: Optional[Callable[[int, PushpadError], Any]] = None,
+        budget: float | RateLimiter = 1.0,
+        concurrency: int = 4,
+        min_interval: float = 10.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        age_factor: float = 0.01,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        timeout: Optional[TimeoutTypes] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._resource = resource
+        self._on_change = on_change
+        self._on_error = on_error
+        self._concurrency = concurrency
+        self._timeout = timeout
+        self._budget = budget if isinstance(budget, RateLimiter) else RateLimiter(budget, adaptive=False)
+        self.schedule = WatchSchedule(
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            age_factor=age_factor,
+            max_age=max_age,
+        )
+        for id in ids:
+            self.schedule.add(id)
+
+    def add(self, id: int) -> None:
+        """Start watching another notification."""
+        self.schedule.add(id)
+
+    def remove(self, id: int) -> None:
+        """Stop watching a notification."""
+        self.schedule.remove(id)
+
+    def _path(self, id: int) -> str:
+        return f"/notifications/{id}"
+
+    def _record(self, id: int, result: Any) -> Optional[NotificationChange]:
+        if isinstance(result, PushpadError) and self._on_error is not None:
+            self._on_error(id, result)
+        change = self.schedule.record(id, result)
+        if change is not None and self._on_change is not None:
+            self._on_change(change)
+        return change
+
+
+class NotificationWatcher(_BaseWatcher):
+    """Refresh the stats of a set of notifications and report their changes.
+
+    Iterating the watcher yields a :class:`NotificationChange` each time the
+    stats of a notification change (and calls ``on_change``), until
+    :meth:`stop` is called or no notification is left to watch; :meth:`run`
+    does the same without yielding. Up to ``concurrency`` refreshes run at a
+    time, in a pool of threads kept for the life of the watcher, and a
+    refresh starts as soon as a notification is due and a thread is free,
+    sending at most ``budget`` requests per second in total (``budget`` can
+    also be a :class:`RateLimiter` shared by several watchers). See
+    :class:`WatchSchedule` for ``min_interval``, ``max_interval``, ``backoff``
+    and ``age_factor``.
+    Failed refreshes are passed to ``on_error`` and retried later; the
+    notifications that are not found are no longer watched.
+
+    The notifications are always requested from the API, never taken from the
+    client :class:`ResponseCache`: a cached object would hide the changes of
+    the stats until it expires.
+
+    The threads are released by :meth:`stop`, also called when the watcher
+    is used as a context manager.
+    """
+
+    def __init__(self, resource: Any, ids: Iterable[int], **options: Any) -> None:
+        super().__init__(resource, ids, **options)
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="pushpad-watch")
+        # Refreshes are reported here when they finish, and None by stop() to wake the iteration.
+        self._done: queue.SimpleQueue[Optional[tuple[int, Future]]] = queue.SimpleQueue()
+        self._in_flight = 0
+
+    def __enter__(self) -> "NotificationWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.stop()
+
+    def __iter__(self) -> Iterator[NotificationChange]:
+        while not self._stopped.is_set():
+            for id in self.schedule.due(self._concurrency - self._in_flight):
+                if not self._submit(id):
+                    return
+            wait = None
+            if self._in_flight < self._concurrency:
+                wait = self.schedule.wait_time()
+                if wait is None and not self._in_flight:
+                    return
+            try:
+                finished = self._done.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if finished is None:
+                continue
+            self._in_flight -= 1
+            id, future = finished
+            change = self._record(id, future.result())
+            if change is not None:
+                yield change
+
+    def run(self) -> None:
+        """Refresh the notifications until :meth:`stop` is called or none is left to watch."""
+        for _ in self:
+            pass
+
+    def stop(self) -> None:
+        """Stop the iteration and release the threads; can be called from any thread.
+
+        The refreshes in progress are completed but no longer reported.
+        """
+        with self._lock:
+            self._stopped.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._done.put(None)
+
+    def _submit(self, id: int) -> bool:
+        with self._lock:
+            if self._stopped.is_set():
+                return False
+            future = self._executor.submit(self._fetch, id)
+        self._in_flight += 1
+        future.add_done_callback(lambda future: self._done.put((id, future)))
+        return True
+
+    def _fetch(self, id: int) -> Notification | PushpadError:
+        self._budget.acquire()
+        client = self._resource._client
+        try:
+            # Not through get(), which could return an object kept by the ResponseCache.
+            response = client._request("GET", self._path(id), timeout=self._resource._timeout(self._timeout))
+        except PushpadError as exc:
+            return exc
+        return self._resource._model(Notification).from_api(response)
+
+
+class AsyncNotificationWatcher(_BaseWatcher):
+    """Asyncio version of :class:`NotificationWatcher`, iterated with ``async for``.
+
+    The refreshes still running when the iteration ends are cancelled.
+    """
+
+    def __init__(self, resource: Any, ids: Iterable[int], **options: Any) -> None:
+        super().__init__(resource, ids, **options)
+        self._stopped = asyncio.Event()
+
+    async def __aiter__(self) -> AsyncIterator[NotificationChange]:
+        tasks: Dict[asyncio.Future, int] = {}
+        try:
+            while not self._stopped.is_set():
+                for id in self.schedule.due(self._concurrency - len(tasks)):
+                    tasks[asyncio.ensure_future(self._fetch(id))] = id
+                wait = None
+                if len(tasks) < self._concurrency:
+                    wait = self.schedule.wait_time()
+                    if wait is None and not tasks:
+                        return
+                stopped = asyncio.ensure_future(self._stopped.wait())
+                try:
+                    done, _ = await asyncio.wait(
+                        [*tasks, stopped], timeout=wait, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    stopped.cancel()
+                for task in done:
+                    if task is stopped or self._stopped.is_set():
+                        continue
+                    change = self._record(tasks.pop(task), task.result())
+                    if change is not None:
+                        yield change
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(self) -> None:
+        """Refresh the notifications until :meth:`stop` is called or none is left to watch."""
+        async for _ in self:
+            pass
+
+    def stop(self) -> None:
+        """Stop the iteration; the refreshes in progress are cancelled."""
+        self._stopped.set()
+
+    async def _fetch(self, id: int) -> Notification | PushpadError:
+        await self._budget.acquire_async()
+        client = self._resource._client
+        try:
+            # Not through get(), which could return an object kept by the ResponseCache.
+            response = await client._request("GET", self._path(id), timeout=self._resource._timeout(self._timeout))
+        except PushpadError as exc:
+            return exc
+        return self._resource._model(Notification).from_api(response)
+
+
+__all__ = [
+    "AsyncNotificationWatcher",
+    "NotificationChange",
+    "NotificationWatcher",
+    "STATS_FIELDS",
+    "WatchSchedule",
+]
@@ -0,0 +1,200 @@
+"""Asyncio Pushpad API client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Mapping, Optional
+
+from ._base import APIResponse, BaseClient, JSONDict
+from ._cache import ResponseCache
+from ._circuit import CircuitBreaker
+from ._compression import DEFAULT_COMPRESSION_THRESHOLD
+from ._conditional import DEFAULT_CONDITIONAL_CACHE_SIZE
+from ._hooks import Hook, finish_event, start_event
+from ._json import JSONCodec
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
+from ._stream import JSONArrayParser
+from ._timeout import TimeoutTypes
+from ._transport import AsyncHTTPXTransport, AsyncTransport, TransportError
+from .exceptions import PushpadClientError
+from .resources import (
+    AsyncNotificationsResource,
+    AsyncProjectsResource,
+    AsyncSendersResource,
+    AsyncSubscriptionsResource,
+)
+
+
+class AsyncPushpad(BaseClient):
+    """Asyncio client used to interact with the Pushpad REST API."""
+
+    DEFAULT_POOL_MAXSIZE = 100
+
+    def __init__(
+        self,
+        auth_token: str,
+        project_id: Optional[int] = None,
+        *,
+        base_url: Optional[str] = None,
+        timeout: TimeoutTypes = 30,
+        resource_timeouts: Optional[Mapping[str, TimeoutTypes]] = None,
+        session: Optional[Any] = None,
+        transport: Optional[AsyncTransport] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        keepalive_expiry: float = 5.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        signature_cache_size: int = 1024,
+        lazy_models: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        hooks: Iterable[Hook] = (),
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
+        conditional_cache_size: int = DEFAULT_CONDITIONAL_CACHE_SIZE,
+    ) -> None:
+        super().__init__(
+            auth_token,
+            project_id,
+            base_url=base_url,
+            timeout=timeout,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            signature_cache_size=signature_cache_size,
+            lazy_models=lazy_models,
+            json_codec=json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            hooks=hooks,
+            cache=cache,
+            conditional_requests=conditional_requests,
+            conditional_cache_size=conditional_cache_size,
+        )
+        if transport is not None:
+            self._transport = transport
+        else:
+            self._transport = AsyncHTTPXTransport(
+                session,
+                pool_maxsize=pool_maxsize,
+                keep_alive=keep_alive,
+                keepalive_expiry=keepalive_expiry,
+            )
+        self._transport.headers.update(self._default_headers())
+
+        self.notifications = AsyncNotificationsResource(self)
+        self.subscriptions = AsyncSubscriptionsResource(self)
+        self.projects = AsyncProjectsResource(self)
+        self.senders = AsyncSendersResource(self)
+        self._set_resource_timeouts(resource_timeouts)
+
+    async def __aenter__(self) -> "AsyncPushpad":
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying transport."""
+        await self._transport.aclose()
+
+    @staticmethod
+    def _reason(response: Any) -> Optional[str]:
+        return getattr(response, "reason_phrase", None)
+
+    async def _raw_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSONDict] = None,
+        guarded: bool = False,
+        timeout: Optional[TimeoutTypes] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        url = self._url(path)
+        body, headers = self._encode_body(json, headers)
+        timeout, deadline = self._start_call(timeout)
+        hooks = self._hooks
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            response = error = None
+            try:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async()
+                connect_timeout, read_timeout = timeout.for_attempt(self._time_left(deadline))
+                event = start_event(hooks, method, path, url, attempt, body) if hooks else None
+                try:
+                    response = await self._transport.request(
+                        method,
+                        url,
+                        params=params,
+                        content=body,
+                        headers=headers,
+                        timeout=(connect_timeout, read_timeout),
+                        stream=stream,
+                    )
+                except TransportError as exc:
+                    error = exc
+                    if event is not None:
+                        finish_event(hooks, event, error=exc)
+                else:
+                    if event is not None:
+                        reused = self._transport.connection_reused(response)
+                        finish_event(hooks, event, response=response, stream=stream, connection_reused=reused)
+            finally:
+                self._record_outcome(error=error, response=response)
+            if error is not None:
+                delay = self._retry_delay(method, attempt, guarded=guarded, deadline=deadline, error=error)
+                if delay is None:
+                    raise self._client_error(error) from error
+            else:
+                delay = self._retry_delay(method, attempt, guarded=guarded, deadline=deadline, response=response)
+                if delay is None:
+                    if stream and response.status_code >= 400:
+                        await response.aread()
+                    self._check_response(response)
+                    return response
+                if stream:
+                    await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSONDict] = None,
+        guarded: bool = False,
+        timeout: Optional[TimeoutTypes] = None,
+    ) -> APIResponse:
+        key, cached, headers = self._conditional_request(method, path, params)
+        response = await self._raw_request(
+            method, path, params=params, json=json, guarded=guarded, timeout=timeout, headers=headers
+        )
+        return self._decode_conditional(response, key, cached)
+
+    async def _stream_items(self, response: Any) -> AsyncIterator[Any]:
+        """Yield the elements of the JSON array of a streamed response while it is received."""
+        parser = JSONArrayParser(self._json.loads)
+        try:
+            async for chunk in self._transport.aiter_bytes(response):
+                for item in parser.feed(chunk):
+                    yield item
+            parser.close()
+        except ValueError as exc:
+            raise PushpadClientError("Invalid JSON in response", original_exception=exc) from exc
+        except TransportError as exc:
+            raise self._client_error(exc) from exc
+        finally:
+            await response.aclose()
@@ -17,6 +17,18 @@ class PushpadClientError(PushpadError):
         self.original_exception = original_exception
 
 
+class CircuitOpenError(PushpadClientError):
+    """Raised without sending the request while the circuit breaker is open."""
+
+    def __init__(self, *, retry_after: float) -> None:
+        super().__init__(f"Circuit breaker is open, requests are allowed again in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(PushpadClientError):
+    """Raised when the total timeout of a call expires before a response is received."""
+
+
 class PushpadAPIError(PushpadError):
     """Raised for HTTP errors returned by the Pushpad API."""
 
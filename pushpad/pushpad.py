@@ -2,60 +2,98 @@
 
 from __future__ import annotations
 
-import hmac
-from hashlib import sha256
-from typing import Any, Dict, MutableMapping, Optional, Union
-
-import requests
-from requests import RequestException, Response
-
-from ._version import __version__
-from .exceptions import PushpadAPIError, PushpadClientError
+import time
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from ._base import APIResponse, BaseClient, JSONDict
+from ._cache import ResponseCache
+from ._circuit import CircuitBreaker
+from ._compression import DEFAULT_COMPRESSION_THRESHOLD
+from ._conditional import DEFAULT_CONDITIONAL_CACHE_SIZE
+from ._hooks import Hook, finish_event, start_event
+from ._http2 import HTTP2Transport
+from ._json import JSONCodec
+from ._pool import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, PoolStats
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
+from ._stream import STREAM_CHUNK_SIZE, JSONArrayParser
+from ._timeout import TimeoutTypes
+from ._transport import RequestsTransport, Transport, TransportError
+from .exceptions import PushpadClientError
 from .resources import NotificationsResource, ProjectsResource, SendersResource, SubscriptionsResource
 
-JSONDict = MutableMapping[str, Any]
-
-
-APIResponse = Union[Dict[str, Any], list[Dict[str, Any]], None]
 
-
-class Pushpad:
+class Pushpad(BaseClient):
     """High level client used to interact with the Pushpad REST API."""
 
-    DEFAULT_BASE_URL = "https://pushpad.xyz/api/v1"
-
     def __init__(
         self,
         auth_token: str,
         project_id: Optional[int] = None,
         *,
         base_url: Optional[str] = None,
-        timeout: int = 30,
+        timeout: TimeoutTypes = 30,
+        resource_timeouts: Optional[Mapping[str, TimeoutTypes]] = None,
         session: Optional[Any] = None,
+        transport: Optional[Transport] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        http2: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        signature_cache_size: int = 1024,
+        lazy_models: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        hooks: Iterable[Hook] = (),
+        cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
+        conditional_cache_size: int = DEFAULT_CONDITIONAL_CACHE_SIZE,
     ) -> None:
-        if not auth_token:
-            raise ValueError("auth_token is required")
-        self._auth_token = auth_token
-        self._project_id = project_id
-        self._base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
-        self._timeout = timeout
-        if session is not None:
-            self._session = session
-        else:
-            self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {self._auth_token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": f"pushpad-python/{__version__}",
-            }
+        super().__init__(
+            auth_token,
+            project_id,
+            base_url=base_url,
+            timeout=timeout,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            signature_cache_size=signature_cache_size,
+            lazy_models=lazy_models,
+            json_codec=json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            hooks=hooks,
+            cache=cache,
+            conditional_requests=conditional_requests,
+            conditional_cache_size=conditional_cache_size,
         )
+        if transport is not None:
+            self._transport = transport
+        elif session is not None:
+            self._transport = RequestsTransport(session)
+        elif http2:
+            if pool_connections != DEFAULT_POOL_CONNECTIONS or pool_block or not keep_alive:
+                raise ValueError("pool_connections, pool_block and keep_alive are not supported with http2")
+            self._transport = HTTP2Transport(max_connections=pool_maxsize)
+        else:
+            self._transport = RequestsTransport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+        self._transport.headers.update(self._default_headers())
 
         self.notifications = NotificationsResource(self)
         self.subscriptions = SubscriptionsResource(self)
         self.projects = ProjectsResource(self)
         self.senders = SendersResource(self)
+        self._set_resource_timeouts(resource_timeouts)
 
     def __enter__(self) -> "Pushpad":
         return self
@@ -64,20 +102,12 @@ class Pushpad:
         self.close()
 
     def close(self) -> None:
-        """Close the underlying HTTP session."""
-        close = getattr(self._session, "close", None)
-        if callable(close):
-            close()
-
-    def signature_for(self, data: str) -> str:
-        """Return the HMAC signature for a user identifier."""
-        return hmac.new(self._auth_token.encode(), data.encode(), sha256).hexdigest()
+        """Close the underlying transport."""
+        self._transport.close()
 
-    def _resolve_project_id(self, project_id: Optional[int]) -> int:
-        pid = project_id if project_id is not None else self._project_id
-        if pid is None:
-            raise ValueError("project_id is required for this operation")
-        return pid
+    def pool_stats(self) -> list[PoolStats]:
+        """Return the usage statistics of the connection pools of the transport (none with ``http2``)."""
+        return self._transport.pool_stats()
 
     def _raw_request(
         self,
@@ -86,23 +116,57 @@ class Pushpad:
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[JSONDict] = None,
-    ) -> Response:
-        url = f"{self._base_url}{path}"
-        try:
-            response = self._session.request(
-                method,
-                url,
-                params=params,
-                json=json,
-                timeout=self._timeout,
-            )
-        except RequestException as exc:
-            raise PushpadClientError(str(exc), original_exception=exc) from exc
-
-        if response.status_code >= 400:
-            raise PushpadAPIError(response.status_code, reason=response.reason, response_body=response.text)
-
-        return response
+        guarded: bool = False,
+        timeout: Optional[TimeoutTypes] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        url = self._url(path)
+        body, headers = self._encode_body(json, headers)
+        timeout, deadline = self._start_call(timeout)
+        hooks = self._hooks
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            response = error = None
+            try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                connect_timeout, read_timeout = timeout.for_attempt(self._time_left(deadline))
+                event = start_event(hooks, method, path, url, attempt, body) if hooks else None
+                try:
+                    response = self._transport.request(
+                        method,
+                        url,
+                        params=params,
+                        content=body,
+                        headers=headers,
+                        timeout=(connect_timeout, read_timeout),
+                        stream=stream,
+                    )
+                except TransportError as exc:
+                    error = exc
+                    if event is not None:
+                        finish_event(hooks, event, error=exc)
+                else:
+                    if event is not None:
+                        reused = self._transport.connection_reused(response)
+                        finish_event(hooks, event, response=response, stream=stream, connection_reused=reused)
+            finally:
+                self._record_outcome(error=error, response=response)
+            if error is not None:
+                delay = self._retry_delay(method, attempt, guarded=guarded, deadline=deadline, error=error)
+                if delay is None:
+                    raise self._client_error(error) from error
+            else:
+                delay = self._retry_delay(method, attempt, guarded=guarded, deadline=deadline, response=response)
+                if delay is None:
+                    self._check_response(response)
+                    return response
+                response.close()
+            time.sleep(delay)
 
     def _request(
         self,
@@ -111,13 +175,25 @@ class Pushpad:
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[JSONDict] = None,
+        guarded: bool = False,
+        timeout: Optional[TimeoutTypes] = None,
     ) -> APIResponse:
-        response = self._raw_request(method, path, params=params, json=json)
-        if response.status_code in (202, 204) or not response.content:
-            return None
+        key, cached, headers = self._conditional_request(method, path, params)
+        response = self._raw_request(
+            method, path, params=params, json=json, guarded=guarded, timeout=timeout, headers=headers
+        )
+        return self._decode_conditional(response, key, cached)
 
+    def _stream_items(self, response: Any) -> Iterator[Any]:
+        """Yield the elements of the JSON array of a streamed response while it is received."""
+        parser = JSONArrayParser(self._json.loads)
         try:
-            data = response.json()
-        except ValueError as exc:  # pragma: no cover - unexpected API behaviour
+            for chunk in self._transport.iter_bytes(response, STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            parser.close()
+        except ValueError as exc:
             raise PushpadClientError("Invalid JSON in response", original_exception=exc) from exc
-        return data
+        except TransportError as exc:
+            raise self._client_error(exc) from exc
+        finally:
+            response.close()
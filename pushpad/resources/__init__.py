@@ -1,13 +1,17 @@
 """Resource modules for the Pushpad client."""
 
-from .notifications import NotificationsResource
-from .projects import ProjectsResource
-from .senders import SendersResource
-from .subscriptions import SubscriptionsResource
+from .notifications import AsyncNotificationsResource, NotificationsResource
+from .projects import AsyncProjectsResource, ProjectsResource
+from .senders import AsyncSendersResource, SendersResource
+from .subscriptions import AsyncSubscriptionsResource, SubscriptionsResource
 
 __all__ = [
     "NotificationsResource",
     "SubscriptionsResource",
     "ProjectsResource",
     "SendersResource",
+    "AsyncNotificationsResource",
+    "AsyncSubscriptionsResource",
+    "AsyncProjectsResource",
+    "AsyncSendersResource",
 ]
@@ -0,0 +1,38 @@
+"""Base class of the API resources."""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from .._timeout import TimeoutTypes
+from ..types import LAZY_MODELS
+
+ModelT = TypeVar("ModelT")
+
+
+class Resource:
+    # Name of the resource in the ResponseCache, for the resources whose get() is cached.
+    _cache_name: Optional[str] = None
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        # Default timeout of the resource methods, overriding the client timeout.
+        self.timeout: Optional[TimeoutTypes] = None
+
+    def _timeout(self, timeout: Optional[TimeoutTypes]) -> Optional[TimeoutTypes]:
+        return timeout if timeout is not None else self.timeout
+
+    def _cached(self, id: int, fetch: Callable[[], Any]) -> Any:
+        cache = self._client.cache
+        return fetch() if cache is None else cache.get(self._cache_name, id, fetch)
+
+    async def _acached(self, id: int, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        cache = self._client.cache
+        return await fetch() if cache is None else await cache.aget(self._cache_name, id, fetch)
+
+    def _invalidate(self, id: int) -> None:
+        if self._client.cache is not None:
+            self._client.cache.invalidate(self._cache_name, id)
+
+    def _model(self, cls: type[ModelT]) -> type[ModelT]:
+        return LAZY_MODELS[cls] if self._client._lazy_models else cls
@@ -3,29 +3,71 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Iterable, Mapping, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Mapping, Optional
 
+from .._concurrency import async_ordered_map, ordered_map
+from .._pagination import is_last_page
+from .._ratelimit import RateLimiter
 from .._sentinel import _MISSING, _Missing, remove_missing
-from ..types import Notification, NotificationCreateResult
+from .._timeout import TimeoutTypes
+from .._watch import DEFAULT_MAX_AGE, AsyncNotificationWatcher, NotificationChange, NotificationWatcher
+from ..exceptions import PushpadError
+from ..types import ChunkedNotificationCreateResult, Notification, NotificationCreateResult
+from ._resource import Resource
 
-if TYPE_CHECKING:  # pragma: no cover - only used for typing
-    from ..pushpad import Pushpad
 
+def _chunk(values: list[str], size: int) -> list[list[str]]:
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return [values[start : start + size] for start in range(0, len(values), size)]
 
-class NotificationsResource:
-    def __init__(self, client: "Pushpad") -> None:
-        self._client = client
+
+class NotificationsResource(Resource):
+    _cache_name = "notifications"
 
     def all(
         self,
         *,
         page: Optional[int] = None,
         project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
     ) -> list[Notification]:
         pid = self._client._resolve_project_id(project_id)
         params = {"page": page} if page is not None else None
-        response = self._client._request("GET", f"/projects/{pid}/notifications", params=params)
-        return [Notification.from_api(item) for item in response]
+        response = self._client._request(
+            "GET",
+            f"/projects/{pid}/notifications",
+            params=params,
+            timeout=self._timeout(timeout),
+        )
+        model = self._model(Notification)
+        return [model.from_api(item) for item in response]
+
+    def iter_all(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Iterator[Notification]:
+        """Yield every notification, fetching one page at a time as the iteration advances."""
+        pid = self._client._resolve_project_id(project_id)
+        model = self._model(Notification)
+        page = 1
+        fetched = 0
+        while True:
+            response = self._client._raw_request(
+                "GET",
+                f"/projects/{pid}/notifications",
+                params={"page": page},
+                timeout=self._timeout(timeout),
+            )
+            items = self._client._decode_response(response) or []
+            fetched += len(items)
+            for item in items:
+                yield model.from_api(item)
+            if is_last_page(response, len(items), fetched):
+                return
+            page += 1
 
     def create(
         self,
@@ -48,6 +90,210 @@ class NotificationsResource:
         uids: list[str] | _Missing = _MISSING,
         tags: list[str] | _Missing = _MISSING,
         project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> NotificationCreateResult:
+        pid = self._client._resolve_project_id(project_id)
+        payload = remove_missing(
+            body=body,
+            title=title,
+            target_url=target_url,
+            icon_url=icon_url,
+            badge_url=badge_url,
+            image_url=image_url,
+            ttl=ttl,
+            require_interaction=require_interaction,
+            silent=silent,
+            urgent=urgent,
+            custom_data=custom_data,
+            starred=starred,
+            send_at=send_at,
+            actions=actions,
+            custom_metrics=custom_metrics,
+            uids=uids,
+            tags=tags,
+        )
+        response = self._client._request(
+            "POST",
+            f"/projects/{pid}/notifications",
+            json=payload,
+            guarded=True,
+            timeout=self._timeout(timeout),
+        )
+        return NotificationCreateResult.from_api(response)
+
+    send = create
+
+    def create_many(
+        self,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 4,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> list[NotificationCreateResult | PushpadError]:
+        """Create one notification per payload, with up to ``concurrency`` requests in flight.
+
+        Each payload contains the keyword arguments accepted by :meth:`create`.
+        Results are returned in input order; a notification that cannot be created
+        is reported by its ``PushpadError`` instead of interrupting the batch.
+        """
+
+        def send(payload: Mapping[str, Any]) -> NotificationCreateResult | PushpadError:
+            try:
+                return self.create(**{"project_id": project_id, "timeout": timeout, **payload})
+            except PushpadError as exc:
+                return exc
+
+        return list(ordered_map(send, payloads, workers=concurrency))
+
+    def create_chunked(
+        self,
+        *,
+        uids: list[str],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+        **fields: Any,
+    ) -> ChunkedNotificationCreateResult:
+        """Send a notification to a long list of ``uids``, split into parallel requests.
+
+        Each request targets ``chunk_size`` uids and carries the same ``fields``
+        accepted by :meth:`create`. Failed chunks are reported in ``errors`` and
+        ``failed_uids`` so that they can be retried; the uids of the successful
+        chunks that are not subscribed are listed in ``unreachable_uids``.
+        """
+        chunks = _chunk(uids, chunk_size)
+        results = self.create_many(
+            [{**fields, "uids": chunk} for chunk in chunks],
+            concurrency=concurrency,
+            project_id=project_id,
+            timeout=timeout,
+        )
+        return ChunkedNotificationCreateResult.combine(chunks, results)
+
+    def get(self, id: int, *, timeout: TimeoutTypes | None = None) -> Notification:
+        if id is None:
+            raise ValueError("id is required")
+        response = self._cached(
+            id, lambda: self._client._request("GET", f"/notifications/{id}", timeout=self._timeout(timeout))
+        )
+        return self._model(Notification).from_api(response)
+
+    def cancel(self, id: int, *, timeout: TimeoutTypes | None = None) -> None:
+        if id is None:
+            raise ValueError("id is required")
+        try:
+            self._client._request("DELETE", f"/notifications/{id}/cancel", timeout=self._timeout(timeout))
+        finally:
+            self._invalidate(id)
+        return None
+
+    def watch(
+        self,
+        ids: Iterable[int],
+        *,
+        on_change: Optional[Callable[[NotificationChange], Any]] = None,
+        on_error: Optional[Callable[[int, PushpadError], Any]] = None,
+        budget: float | RateLimiter = 1.0,
+        concurrency: int = 4,
+        min_interval: float = 10.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        timeout: TimeoutTypes | None = None,
+    ) -> NotificationWatcher:
+        """Return a watcher that refreshes the stats of the notifications ``ids`` and reports their changes.
+
+        New notifications are refreshed every ``min_interval`` seconds, older or
+        unchanged ones less often (up to ``max_interval``), with at most ``budget``
+        requests per second; cancelled notifications and those older than
+        ``max_age`` seconds are no longer refreshed. See :class:`NotificationWatcher`.
+        """
+        return NotificationWatcher(
+            self,
+            ids,
+            on_change=on_change,
+            on_error=on_error,
+            budget=budget,
+            concurrency=concurrency,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            max_age=max_age,
+            timeout=timeout,
+        )
+
+
+class AsyncNotificationsResource(Resource):
+    _cache_name = "notifications"
+
+    async def all(
+        self,
+        *,
+        page: Optional[int] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> list[Notification]:
+        pid = self._client._resolve_project_id(project_id)
+        params = {"page": page} if page is not None else None
+        response = await self._client._request(
+            "GET",
+            f"/projects/{pid}/notifications",
+            params=params,
+            timeout=self._timeout(timeout),
+        )
+        model = self._model(Notification)
+        return [model.from_api(item) for item in response]
+
+    async def iter_all(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> AsyncIterator[Notification]:
+        """Yield every notification, fetching one page at a time as the iteration advances."""
+        pid = self._client._resolve_project_id(project_id)
+        model = self._model(Notification)
+        page = 1
+        fetched = 0
+        while True:
+            response = await self._client._raw_request(
+                "GET",
+                f"/projects/{pid}/notifications",
+                params={"page": page},
+                timeout=self._timeout(timeout),
+            )
+            items = self._client._decode_response(response) or []
+            fetched += len(items)
+            for item in items:
+                yield model.from_api(item)
+            if is_last_page(response, len(items), fetched):
+                return
+            page += 1
+
+    async def create(
+        self,
+        *,
+        body: str,
+        title: str | _Missing = _MISSING,
+        target_url: str | _Missing = _MISSING,
+        icon_url: str | _Missing = _MISSING,
+        badge_url: str | _Missing = _MISSING,
+        image_url: str | _Missing = _MISSING,
+        ttl: int | _Missing = _MISSING,
+        require_interaction: bool | _Missing = _MISSING,
+        silent: bool | _Missing = _MISSING,
+        urgent: bool | _Missing = _MISSING,
+        custom_data: str | _Missing = _MISSING,
+        actions: Iterable[Mapping[str, str]] | _Missing = _MISSING,
+        starred: bool | _Missing = _MISSING,
+        send_at: datetime | str | _Missing = _MISSING,
+        custom_metrics: list[str] | _Missing = _MISSING,
+        uids: list[str] | _Missing = _MISSING,
+        tags: list[str] | _Missing = _MISSING,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
     ) -> NotificationCreateResult:
         pid = self._client._resolve_project_id(project_id)
         payload = remove_missing(
@@ -69,19 +315,103 @@ class NotificationsResource:
             uids=uids,
             tags=tags,
         )
-        response = self._client._request("POST", f"/projects/{pid}/notifications", json=payload)
+        response = await self._client._request(
+            "POST",
+            f"/projects/{pid}/notifications",
+            json=payload,
+            guarded=True,
+            timeout=self._timeout(timeout),
+        )
         return NotificationCreateResult.from_api(response)
 
     send = create
 
-    def get(self, id: int) -> Notification:
+    async def create_many(
+        self,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 4,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> list[NotificationCreateResult | PushpadError]:
+        """Create one notification per payload, with up to ``concurrency`` requests in flight.
+
+        See :meth:`NotificationsResource.create_many`.
+        """
+
+        async def send(payload: Mapping[str, Any]) -> NotificationCreateResult | PushpadError:
+            try:
+                return await self.create(**{"project_id": project_id, "timeout": timeout, **payload})
+            except PushpadError as exc:
+                return exc
+
+        return [result async for result in async_ordered_map(send, payloads, concurrency=concurrency)]
+
+    async def create_chunked(
+        self,
+        *,
+        uids: list[str],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+        **fields: Any,
+    ) -> ChunkedNotificationCreateResult:
+        """Send a notification to a long list of ``uids``, split into parallel requests.
+
+        See :meth:`NotificationsResource.create_chunked`.
+        """
+        chunks = _chunk(uids, chunk_size)
+        results = await self.create_many(
+            [{**fields, "uids": chunk} for chunk in chunks],
+            concurrency=concurrency,
+            project_id=project_id,
+            timeout=timeout,
+        )
+        return ChunkedNotificationCreateResult.combine(chunks, results)
+
+    async def get(self, id: int, *, timeout: TimeoutTypes | None = None) -> Notification:
         if id is None:
             raise ValueError("id is required")
-        response = self._client._request("GET", f"/notifications/{id}")
-        return Notification.from_api(response)
+        response = await self._acached(
+            id, lambda: self._client._request("GET", f"/notifications/{id}", timeout=self._timeout(timeout))
+        )
+        return self._model(Notification).from_api(response)
 
-    def cancel(self, id: int) -> None:
+    async def cancel(self, id: int, *, timeout: TimeoutTypes | None = None) -> None:
         if id is None:
             raise ValueError("id is required")
-        self._client._request("DELETE", f"/notifications/{id}/cancel")
+        try:
+            await self._client._request("DELETE", f"/notifications/{id}/cancel", timeout=self._timeout(timeout))
+        finally:
+            self._invalidate(id)
         return None
+
+    def watch(
+        self,
+        ids: Iterable[int],
+        *,
+        on_change: Optional[Callable[[NotificationChange], Any]] = None,
+        on_error: Optional[Callable[[int, PushpadError], Any]] = None,
+        budget: float | RateLimiter = 1.0,
+        concurrency: int = 4,
+        min_interval: float = 10.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        timeout: TimeoutTypes | None = None,
+    ) -> AsyncNotificationWatcher:
+        """Async counterpart of :meth:`NotificationsResource.watch`; iterate the watcher with ``async for``."""
+        return AsyncNotificationWatcher(
+            self,
+            ids,
+            on_change=on_change,
+            on_error=on_error,
+            budget=budget,
+            concurrency=concurrency,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            max_age=max_age,
+            timeout=timeout,
+        )
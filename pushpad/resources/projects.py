@@ -2,22 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from .._sentinel import _MISSING, _Missing, remove_missing
+from .._timeout import TimeoutTypes
 from ..types import Project
-
-if TYPE_CHECKING:  # pragma: no cover - only used for typing
-    from ..pushpad import Pushpad
+from ._resource import Resource
 
 
-class ProjectsResource:
-    def __init__(self, client: "Pushpad") -> None:
-        self._client = client
+class ProjectsResource(Resource):
+    _cache_name = "projects"
 
-    def all(self) -> list[Project]:
-        response = self._client._request("GET", "/projects")
-        return [Project.from_api(item) for item in response]
+    def all(self, *, timeout: TimeoutTypes | None = None) -> list[Project]:
+        response = self._client._request("GET", "/projects", timeout=self._timeout(timeout))
+        model = self._model(Project)
+        return [model.from_api(item) for item in response]
 
     def create(
         self,
@@ -30,6 +27,7 @@ class ProjectsResource:
         notifications_ttl: int | _Missing = _MISSING,
         notifications_require_interaction: bool | _Missing = _MISSING,
         notifications_silent: bool | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
     ) -> Project:
         payload = remove_missing(
             sender_id=sender_id,
@@ -41,14 +39,16 @@ class ProjectsResource:
             notifications_require_interaction=notifications_require_interaction,
             notifications_silent=notifications_silent,
         )
-        response = self._client._request("POST", "/projects", json=payload)
-        return Project.from_api(response)
+        response = self._client._request("POST", "/projects", json=payload, timeout=self._timeout(timeout))
+        return self._model(Project).from_api(response)
 
-    def get(self, id: int) -> Project:
+    def get(self, id: int, *, timeout: TimeoutTypes | None = None) -> Project:
         if id is None:
             raise ValueError("id is required")
-        response = self._client._request("GET", f"/projects/{id}")
-        return Project.from_api(response)
+        response = self._cached(
+            id, lambda: self._client._request("GET", f"/projects/{id}", timeout=self._timeout(timeout))
+        )
+        return self._model(Project).from_api(response)
 
     def update(
         self,
@@ -61,6 +61,99 @@ class ProjectsResource:
         notifications_ttl: int | _Missing = _MISSING,
         notifications_require_interaction: bool | _Missing = _MISSING,
         notifications_silent: bool | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
+    ) -> Project:
+        if id is None:
+            raise ValueError("id is required")
+        payload = remove_missing(
+            name=name,
+            website=website,
+            icon_url=icon_url,
+            badge_url=badge_url,
+            notifications_ttl=notifications_ttl,
+            notifications_require_interaction=notifications_require_interaction,
+            notifications_silent=notifications_silent,
+        )
+        try:
+            response = self._client._request(
+                "PATCH",
+                f"/projects/{id}",
+                json=payload,
+                timeout=self._timeout(timeout),
+            )
+        finally:
+            self._invalidate(id)
+        return self._model(Project).from_api(response)
+
+    def delete(self, id: int, *, timeout: TimeoutTypes | None = None) -> None:
+        if id is None:
+            raise ValueError("id is required")
+        try:
+            self._client._request("DELETE", f"/projects/{id}", timeout=self._timeout(timeout))
+        finally:
+            self._invalidate(id)
+        return None
+
+
+class AsyncProjectsResource(Resource):
+    _cache_name = "projects"
+
+    async def all(self, *, timeout: TimeoutTypes | None = None) -> list[Project]:
+        response = await self._client._request("GET", "/projects", timeout=self._timeout(timeout))
+        model = self._model(Project)
+        return [model.from_api(item) for item in response]
+
+    async def create(
+        self,
+        *,
+        sender_id: int,
+        name: str,
+        website: str,
+        icon_url: str | _Missing = _MISSING,
+        badge_url: str | _Missing = _MISSING,
+        notifications_ttl: int | _Missing = _MISSING,
+        notifications_require_interaction: bool | _Missing = _MISSING,
+        notifications_silent: bool | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
+    ) -> Project:
+        payload = remove_missing(
+            sender_id=sender_id,
+            name=name,
+            website=website,
+            icon_url=icon_url,
+            badge_url=badge_url,
+            notifications_ttl=notifications_ttl,
+            notifications_require_interaction=notifications_require_interaction,
+            notifications_silent=notifications_silent,
+        )
+        response = await self._client._request(
+            "POST",
+            "/projects",
+            json=payload,
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Project).from_api(response)
+
+    async def get(self, id: int, *, timeout: TimeoutTypes | None = None) -> Project:
+        if id is None:
+            raise ValueError("id is required")
+        response = await self._acached(
+            id, lambda: self._client._request("GET", f"/projects/{id}", timeout=self._timeout(timeout))
+        )
+        return self._model(Project).from_api(response)
+
+    async def update(
+        self,
+        id: int,
+        *,
+        name: str | _Missing = _MISSING,
+        website: str | _Missing = _MISSING,
+        icon_url: str | _Missing = _MISSING,
+        badge_url: str | _Missing = _MISSING,
+        notifications_ttl: int | _Missing = _MISSING,
+        notifications_require_interaction: bool | _Missing = _MISSING,
+        notifications_silent: bool | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
     ) -> Project:
         if id is None:
             raise ValueError("id is required")
@@ -73,11 +166,22 @@ class ProjectsResource:
             notifications_require_interaction=notifications_require_interaction,
             notifications_silent=notifications_silent,
         )
-        response = self._client._request("PATCH", f"/projects/{id}", json=payload)
-        return Project.from_api(response)
+        try:
+            response = await self._client._request(
+                "PATCH",
+                f"/projects/{id}",
+                json=payload,
+                timeout=self._timeout(timeout),
+            )
+        finally:
+            self._invalidate(id)
+        return self._model(Project).from_api(response)
 
-    def delete(self, id: int) -> None:
+    async def delete(self, id: int, *, timeout: TimeoutTypes | None = None) -> None:
         if id is None:
             raise ValueError("id is required")
-        self._client._request("DELETE", f"/projects/{id}")
+        try:
+            await self._client._request("DELETE", f"/projects/{id}", timeout=self._timeout(timeout))
+        finally:
+            self._invalidate(id)
         return None
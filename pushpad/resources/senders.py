@@ -2,22 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from .._sentinel import _MISSING, _Missing, remove_missing
+from .._timeout import TimeoutTypes
 from ..types import Sender
-
-if TYPE_CHECKING:  # pragma: no cover - only used for typing
-    from ..pushpad import Pushpad
+from ._resource import Resource
 
 
-class SendersResource:
-    def __init__(self, client: "Pushpad") -> None:
-        self._client = client
+class SendersResource(Resource):
+    _cache_name = "senders"
 
-    def all(self) -> list[Sender]:
-        response = self._client._request("GET", "/senders")
-        return [Sender.from_api(item) for item in response]
+    def all(self, *, timeout: TimeoutTypes | None = None) -> list[Sender]:
+        response = self._client._request("GET", "/senders", timeout=self._timeout(timeout))
+        model = self._model(Sender)
+        return [model.from_api(item) for item in response]
 
     def create(
         self,
@@ -25,35 +22,118 @@ class SendersResource:
         name: str,
         vapid_private_key: str | _Missing = _MISSING,
         vapid_public_key: str | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
     ) -> Sender:
         payload = remove_missing(
             name=name,
             vapid_private_key=vapid_private_key,
             vapid_public_key=vapid_public_key,
         )
-        response = self._client._request("POST", "/senders", json=payload)
-        return Sender.from_api(response)
+        response = self._client._request("POST", "/senders", json=payload, timeout=self._timeout(timeout))
+        return self._model(Sender).from_api(response)
 
-    def get(self, id: int) -> Sender:
+    def get(self, id: int, *, timeout: TimeoutTypes | None = None) -> Sender:
         if id is None:
             raise ValueError("id is required")
-        response = self._client._request("GET", f"/senders/{id}")
-        return Sender.from_api(response)
+        response = self._cached(
+            id, lambda: self._client._request("GET", f"/senders/{id}", timeout=self._timeout(timeout))
+        )
+        return self._model(Sender).from_api(response)
 
     def update(
         self,
         id: int,
         *,
         name: str | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
+    ) -> Sender:
+        if id is None:
+            raise ValueError("id is required")
+        payload = remove_missing(name=name)
+        try:
+            response = self._client._request(
+                "PATCH",
+                f"/senders/{id}",
+                json=payload,
+                timeout=self._timeout(timeout),
+            )
+        finally:
+            self._invalidate(id)
+        return self._model(Sender).from_api(response)
+
+    def delete(self, id: int, *, timeout: TimeoutTypes | None = None) -> None:
+        if id is None:
+            raise ValueError("id is required")
+        try:
+            self._client._request("DELETE", f"/senders/{id}", timeout=self._timeout(timeout))
+        finally:
+            self._invalidate(id)
+        return None
+
+
+class AsyncSendersResource(Resource):
+    _cache_name = "senders"
+
+    async def all(self, *, timeout: TimeoutTypes | None = None) -> list[Sender]:
+        response = await self._client._request("GET", "/senders", timeout=self._timeout(timeout))
+        model = self._model(Sender)
+        return [model.from_api(item) for item in response]
+
+    async def create(
+        self,
+        *,
+        name: str,
+        vapid_private_key: str | _Missing = _MISSING,
+        vapid_public_key: str | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
+    ) -> Sender:
+        payload = remove_missing(
+            name=name,
+            vapid_private_key=vapid_private_key,
+            vapid_public_key=vapid_public_key,
+        )
+        response = await self._client._request(
+            "POST",
+            "/senders",
+            json=payload,
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Sender).from_api(response)
+
+    async def get(self, id: int, *, timeout: TimeoutTypes | None = None) -> Sender:
+        if id is None:
+            raise ValueError("id is required")
+        response = await self._acached(
+            id, lambda: self._client._request("GET", f"/senders/{id}", timeout=self._timeout(timeout))
+        )
+        return self._model(Sender).from_api(response)
+
+    async def update(
+        self,
+        id: int,
+        *,
+        name: str | _Missing = _MISSING,
+        timeout: TimeoutTypes | None = None,
     ) -> Sender:
         if id is None:
             raise ValueError("id is required")
         payload = remove_missing(name=name)
-        response = self._client._request("PATCH", f"/senders/{id}", json=payload)
-        return Sender.from_api(response)
+        try:
+            response = await self._client._request(
+                "PATCH",
+                f"/senders/{id}",
+                json=payload,
+                timeout=self._timeout(timeout),
+            )
+        finally:
+            self._invalidate(id)
+        return self._model(Sender).from_api(response)
 
-    def delete(self, id: int) -> None:
+    async def delete(self, id: int, *, timeout: TimeoutTypes | None = None) -> None:
         if id is None:
             raise ValueError("id is required")
-        self._client._request("DELETE", f"/senders/{id}")
+        try:
+            await self._client._request("DELETE", f"/senders/{id}", timeout=self._timeout(timeout))
+        finally:
+            self._invalidate(id)
         return None
@@ -2,19 +2,82 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import operator
+import os
+from contextlib import closing, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional
 
+from .._concurrency import async_ordered_map, ordered_map
+from .._pagination import is_last_page, total_count
 from .._sentinel import _MISSING, _Missing, remove_missing
-from ..types import Subscription
+from .._snapshot import REMOVED, SubscriptionChange, SubscriptionSnapshot
+from .._table import SubscriptionTable
+from .._timeout import TimeoutTypes
+from ..exceptions import PushpadError
+from ..types import BulkUpdateResult, Subscription
+from ._resource import Resource
 
-if TYPE_CHECKING:  # pragma: no cover - only used for typing
-    from ..pushpad import Pushpad
 
+@contextmanager
+def _open_snapshot(snapshot: SubscriptionSnapshot | str | os.PathLike[str]) -> Iterator[SubscriptionSnapshot]:
+    if isinstance(snapshot, SubscriptionSnapshot):
+        yield snapshot
+    else:
+        with SubscriptionSnapshot(snapshot) as opened:
+            yield opened
 
-class SubscriptionsResource:
-    def __init__(self, client: "Pushpad") -> None:
-        self._client = client
 
+def _as_tags(value: Iterable[str] | str) -> list[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _check_bulk_update(
+    ids: Optional[list[int]],
+    uids: Optional[list[str]],
+    tags: Optional[list[str]],
+    add_tags: list[str],
+    remove_tags: list[str],
+    uid: str | None | _Missing,
+) -> None:
+    if (ids is None) == (uids is None and tags is None):
+        raise ValueError("either ids or the uids/tags filters are required")
+    # An empty filter would be dropped from the query and match every subscription.
+    if any(value is not None and not value for value in (ids, uids, tags)):
+        raise ValueError("ids, uids and tags must not be empty")
+    if set(add_tags) & set(remove_tags):
+        raise ValueError("add_tags and remove_tags must not overlap")
+    if not add_tags and not remove_tags and uid is _MISSING:
+        raise ValueError("add_tags, remove_tags or uid is required")
+
+
+def _bulk_ids(ids: Iterable[int]) -> list[int]:
+    try:
+        return [operator.index(id) for id in ids]
+    except TypeError as exc:
+        raise TypeError(f"ids must be integers: {exc}") from exc
+
+
+def _bulk_changes(
+    subscription: Subscription,
+    add_tags: list[str],
+    remove_tags: list[str],
+    uid: str | None | _Missing,
+) -> Dict[str, Any]:
+    """Return the fields of ``subscription`` that the bulk update changes."""
+    current = list(subscription.tags or [])
+    new_tags = [tag for tag in current if tag not in remove_tags]
+    for tag in add_tags:
+        if tag not in new_tags:
+            new_tags.append(tag)
+    changes: Dict[str, Any] = {}
+    if new_tags != current:
+        changes["tags"] = new_tags
+    if uid is not _MISSING and uid != subscription.uid:
+        changes["uid"] = uid
+    return changes
+
+
+class SubscriptionsResource(Resource):
     def _build_filters(self, values: Dict[str, Any]) -> Dict[str, Any]:
         params = dict(values)
         uids = params.pop("uids", None)
@@ -43,11 +106,180 @@ class SubscriptionsResource:
         uids: Optional[list[str]] = None,
         tags: Optional[list[str]] = None,
         project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
     ) -> list[Subscription]:
         pid = self._client._resolve_project_id(project_id)
         params = self._build_filters({"page": page, "per_page": per_page, "uids": uids, "tags": tags})
-        response = self._client._request("GET", f"/projects/{pid}/subscriptions", params=params)
-        return [Subscription.from_api(item) for item in response]
+        response = self._client._request(
+            "GET",
+            f"/projects/{pid}/subscriptions",
+            params=params,
+            timeout=self._timeout(timeout),
+        )
+        model = self._model(Subscription)
+        return [model.from_api(item) for item in response]
+
+    def iter_all(
+        self,
+        *,
+        per_page: Optional[int] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+        stream: bool = False,
+    ) -> Iterator[Subscription]:
+        """Yield every subscription, fetching one page at a time as the iteration advances.
+
+        With ``stream`` each page is parsed while it is being received, so that the
+        first subscriptions are yielded sooner and a large ``per_page`` does not
+        need to hold the whole page in memory.
+        """
+        pid = self._client._resolve_project_id(project_id)
+        model = self._model(Subscription)
+        page = 1
+        fetched = 0
+        while True:
+            params = self._build_filters({"page": page, "per_page": per_page, "uids": uids, "tags": tags})
+            response = self._client._raw_request(
+                "GET",
+                f"/projects/{pid}/subscriptions",
+                params=params,
+                timeout=self._timeout(timeout),
+                stream=stream,
+            )
+            items = self._client._stream_items(response) if stream else self._client._decode_response(response) or []
+            count = 0
+            for item in items:
+                count += 1
+                yield model.from_api(item)
+            fetched += count
+            if is_last_page(response, count, fetched):
+                return
+            page += 1
+
+    def export(
+        self,
+        *,
+        per_page: int = 100,
+        workers: int = 4,
+        prefetch: Optional[int] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Iterator[Subscription]:
+        """Yield every subscription, fetching the pages in parallel with a pool of threads.
+
+        The first page tells the total number of subscriptions (``X-Total-Count``),
+        then the other pages are requested by ``workers`` threads. Subscriptions are
+        yielded in page order and at most ``prefetch`` pages (``workers`` by default)
+        are waiting in memory at any time.
+        """
+        model = self._model(Subscription)
+        pages = self._export_pages(per_page, workers, prefetch, uids, tags, project_id, timeout)
+        with closing(pages):
+            for items in pages:
+                for item in items:
+                    yield model.from_api(item)
+
+    def export_table(
+        self,
+        *,
+        per_page: int = 100,
+        workers: int = 4,
+        prefetch: Optional[int] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> SubscriptionTable:
+        """Fetch every subscription like :meth:`export` into a :class:`SubscriptionTable`."""
+        table = SubscriptionTable()
+        pages = self._export_pages(per_page, workers, prefetch, uids, tags, project_id, timeout)
+        with closing(pages):
+            for items in pages:
+                table.extend(items)
+        return table
+
+    def _export_pages(
+        self,
+        per_page: int,
+        workers: int,
+        prefetch: Optional[int],
+        uids: Optional[list[str]],
+        tags: Optional[list[str]],
+        project_id: Optional[int],
+        timeout: TimeoutTypes | None,
+    ) -> Iterator[list[Dict[str, Any]]]:
+        pid = self._client._resolve_project_id(project_id)
+        path = f"/projects/{pid}/subscriptions"
+        filters = {"per_page": per_page, "uids": uids, "tags": tags}
+
+        def fetch(page: int) -> list[Dict[str, Any]]:
+            params = self._build_filters({"page": page, **filters})
+            response = self._client._raw_request("GET", path, params=params, timeout=self._timeout(timeout))
+            return self._client._decode_response(response) or []
+
+        response = self._client._raw_request(
+            "GET",
+            path,
+            params=self._build_filters({"page": 1, **filters}),
+            timeout=self._timeout(timeout),
+        )
+        total = total_count(response)
+        if total is None:
+            raise ValueError("response missing X-Total-Count header")
+        yield self._client._decode_response(response) or []
+
+        last_page = -(-total // per_page)
+        with closing(ordered_map(fetch, range(2, last_page + 1), workers=workers, prefetch=prefetch)) as pages:
+            yield from pages
+
+    def sync(
+        self,
+        snapshot: SubscriptionSnapshot | str | os.PathLike[str],
+        *,
+        per_page: int = 100,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Iterator[SubscriptionChange]:
+        """Yield the subscriptions added, changed or removed since the previous sync with ``snapshot``.
+
+        ``snapshot`` is a :class:`SubscriptionSnapshot` or the path of its
+        database. Every page is fetched, but only the subscriptions whose
+        ``uid``, ``tags`` or ``last_click_at`` changed are decoded and yielded;
+        the removed ones are yielded at the end. The snapshot is checkpointed
+        after the changes of each page have been consumed, and an interrupted
+        sync resumes from the page after the last checkpoint.
+        """
+        pid = self._client._resolve_project_id(project_id)
+        path = f"/projects/{pid}/subscriptions"
+        model = self._model(Subscription)
+        with _open_snapshot(snapshot) as store:
+            page = store.begin({"project_id": pid, "uids": uids, "tags": tags}, per_page)
+            fetched = (page - 1) * per_page
+            try:
+                while True:
+                    params = self._build_filters({"page": page, "per_page": per_page, "uids": uids, "tags": tags})
+                    response = self._client._raw_request(
+                        "GET", path, params=params, timeout=self._timeout(timeout)
+                    )
+                    items = self._client._decode_response(response) or []
+                    for kind, item in store.compare(items):
+                        yield SubscriptionChange(kind, item["id"], model.from_api(item))
+                    store.checkpoint(page)
+                    fetched += len(items)
+                    if is_last_page(response, len(items), fetched):
+                        break
+                    page += 1
+                for id in store.removed():
+                    yield SubscriptionChange(REMOVED, id)
+                store.finish()
+            finally:
+                store.rollback()
 
     def count(
         self,
@@ -55,6 +287,7 @@ class SubscriptionsResource:
         uids: Optional[list[str]] = None,
         tags: Optional[list[str]] = None,
         project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
     ) -> int:
         pid = self._client._resolve_project_id(project_id)
         params = self._build_filters({"uids": uids, "tags": tags})
@@ -63,11 +296,12 @@ class SubscriptionsResource:
             "GET",
             f"/projects/{pid}/subscriptions",
             params=params,
+            timeout=self._timeout(timeout),
         )
-        total = response.headers.get("X-Total-Count")
+        total = total_count(response)
         if total is None:
             raise ValueError("response missing X-Total-Count header")
-        return int(total)
+        return total
 
     def create(
         self,
@@ -78,6 +312,7 @@ class SubscriptionsResource:
         uid: str | None | _Missing = _MISSING,
         tags: list[str] | _Missing = _MISSING,
         project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
     ) -> Subscription:
         pid = self._client._resolve_project_id(project_id)
         payload = remove_missing(
@@ -87,15 +322,30 @@ class SubscriptionsResource:
             uid=uid,
             tags=tags,
         )
-        response = self._client._request("POST", f"/projects/{pid}/subscriptions", json=payload)
-        return Subscription.from_api(response)
+        response = self._client._request(
+            "POST",
+            f"/projects/{pid}/subscriptions",
+            json=payload,
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Subscription).from_api(response)
 
-    def get(self, id: int, *, project_id: Optional[int] = None) -> Subscription:
+    def get(
+        self,
+        id: int,
+        *,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Subscription:
         if id is None:
             raise ValueError("id is required")
         pid = self._client._resolve_project_id(project_id)
-        response = self._client._request("GET", f"/projects/{pid}/subscriptions/{id}")
-        return Subscription.from_api(response)
+        response = self._client._request(
+            "GET",
+            f"/projects/{pid}/subscriptions/{id}",
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Subscription).from_api(response)
 
     def update(
         self,
@@ -104,6 +354,7 @@ class SubscriptionsResource:
         uid: str | None | _Missing = _MISSING,
         tags: list[str] | _Missing = _MISSING,
         project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
     ) -> Subscription:
         if id is None:
             raise ValueError("id is required")
@@ -112,12 +363,400 @@ class SubscriptionsResource:
             uid=uid,
             tags=tags,
         )
-        response = self._client._request("PATCH", f"/projects/{pid}/subscriptions/{id}", json=payload)
-        return Subscription.from_api(response)
+        response = self._client._request(
+            "PATCH",
+            f"/projects/{pid}/subscriptions/{id}",
+            json=payload,
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Subscription).from_api(response)
 
-    def delete(self, id: int, *, project_id: Optional[int] = None) -> None:
+    def bulk_update(
+        self,
+        *,
+        ids: Optional[Iterable[int]] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        add_tags: Iterable[str] | str = (),
+        remove_tags: Iterable[str] | str = (),
+        uid: str | None | _Missing = _MISSING,
+        concurrency: int = 4,
+        per_page: int = 100,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> BulkUpdateResult:
+        """Add or remove tags, or set the uid, of many subscriptions with up to ``concurrency`` requests in flight.
+
+        The subscriptions are those matching the ``uids``/``tags`` filters, all
+        fetched before the first update so that the updates cannot change the
+        pages, or those with the given ``ids``, each fetched just before its
+        update. The new tags are computed locally and the subscriptions that
+        would not change are not updated. A subscription that cannot be fetched
+        or updated is reported in the result instead of interrupting the batch.
+        """
+        add_tags, remove_tags = _as_tags(add_tags), _as_tags(remove_tags)
+        ids = None if ids is None else _bulk_ids(ids)
+        _check_bulk_update(ids, uids, tags, add_tags, remove_tags, uid)
+        options = {"project_id": project_id, "timeout": timeout}
+        if ids is None:
+            matching = self.iter_all(per_page=per_page, uids=uids, tags=tags, **options)
+            targets: Iterable[Subscription | int] = list(matching)
+        else:
+            targets = ids
+
+        def apply(target: Subscription | int) -> tuple[int, Subscription | PushpadError | None]:
+            id = target if isinstance(target, int) else target.id
+            try:
+                subscription = self.get(id, **options) if isinstance(target, int) else target
+                changes = _bulk_changes(subscription, add_tags, remove_tags, uid)
+                return id, self.update(id, **changes, **options) if changes else None
+            except PushpadError as exc:
+                return id, exc
+
+        return BulkUpdateResult.combine(ordered_map(apply, targets, workers=concurrency))
+
+    def delete(
+        self,
+        id: int,
+        *,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> None:
         if id is None:
             raise ValueError("id is required")
         pid = self._client._resolve_project_id(project_id)
-        self._client._request("DELETE", f"/projects/{pid}/subscriptions/{id}")
+        self._client._request("DELETE", f"/projects/{pid}/subscriptions/{id}", timeout=self._timeout(timeout))
+        return None
+
+
+class AsyncSubscriptionsResource(Resource):
+    _build_filters = SubscriptionsResource._build_filters
+
+    async def all(
+        self,
+        *,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> list[Subscription]:
+        pid = self._client._resolve_project_id(project_id)
+        params = self._build_filters({"page": page, "per_page": per_page, "uids": uids, "tags": tags})
+        response = await self._client._request(
+            "GET",
+            f"/projects/{pid}/subscriptions",
+            params=params,
+            timeout=self._timeout(timeout),
+        )
+        model = self._model(Subscription)
+        return [model.from_api(item) for item in response]
+
+    async def iter_all(
+        self,
+        *,
+        per_page: Optional[int] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+        stream: bool = False,
+    ) -> AsyncIterator[Subscription]:
+        """Yield every subscription, fetching one page at a time as the iteration advances.
+
+        ``stream`` parses each page while it is being received, like in
+        :meth:`SubscriptionsResource.iter_all`.
+        """
+        pid = self._client._resolve_project_id(project_id)
+        model = self._model(Subscription)
+        page = 1
+        fetched = 0
+        while True:
+            params = self._build_filters({"page": page, "per_page": per_page, "uids": uids, "tags": tags})
+            response = await self._client._raw_request(
+                "GET",
+                f"/projects/{pid}/subscriptions",
+                params=params,
+                timeout=self._timeout(timeout),
+                stream=stream,
+            )
+            count = 0
+            if stream:
+                async for item in self._client._stream_items(response):
+                    count += 1
+                    yield model.from_api(item)
+            else:
+                for item in self._client._decode_response(response) or []:
+                    count += 1
+                    yield model.from_api(item)
+            fetched += count
+            if is_last_page(response, count, fetched):
+                return
+            page += 1
+
+    async def export(
+        self,
+        *,
+        per_page: int = 100,
+        concurrency: int = 4,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> AsyncIterator[Subscription]:
+        """Yield every subscription, fetching up to ``concurrency`` pages at the same time.
+
+        Subscriptions are yielded in page order, like :meth:`SubscriptionsResource.export`.
+        """
+        model = self._model(Subscription)
+        pages = self._export_pages(per_page, concurrency, uids, tags, project_id, timeout)
+        try:
+            async for items in pages:
+                for item in items:
+                    yield model.from_api(item)
+        finally:
+            await pages.aclose()
+
+    async def export_table(
+        self,
+        *,
+        per_page: int = 100,
+        concurrency: int = 4,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> SubscriptionTable:
+        """Fetch every subscription like :meth:`export` into a :class:`SubscriptionTable`."""
+        table = SubscriptionTable()
+        pages = self._export_pages(per_page, concurrency, uids, tags, project_id, timeout)
+        try:
+            async for items in pages:
+                table.extend(items)
+        finally:
+            await pages.aclose()
+        return table
+
+    async def _export_pages(
+        self,
+        per_page: int,
+        concurrency: int,
+        uids: Optional[list[str]],
+        tags: Optional[list[str]],
+        project_id: Optional[int],
+        timeout: TimeoutTypes | None,
+    ) -> AsyncIterator[list[Dict[str, Any]]]:
+        pid = self._client._resolve_project_id(project_id)
+        path = f"/projects/{pid}/subscriptions"
+        filters = {"per_page": per_page, "uids": uids, "tags": tags}
+
+        async def fetch(page: int) -> list[Dict[str, Any]]:
+            params = self._build_filters({"page": page, **filters})
+            response = await self._client._raw_request(
+                "GET",
+                path,
+                params=params,
+                timeout=self._timeout(timeout),
+            )
+            return self._client._decode_response(response) or []
+
+        response = await self._client._raw_request(
+            "GET",
+            path,
+            params=self._build_filters({"page": 1, **filters}),
+            timeout=self._timeout(timeout),
+        )
+        total = total_count(response)
+        if total is None:
+            raise ValueError("response missing X-Total-Count header")
+        yield self._client._decode_response(response) or []
+
+        last_page = -(-total // per_page)
+        pages = async_ordered_map(fetch, range(2, last_page + 1), concurrency=concurrency)
+        try:
+            async for items in pages:
+                yield items
+        finally:
+            await pages.aclose()
+
+    async def sync(
+        self,
+        snapshot: SubscriptionSnapshot | str | os.PathLike[str],
+        *,
+        per_page: int = 100,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> AsyncIterator[SubscriptionChange]:
+        """Async counterpart of :meth:`SubscriptionsResource.sync`; the snapshot is updated synchronously."""
+        pid = self._client._resolve_project_id(project_id)
+        path = f"/projects/{pid}/subscriptions"
+        model = self._model(Subscription)
+        with _open_snapshot(snapshot) as store:
+            page = store.begin({"project_id": pid, "uids": uids, "tags": tags}, per_page)
+            fetched = (page - 1) * per_page
+            try:
+                while True:
+                    params = self._build_filters({"page": page, "per_page": per_page, "uids": uids, "tags": tags})
+                    response = await self._client._raw_request(
+                        "GET", path, params=params, timeout=self._timeout(timeout)
+                    )
+                    items = self._client._decode_response(response) or []
+                    for kind, item in store.compare(items):
+                        yield SubscriptionChange(kind, item["id"], model.from_api(item))
+                    store.checkpoint(page)
+                    fetched += len(items)
+                    if is_last_page(response, len(items), fetched):
+                        break
+                    page += 1
+                for id in store.removed():
+                    yield SubscriptionChange(REMOVED, id)
+                store.finish()
+            finally:
+                store.rollback()
+
+    async def count(
+        self,
+        *,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> int:
+        pid = self._client._resolve_project_id(project_id)
+        params = self._build_filters({"uids": uids, "tags": tags})
+        params.setdefault("per_page", 1)
+        response = await self._client._raw_request(
+            "GET",
+            f"/projects/{pid}/subscriptions",
+            params=params,
+            timeout=self._timeout(timeout),
+        )
+        total = total_count(response)
+        if total is None:
+            raise ValueError("response missing X-Total-Count header")
+        return total
+
+    async def create(
+        self,
+        *,
+        endpoint: str,
+        p256dh: str | _Missing = _MISSING,
+        auth: str | _Missing = _MISSING,
+        uid: str | None | _Missing = _MISSING,
+        tags: list[str] | _Missing = _MISSING,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Subscription:
+        pid = self._client._resolve_project_id(project_id)
+        payload = remove_missing(
+            endpoint=endpoint,
+            p256dh=p256dh,
+            auth=auth,
+            uid=uid,
+            tags=tags,
+        )
+        response = await self._client._request(
+            "POST",
+            f"/projects/{pid}/subscriptions",
+            json=payload,
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Subscription).from_api(response)
+
+    async def get(
+        self,
+        id: int,
+        *,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Subscription:
+        if id is None:
+            raise ValueError("id is required")
+        pid = self._client._resolve_project_id(project_id)
+        response = await self._client._request(
+            "GET",
+            f"/projects/{pid}/subscriptions/{id}",
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Subscription).from_api(response)
+
+    async def update(
+        self,
+        id: int,
+        *,
+        uid: str | None | _Missing = _MISSING,
+        tags: list[str] | _Missing = _MISSING,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Subscription:
+        if id is None:
+            raise ValueError("id is required")
+        pid = self._client._resolve_project_id(project_id)
+        payload = remove_missing(
+            uid=uid,
+            tags=tags,
+        )
+        response = await self._client._request(
+            "PATCH",
+            f"/projects/{pid}/subscriptions/{id}",
+            json=payload,
+            timeout=self._timeout(timeout),
+        )
+        return self._model(Subscription).from_api(response)
+
+    async def bulk_update(
+        self,
+        *,
+        ids: Optional[Iterable[int]] = None,
+        uids: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        add_tags: Iterable[str] | str = (),
+        remove_tags: Iterable[str] | str = (),
+        uid: str | None | _Missing = _MISSING,
+        concurrency: int = 4,
+        per_page: int = 100,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> BulkUpdateResult:
+        """Update many subscriptions concurrently; see :meth:`SubscriptionsResource.bulk_update`."""
+        add_tags, remove_tags = _as_tags(add_tags), _as_tags(remove_tags)
+        ids = None if ids is None else _bulk_ids(ids)
+        _check_bulk_update(ids, uids, tags, add_tags, remove_tags, uid)
+        options = {"project_id": project_id, "timeout": timeout}
+        if ids is None:
+            matching = self.iter_all(per_page=per_page, uids=uids, tags=tags, **options)
+            targets: Iterable[Subscription | int] = [subscription async for subscription in matching]
+        else:
+            targets = ids
+
+        async def apply(target: Subscription | int) -> tuple[int, Subscription | PushpadError | None]:
+            id = target if isinstance(target, int) else target.id
+            try:
+                subscription = await self.get(id, **options) if isinstance(target, int) else target
+                changes = _bulk_changes(subscription, add_tags, remove_tags, uid)
+                return id, (await self.update(id, **changes, **options)) if changes else None
+            except PushpadError as exc:
+                return id, exc
+
+        outcomes = [outcome async for outcome in async_ordered_map(apply, targets, concurrency=concurrency)]
+        return BulkUpdateResult.combine(outcomes)
+
+    async def delete(
+        self,
+        id: int,
+        *,
+        project_id: Optional[int] = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> None:
+        if id is None:
+            raise ValueError("id is required")
+        pid = self._client._resolve_project_id(project_id)
+        await self._client._request(
+            "DELETE",
+            f"/projects/{pid}/subscriptions/{id}",
+            timeout=self._timeout(timeout),
+        )
         return None
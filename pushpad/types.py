@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, Mapping, TypeVar
 
+from .exceptions import PushpadError
 
-@dataclass
+
+@dataclass(slots=True)
 class NotificationCreateResult:
     id: int
     scheduled: int | None
@@ -23,7 +25,42 @@ class NotificationCreateResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class ChunkedNotificationCreateResult:
+    ids: list[int]
+    scheduled: int | None
+    uids: list[str]
+    send_at: str | None
+    errors: list[PushpadError] = field(default_factory=list)
+    failed_uids: list[str] = field(default_factory=list)
+    unreachable_uids: list[str] = field(default_factory=list)
+
+    @classmethod
+    def combine(
+        cls,
+        chunks: Iterable[list[str]],
+        results: Iterable[NotificationCreateResult | PushpadError],
+    ) -> "ChunkedNotificationCreateResult":
+        combined = cls(ids=[], scheduled=None, uids=[], send_at=None)
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, PushpadError):
+                combined.errors.append(result)
+                combined.failed_uids.extend(chunk)
+                continue
+            combined.ids.append(result.id)
+            if result.scheduled is not None:
+                combined.scheduled = (combined.scheduled or 0) + result.scheduled
+            if result.uids is not None:
+                combined.uids.extend(result.uids)
+                # The API returns the uids of the chunk that are subscribed, the others were not reached.
+                reached = set(result.uids)
+                combined.unreachable_uids.extend(uid for uid in chunk if uid not in reached)
+            if combined.send_at is None:
+                combined.send_at = result.send_at
+        return combined
+
+
+@dataclass(slots=True)
 class Notification:
     id: int
     project_id: int
@@ -82,7 +119,7 @@ class Notification:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     id: int
     project_id: int
@@ -109,7 +146,38 @@ class Subscription:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class BulkUpdateResult:
+    """Outcome of a bulk update, by subscription id."""
+
+    updated: dict[int, Subscription] = field(default_factory=dict)
+    unchanged: list[int] = field(default_factory=list)
+    errors: dict[int, PushpadError] = field(default_factory=dict)
+
+    @classmethod
+    def combine(cls, outcomes: Iterable[tuple[int, Subscription | PushpadError | None]]) -> "BulkUpdateResult":
+        combined = cls()
+        for id, outcome in outcomes:
+            if isinstance(outcome, PushpadError):
+                combined.errors[id] = outcome
+            elif outcome is None:
+                combined.unchanged.append(id)
+            else:
+                combined.updated[id] = outcome
+        return combined
+
+    def outcome(self, id: int) -> str | None:
+        """Return ``"updated"``, ``"unchanged"`` or ``"failed"``, or ``None`` if ``id`` was not part of the update."""
+        if id in self.updated:
+            return "updated"
+        if id in self.errors:
+            return "failed"
+        if id in self.unchanged:
+            return "unchanged"
+        return None
+
+
+@dataclass(slots=True)
 class Project:
     id: int
     sender_id: int
@@ -138,7 +206,7 @@ class Project:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Sender:
     id: int
     name: str
@@ -157,10 +225,85 @@ class Sender:
         )
 
 
+ModelT = TypeVar("ModelT")
+
+
+class _LazyModel:
+    """Base of the lazy models: only the API data is stored, the fields are properties reading it."""
+
+    __slots__ = ("_data",)
+    # Fields of the model, in the order of the dataclass, set by _lazy.
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._data = data
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]):
+        return cls(data)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _lazy(cls: type[ModelT]) -> type[ModelT]:
+    """Build the lazy version of a model, with the same fields read from the API data on access.
+
+    It does not subclass the model: the slots of the model fields would be
+    inherited, making each lazy object bigger than the model it replaces.
+    """
+    names = tuple(model_field.name for model_field in fields(cls))
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "__doc__": f"{cls.__name__} whose fields are read from the API data when accessed.",
+        "_fields": names,
+    }
+    for name in names:
+        namespace[name] = _field_property(name)
+    return type(f"Lazy{cls.__name__}", (_LazyModel,), namespace)
+
+
+def _field_property(name: str) -> property:
+    def getter(self) -> Any:
+        return self._data.get(name)
+
+    def setter(self, value: Any) -> None:
+        self._data[name] = value
+
+    return property(getter, setter)
+
+
+LazyNotification = _lazy(Notification)
+LazySubscription = _lazy(Subscription)
+LazyProject = _lazy(Project)
+LazySender = _lazy(Sender)
+
+LAZY_MODELS: Dict[type, type] = {
+    Notification: LazyNotification,
+    Subscription: LazySubscription,
+    Project: LazyProject,
+    Sender: LazySender,
+}
+
+
 __all__ = [
     "Notification",
     "NotificationCreateResult",
+    "ChunkedNotificationCreateResult",
     "Subscription",
+    "BulkUpdateResult",
     "Project",
     "Sender",
+    "LazyNotification",
+    "LazySubscription",
+    "LazyProject",
+    "LazySender",
 ]
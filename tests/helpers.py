@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import json
+import threading
 import unittest
+from http.server import ThreadingHTTPServer
 from unittest import mock
 
 import pushpad
@@ -22,6 +24,60 @@ def make_response(status=200, payload=None, headers=None):
     return response
 
 
+class FakeClock:
+    """Clock given to the rate limiters, circuit breakers and caches, advanced by setting ``now``."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSubscriptionsAPI:
+    """Handler of a MemoryTransport serving the subscriptions of project 1 from ``subscriptions``, by id.
+
+    Lists are paginated and filtered by tags; the requested pages are kept in
+    ``pages`` and the updates in ``patches``. The ids in ``failing`` answer 422.
+    """
+
+    def __init__(self, *subscriptions):
+        self.subscriptions = {item["id"]: dict(item) for item in subscriptions}
+        self.pages = []
+        self.patches = []
+        self.failing = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        path = request.url.split("/api/v1")[1]
+        with self.lock:
+            if path == "/projects/1/subscriptions":
+                return self.list(request.params)
+            id = int(path.rsplit("/", 1)[1])
+            if id in self.failing:
+                return pushpad.MemoryResponse(422, content=b"Invalid")
+            if id not in self.subscriptions:
+                return pushpad.MemoryResponse(404, content=b"Not found")
+            if request.method == "PATCH":
+                self.patches.append((id, request.json()))
+                self.subscriptions[id].update(request.json())
+            return pushpad.MemoryResponse(200, json=self.subscriptions[id])
+
+    def list(self, params):
+        page, per_page = int(params["page"]), int(params["per_page"])
+        self.pages.append(page)
+        tags = params.get("tags[]")
+        matching = [item for item in self.subscriptions.values() if not tags or set(tags) & set(item["tags"])]
+        items = matching[(page - 1) * per_page : page * per_page]
+        return pushpad.MemoryResponse(200, json=items, headers={"X-Total-Count": str(len(matching))})
+
+
+def sent_json(call):
+    """Decode the JSON payload of a request recorded by a dummy session."""
+    body = call[1].get("data", call[1].get("content"))
+    return json.loads(body) if body is not None else None
+
+
 class DummySession:
     def __init__(self):
         self.headers = {}
@@ -31,11 +87,28 @@ class DummySession:
         pass
 
 
-def make_client(token, project_id=None, response=None):
+class AsyncDummySession:
+    def __init__(self):
+        self.headers = {}
+        self.request = mock.AsyncMock()
+        self.build_request = mock.Mock()
+        self.send = mock.AsyncMock()
+        self.aclose = mock.AsyncMock()
+
+
+def make_client(token, project_id=None, response=None, **options):
     session = DummySession()
     if response is not None:
         session.request.return_value = response
-    client = pushpad.Pushpad(token, project_id, session=session)
+    client = pushpad.Pushpad(token, project_id, session=session, **options)
+    return client, session
+
+
+def make_async_client(token, project_id=None, response=None, **options):
+    session = AsyncDummySession()
+    if response is not None:
+        session.request.return_value = response
+    client = pushpad.AsyncPushpad(token, project_id, session=session, **options)
     return client, session
 
 
@@ -43,3 +116,17 @@ class BasePushpadTestCase(unittest.TestCase):
     def setUp(self):
         self.token = "5374d7dfeffa2eb49965624ba7596a09"
         self.project_id = 1
+
+
+class LocalServerTestCase(BasePushpadTestCase):
+    """Test case serving ``handler`` over HTTP on a free local port, at ``self.base_url``."""
+
+    handler = None
+
+    def setUp(self):
+        super().setUp()
+        server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.base_url = f"http://127.0.0.1:{server.server_address[1]}"
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
-from ..helpers import BasePushpadTestCase, make_client, make_response
+import json
+
+from pushpad import PushpadAPIError
+
+from ..helpers import BasePushpadTestCase, make_client, make_response, sent_json
 
 
 class NotificationsResourceTests(BasePushpadTestCase):
@@ -11,7 +15,7 @@ class NotificationsResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "POST")
         self.assertIn("/projects/1/notifications", url)
-        self.assertEqual(session.request.call_args[1]["json"], {"body": "Hello"})
+        self.assertEqual(sent_json(session.request.call_args), {"body": "Hello"})
 
     def test_notifications_send_is_create_alias(self):
         client, _ = make_client(self.token, self.project_id)
@@ -20,6 +24,66 @@ class NotificationsResourceTests(BasePushpadTestCase):
             client.notifications.create.__func__,
         )
 
+    def test_notifications_create_many_keeps_order_and_errors(self):
+        client, session = make_client(self.token, self.project_id)
+
+        def respond(method, url, data=None, **kwargs):
+            payload = json.loads(data)
+            if payload["body"] == "fail":
+                return make_response(status=422, payload={"error": "Invalid"})
+            return make_response(payload={"id": int(payload["body"]), "scheduled": 1})
+
+        session.request.side_effect = respond
+        payloads = [{"body": "1", "uids": ["a"]}, {"body": "fail"}, {"body": "3", "tags": ["t"]}]
+        results = client.notifications.create_many(payloads, concurrency=3)
+        self.assertEqual(results[0].id, 1)
+        self.assertIsInstance(results[1], PushpadAPIError)
+        self.assertEqual(results[1].status_code, 422)
+        self.assertEqual(results[2].id, 3)
+        self.assertEqual(session.request.call_count, 3)
+
+    def test_notifications_create_many_uses_project_id(self):
+        response = make_response(payload={"id": 5})
+        client, session = make_client(self.token, response=response)
+        client.notifications.create_many([{"body": "Hello"}], project_id=9)
+        self.assertTrue(session.request.call_args[0][1].endswith("/projects/9/notifications"))
+
+    def test_notifications_create_chunked_combines_results(self):
+        client, session = make_client(self.token, self.project_id)
+
+        def respond(method, url, data=None, **kwargs):
+            payload = json.loads(data)
+            if payload["uids"] == ["u5"]:
+                return make_response(status=500, payload={"error": "Oops"})
+            subscribed = [uid for uid in payload["uids"] if uid != "u2"]
+            id = int(payload["uids"][0][1:])
+            return make_response(payload={"id": id, "scheduled": len(subscribed), "uids": subscribed})
+
+        session.request.side_effect = respond
+        result = client.notifications.create_chunked(
+            body="Hello",
+            tags=["events"],
+            uids=["u1", "u2", "u3", "u4", "u5"],
+            chunk_size=2,
+        )
+        self.assertEqual(result.ids, [1, 3])
+        self.assertEqual(result.scheduled, 3)
+        self.assertEqual(result.uids, ["u1", "u3", "u4"])
+        self.assertEqual(result.failed_uids, ["u5"])
+        self.assertEqual(result.unreachable_uids, ["u2"])
+        self.assertEqual(len(result.errors), 1)
+        sent = sorted(sent_json(call)["uids"] for call in session.request.call_args_list)
+        self.assertEqual(sent, [["u1", "u2"], ["u3", "u4"], ["u5"]])
+        for call in session.request.call_args_list:
+            self.assertEqual(sent_json(call)["tags"], ["events"])
+            self.assertEqual(sent_json(call)["body"], "Hello")
+
+    def test_notifications_create_chunked_rejects_invalid_chunk_size(self):
+        client, session = make_client(self.token, self.project_id)
+        with self.assertRaises(ValueError):
+            client.notifications.create_chunked(body="Hello", uids=["u1"], chunk_size=0)
+        session.request.assert_not_called()
+
     def test_notifications_requires_project(self):
         client, session = make_client(self.token)
         with self.assertRaises(ValueError):
@@ -35,6 +99,18 @@ class NotificationsResourceTests(BasePushpadTestCase):
         kwargs = session.request.call_args[1]
         self.assertEqual(kwargs["params"], {"page": 2})
 
+    def test_notifications_iter_all_follows_pages(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "3"}
+        client, session = make_client(self.token, self.project_id)
+        session.request.side_effect = [
+            make_response(payload=[{"id": 1}, {"id": 2}], headers=headers),
+            make_response(payload=[{"id": 3}], headers=headers),
+        ]
+        ids = [notification.id for notification in client.notifications.iter_all()]
+        self.assertEqual(ids, [1, 2, 3])
+        pages = [call[1]["params"]["page"] for call in session.request.call_args_list]
+        self.assertEqual(pages, [1, 2])
+
     def test_notifications_get(self):
         response = make_response(payload={"id": 77})
         client, session = make_client(self.token, self.project_id, response)
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from ..helpers import BasePushpadTestCase, make_client, make_response
+from ..helpers import BasePushpadTestCase, make_client, make_response, sent_json
 
 
 class ProjectsResourceTests(BasePushpadTestCase):
@@ -16,7 +16,7 @@ class ProjectsResourceTests(BasePushpadTestCase):
         self.assertEqual(method, "POST")
         self.assertTrue(url.endswith("/projects"))
         self.assertEqual(
-            session.request.call_args[1]["json"],
+            sent_json(session.request.call_args),
             {"sender_id": 99, "name": "Demo", "website": "https://example.com"},
         )
 
@@ -77,7 +77,7 @@ class ProjectsResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "PATCH")
         self.assertTrue(url.endswith("/projects/4"))
-        self.assertEqual(session.request.call_args[1]["json"], {"name": "Demo"})
+        self.assertEqual(sent_json(session.request.call_args), {"name": "Demo"})
 
     def test_projects_delete(self):
         response = make_response(status=202)
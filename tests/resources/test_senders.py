@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from ..helpers import BasePushpadTestCase, make_client, make_response
+from ..helpers import BasePushpadTestCase, make_client, make_response, sent_json
 
 
 class SendersResourceTests(BasePushpadTestCase):
@@ -11,7 +11,7 @@ class SendersResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "POST")
         self.assertTrue(url.endswith("/senders"))
-        self.assertEqual(session.request.call_args[1]["json"], {"name": "News"})
+        self.assertEqual(sent_json(session.request.call_args), {"name": "News"})
 
     def test_senders_all(self):
         response = make_response(payload=[{"id": 1}])
@@ -56,7 +56,7 @@ class SendersResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "PATCH")
         self.assertTrue(url.endswith("/senders/55"))
-        self.assertEqual(session.request.call_args[1]["json"], {"name": "Acme"})
+        self.assertEqual(sent_json(session.request.call_args), {"name": "Acme"})
 
     def test_senders_delete(self):
         response = make_response(status=204)
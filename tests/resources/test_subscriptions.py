@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
-from ..helpers import BasePushpadTestCase, make_client, make_response
+import sys
+
+from pushpad.types import LazySubscription, Subscription
+
+from ..helpers import BasePushpadTestCase, make_client, make_response, sent_json
 
 
 class SubscriptionsResourceTests(BasePushpadTestCase):
@@ -15,7 +19,7 @@ class SubscriptionsResourceTests(BasePushpadTestCase):
         self.assertEqual(method, "POST")
         self.assertIn("/projects/1/subscriptions", url)
         self.assertEqual(
-            session.request.call_args[1]["json"],
+            sent_json(session.request.call_args),
             {"endpoint": "https://pushpad.example/endpoint", "uid": "u1"},
         )
 
@@ -77,7 +81,7 @@ class SubscriptionsResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "PATCH")
         self.assertTrue(url.endswith("/projects/1/subscriptions/33"))
-        self.assertEqual(session.request.call_args[1]["json"], {"tags": ["a"]})
+        self.assertEqual(sent_json(session.request.call_args), {"tags": ["a"]})
 
     def test_subscriptions_update_can_set_fields_to_null(self):
         response = make_response(payload={"id": 33, "uid": None})
@@ -87,7 +91,7 @@ class SubscriptionsResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "PATCH")
         self.assertTrue(url.endswith("/projects/1/subscriptions/33"))
-        self.assertEqual(session.request.call_args[1]["json"], {"uid": None})
+        self.assertEqual(sent_json(session.request.call_args), {"uid": None})
 
     def test_subscriptions_delete(self):
         response = make_response(status=204)
@@ -96,3 +100,81 @@ class SubscriptionsResourceTests(BasePushpadTestCase):
         method, url = session.request.call_args[0]
         self.assertEqual(method, "DELETE")
         self.assertTrue(url.endswith("/projects/1/subscriptions/44"))
+
+    def test_subscriptions_iter_all_follows_pages(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "3"}
+        client, session = make_client(self.token, self.project_id)
+        session.request.side_effect = [
+            make_response(payload=[{"id": 1}, {"id": 2}], headers=headers),
+            make_response(payload=[{"id": 3}], headers=headers),
+        ]
+        ids = [subscription.id for subscription in client.subscriptions.iter_all(per_page=2, tags=["paid"])]
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual(session.request.call_count, 2)
+        params = session.request.call_args[1]["params"]
+        self.assertEqual(params, {"page": 2, "per_page": 2, "tags[]": ["paid"]})
+
+    def test_subscriptions_iter_all_is_lazy(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "4"}
+        client, session = make_client(self.token, self.project_id)
+        session.request.return_value = make_response(payload=[{"id": 1}, {"id": 2}], headers=headers)
+        iterator = client.subscriptions.iter_all()
+        session.request.assert_not_called()
+        next(iterator)
+        self.assertEqual(session.request.call_count, 1)
+
+    def test_subscriptions_iter_all_stops_on_empty_page(self):
+        client, session = make_client(self.token, self.project_id)
+        session.request.side_effect = [
+            make_response(payload=[{"id": 1}]),
+            make_response(payload=[]),
+        ]
+        self.assertEqual([s.id for s in client.subscriptions.iter_all()], [1])
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_subscriptions_export_fetches_all_pages_in_order(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "5"}
+        client, session = make_client(self.token, self.project_id)
+
+        def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            ids = [i for i in range(1, 6)][(page - 1) * 2 : page * 2]
+            return make_response(payload=[{"id": i} for i in ids], headers=headers)
+
+        session.request.side_effect = respond
+        ids = [s.id for s in client.subscriptions.export(per_page=2, workers=3, tags=["paid"])]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+        pages = sorted(call[1]["params"]["page"] for call in session.request.call_args_list)
+        self.assertEqual(pages, [1, 2, 3])
+        for call in session.request.call_args_list:
+            self.assertEqual(call[1]["params"]["tags[]"], ["paid"])
+            self.assertEqual(call[1]["params"]["per_page"], 2)
+
+    def test_subscriptions_export_requires_total_count(self):
+        response = make_response(payload=[{"id": 1}])
+        client, _ = make_client(self.token, self.project_id, response)
+        with self.assertRaises(ValueError):
+            list(client.subscriptions.export())
+
+    def test_subscriptions_lazy_models(self):
+        payload = [{"id": 1, "uid": "u1", "tags": ["paid"]}, {"id": 2}]
+        response = make_response(payload=payload)
+        client, _ = make_client(self.token, self.project_id, response, lazy_models=True)
+        subscriptions = client.subscriptions.all()
+        self.assertIsInstance(subscriptions[0], LazySubscription)
+        self.assertFalse(hasattr(subscriptions[0], "__dict__"))
+        self.assertLess(sys.getsizeof(subscriptions[0]), sys.getsizeof(Subscription.from_api(payload[0])))
+        self.assertEqual(subscriptions[0], LazySubscription(payload[0]))
+        self.assertNotEqual(subscriptions[0], Subscription.from_api(payload[0]))
+        self.assertEqual(subscriptions[0].uid, "u1")
+        self.assertEqual(subscriptions[0].tags, ["paid"])
+        self.assertIsNone(subscriptions[1].uid)
+        subscriptions[1].uid = "u2"
+        self.assertEqual(subscriptions[1].uid, "u2")
+
+    def test_subscriptions_models_are_slotted(self):
+        response = make_response(payload={"id": 22})
+        client, _ = make_client(self.token, self.project_id, response)
+        subscription = client.subscriptions.get(22)
+        self.assertIs(type(subscription), Subscription)
+        self.assertFalse(hasattr(subscription, "__dict__"))
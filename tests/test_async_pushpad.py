@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pushpad import AsyncPushpad, PushpadAPIError
+
+from tests.helpers import make_async_client, make_response, sent_json
+
+TOKEN = "5374d7dfeffa2eb49965624ba7596a09"
+
+
+class AsyncPushpadClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_signature_for(self):
+        client, _ = make_async_client(TOKEN, 1)
+        self.assertEqual(
+            client.signature_for("user12345"),
+            "6627820dab00a1971f2a6d3ff16a5ad8ba4048a02b2d402820afc61aefd0b69f",
+        )
+
+    async def test_sets_default_headers(self):
+        _, session = make_async_client(TOKEN, 1)
+        self.assertEqual(session.headers["Authorization"], f"Bearer {TOKEN}")
+        self.assertEqual(session.headers["Content-Type"], "application/json")
+
+    async def test_error_response(self):
+        response = make_response(status=403, payload={"error": "Forbidden"})
+        response.reason_phrase = "Forbidden"
+        client, _ = make_async_client(TOKEN, 1, response)
+        with self.assertRaises(PushpadAPIError) as ctx:
+            await client.notifications.all()
+        self.assertEqual(ctx.exception.status_code, 403)
+        self.assertEqual(ctx.exception.reason, "Forbidden")
+
+    async def test_notifications_create(self):
+        response = make_response(payload={"id": 123, "scheduled": 10})
+        client, session = make_async_client(TOKEN, 1, response)
+        result = await client.notifications.send(body="Hello", uids=["u1"])
+        self.assertEqual(result.id, 123)
+        self.assertEqual(result.scheduled, 10)
+        method, url = session.request.call_args[0]
+        self.assertEqual(method, "POST")
+        self.assertTrue(url.endswith("/projects/1/notifications"))
+        self.assertEqual(sent_json(session.request.call_args), {"body": "Hello", "uids": ["u1"]})
+
+    async def test_notifications_create_many(self):
+        client, session = make_async_client(TOKEN, 1)
+        session.request.side_effect = [
+            make_response(payload={"id": 1}),
+            make_response(status=500, payload={"error": "Oops"}),
+        ]
+        results = await client.notifications.create_many([{"body": "a"}, {"body": "b"}], concurrency=1)
+        self.assertEqual(results[0].id, 1)
+        self.assertIsInstance(results[1], PushpadAPIError)
+
+    async def test_subscriptions_count_uses_header(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "42"}
+        response = make_response(payload=[], headers=headers)
+        client, session = make_async_client(TOKEN, 1, response)
+        self.assertEqual(await client.subscriptions.count(tags=["paid"]), 42)
+        self.assertEqual(session.request.call_args[1]["params"], {"tags[]": ["paid"], "per_page": 1})
+
+    async def test_subscriptions_iter_all_follows_pages(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "3"}
+        client, session = make_async_client(TOKEN, 1)
+        session.request.side_effect = [
+            make_response(payload=[{"id": 1}, {"id": 2}], headers=headers),
+            make_response(payload=[{"id": 3}], headers=headers),
+        ]
+        ids = [subscription.id async for subscription in client.subscriptions.iter_all(per_page=2)]
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual(session.request.call_count, 2)
+
+    async def test_subscriptions_export_fetches_all_pages_in_order(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "5"}
+        client, session = make_async_client(TOKEN, 1)
+
+        async def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            ids = list(range(1, 6))[(page - 1) * 2 : page * 2]
+            return make_response(payload=[{"id": i} for i in ids], headers=headers)
+
+        session.request.side_effect = respond
+        ids = [s.id async for s in client.subscriptions.export(per_page=2, concurrency=2)]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+        self.assertEqual(session.request.call_count, 3)
+
+    async def test_subscriptions_export_table(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "3"}
+        client, session = make_async_client(TOKEN, 1)
+
+        async def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            ids = list(range(1, 4))[(page - 1) * 2 : page * 2]
+            return make_response(payload=[{"id": i, "tags": ["paid"]} for i in ids], headers=headers)
+
+        session.request.side_effect = respond
+        table = await client.subscriptions.export_table(per_page=2)
+        self.assertEqual(list(table.ids), [1, 2, 3])
+        self.assertEqual(table.tag_counts(), {"paid": 3})
+
+    async def test_subscriptions_update(self):
+        response = make_response(payload={"id": 33, "tags": ["a"]})
+        client, session = make_async_client(TOKEN, 1, response)
+        subscription = await client.subscriptions.update(33, tags=["a"])
+        self.assertEqual(subscription.tags, ["a"])
+        method, url = session.request.call_args[0]
+        self.assertEqual(method, "PATCH")
+        self.assertTrue(url.endswith("/projects/1/subscriptions/33"))
+
+    async def test_projects_and_senders_delete(self):
+        response = make_response(status=204)
+        client, session = make_async_client(TOKEN, response=response)
+        self.assertIsNone(await client.projects.delete(5))
+        self.assertTrue(session.request.call_args[0][1].endswith("/projects/5"))
+        self.assertIsNone(await client.senders.delete(6))
+        self.assertTrue(session.request.call_args[0][1].endswith("/senders/6"))
+
+    async def test_context_manager_closes_session(self):
+        client, session = make_async_client(TOKEN, 1)
+        async with client:
+            pass
+        session.aclose.assert_awaited_once()
+
+    async def test_requires_auth_token(self):
+        with self.assertRaises(ValueError):
+            AsyncPushpad("")
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pushpad import (
+    AsyncMemoryTransport,
+    AsyncPushpad,
+    BulkUpdateResult,
+    MemoryTransport,
+    Pushpad,
+    PushpadAPIError,
+    RetryPolicy,
+)
+
+from tests.helpers import FakeSubscriptionsAPI
+
+
+def subscription(id, tags, uid=None):
+    return {"id": id, "uid": uid, "tags": tags}
+
+
+class BulkUpdateTests(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeSubscriptionsAPI(
+            subscription(1, ["sports"]),
+            subscription(2, ["sports", "news"]),
+            subscription(3, ["sports", "trial"]),
+            subscription(4, ["travel"]),
+            subscription(5, ["sports", "paid"]),
+        )
+        self.client = Pushpad("token", 1, transport=MemoryTransport(self.api), retry=RetryPolicy(max_attempts=1))
+
+    def test_filter_with_tag_changes(self):
+        result = self.client.subscriptions.bulk_update(
+            tags=["sports"], add_tags=["paid"], remove_tags="trial", per_page=2, concurrency=3
+        )
+        self.assertIsInstance(result, BulkUpdateResult)
+        self.assertEqual(sorted(result.updated), [1, 2, 3])
+        self.assertEqual(result.unchanged, [5])
+        self.assertEqual(result.errors, {})
+        self.assertEqual(result.updated[3].tags, ["sports", "paid"])
+        self.assertEqual(self.api.subscriptions[2]["tags"], ["sports", "news", "paid"])
+        self.assertEqual(self.api.subscriptions[4]["tags"], ["travel"])
+        self.assertEqual(result.outcome(5), "unchanged")
+        self.assertIsNone(result.outcome(4))
+
+    def test_removing_the_filter_tag_updates_every_page(self):
+        result = self.client.subscriptions.bulk_update(tags=["sports"], remove_tags=["sports"], per_page=2)
+        self.assertEqual(sorted(result.updated), [1, 2, 3, 5])
+        self.assertFalse(any("sports" in item["tags"] for item in self.api.subscriptions.values()))
+
+    def test_ids_are_fetched_and_only_changed_fields_are_sent(self):
+        self.api.failing.add(3)
+        result = self.client.subscriptions.bulk_update(ids=[4, 3, 1, 9], uid="user-1", add_tags=["travel"])
+        self.assertEqual(sorted(result.updated), [1, 4])
+        expected = [(1, {"tags": ["sports", "travel"], "uid": "user-1"}), (4, {"uid": "user-1"})]
+        self.assertEqual(sorted(self.api.patches), expected)
+        self.assertEqual(result.outcome(3), "failed")
+        self.assertEqual(result.errors[3].status_code, 422)
+        self.assertIsInstance(result.errors[9], PushpadAPIError)
+        self.assertEqual(result.errors[9].status_code, 404)
+
+    def test_no_op_updates_are_skipped(self):
+        result = self.client.subscriptions.bulk_update(ids=[4], add_tags=["travel"], remove_tags=["sports"])
+        self.assertEqual(result.unchanged, [4])
+        self.assertEqual(self.api.patches, [])
+
+    def test_invalid_arguments(self):
+        bulk_update = self.client.subscriptions.bulk_update
+        with self.assertRaises(ValueError):
+            bulk_update(add_tags=["a"])
+        with self.assertRaises(ValueError):
+            bulk_update(ids=[1], tags=["sports"], add_tags=["a"])
+        with self.assertRaises(ValueError):
+            bulk_update(ids=[1], add_tags=["a"], remove_tags=["a"])
+        with self.assertRaises(ValueError):
+            bulk_update(ids=[1])
+        with self.assertRaises(TypeError):
+            bulk_update(ids=["3"], add_tags="b")
+        for filters in ({"uids": []}, {"tags": []}, {"uids": [], "tags": []}, {"ids": []}, {"ids": iter(())}):
+            with self.assertRaises(ValueError):
+                bulk_update(add_tags=["x"], **filters)
+        self.assertEqual(self.api.patches, [])
+        self.assertEqual(self.api.pages, [])
+
+    def test_integer_like_ids_are_accepted(self):
+        class Id:
+            def __index__(self):
+                return 4
+
+        result = self.client.subscriptions.bulk_update(ids=[Id()], uid="user-4")
+        self.assertEqual(list(result.updated), [4])
+
+
+class AsyncBulkUpdateTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bulk_update(self):
+        api = FakeSubscriptionsAPI(subscription(1, ["a"]), subscription(2, ["a", "b"]), subscription(3, ["c"]))
+        client = AsyncPushpad("token", 1, transport=AsyncMemoryTransport(api))
+        result = await client.subscriptions.bulk_update(tags=["a"], add_tags=["b"], per_page=1)
+        self.assertEqual(list(result.updated), [1])
+        self.assertEqual(result.unchanged, [2])
+        result = await client.subscriptions.bulk_update(ids=[3, 1], uid=None, remove_tags=["c"])
+        self.assertEqual(list(result.updated), [3])
+        self.assertEqual(api.patches[-1], (3, {"tags": []}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+import unittest
+
+from pushpad import CacheStats, Project, PushpadAPIError, ResponseCache
+
+from tests.helpers import BasePushpadTestCase, FakeClock, make_async_client, make_client, make_response
+
+
+def wait_for_refresh(cache):
+    deadline = time.monotonic() + 2
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.fetched = 0
+
+    def fetch(self):
+        self.fetched += 1
+        return {"id": 1, "version": self.fetched}
+
+    def test_fresh_and_expired(self):
+        cache = ResponseCache(ttl=10, clock=self.clock)
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 1)
+        self.clock.now = 9
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 1)
+        self.clock.now = 10
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 2)
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=2, size=1))
+
+    def test_ttl_per_resource(self):
+        cache = ResponseCache(ttl=10, ttls={"notifications": 1, "senders": 0}, clock=self.clock)
+        cache.get("notifications", 1, self.fetch)
+        cache.get("senders", 1, self.fetch)
+        self.clock.now = 2
+        cache.get("notifications", 1, self.fetch)
+        cache.get("senders", 1, self.fetch)
+        self.assertEqual(self.fetched, 4)
+        with self.assertRaises(ValueError):
+            ResponseCache(ttls={"subscriptions": 1})
+
+    def test_least_recently_used_are_evicted(self):
+        cache = ResponseCache(maxsize=2, clock=self.clock)
+        cache.get("projects", 1, self.fetch)
+        cache.get("projects", 2, self.fetch)
+        cache.get("projects", 1, self.fetch)
+        cache.get("projects", 3, self.fetch)
+        cache.get("projects", 1, self.fetch)
+        cache.get("projects", 2, self.fetch)
+        self.assertEqual(self.fetched, 4)
+        self.assertEqual(cache.stats().evictions, 2)
+        self.assertEqual(cache.stats().size, 2)
+
+    def test_stale_while_revalidate(self):
+        cache = ResponseCache(ttl=10, stale_while_revalidate=5, clock=self.clock)
+        cache.get("projects", 1, self.fetch)
+        self.clock.now = 12
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 1)
+        wait_for_refresh(cache)
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 2)
+        self.assertEqual(cache.stats().stale_hits, 1)
+        self.assertEqual(cache.stats().refreshes, 1)
+        self.clock.now = 30
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 3)
+
+    def test_failed_refresh_keeps_stale_value(self):
+        cache = ResponseCache(ttl=10, stale_while_revalidate=5, clock=self.clock)
+        cache.get("projects", 1, self.fetch)
+        self.clock.now = 11
+
+        def fail():
+            raise PushpadAPIError(503)
+
+        cache.get("projects", 1, fail)
+        wait_for_refresh(cache)
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 1)
+        self.assertEqual(cache.stats().refresh_errors, 1)
+
+    def test_invalidation_discards_responses_fetched_before(self):
+        cache = ResponseCache(ttl=10, stale_while_revalidate=5, clock=self.clock)
+        cache.get("projects", 1, self.fetch)
+        self.clock.now = 11
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch():
+            started.set()
+            release.wait(2)
+            return {"id": 1, "version": "old"}
+
+        cache.get("projects", 1, slow_fetch)
+        started.wait(2)
+        cache.invalidate("projects", 1)
+        release.set()
+        wait_for_refresh(cache)
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 2)
+
+    def test_returned_data_is_a_copy(self):
+        cache = ResponseCache(clock=self.clock)
+        cache.get("projects", 1, self.fetch)["version"] = "changed"
+        cache.get("projects", 1, self.fetch)["version"] = "changed"
+        self.assertEqual(cache.get("projects", 1, self.fetch)["version"], 1)
+
+    def test_clear(self):
+        cache = ResponseCache(clock=self.clock)
+        cache.get("projects", 1, self.fetch)
+        cache.get("senders", 1, self.fetch)
+        cache.clear()
+        self.assertEqual(cache.stats().size, 0)
+        self.assertEqual(cache.stats().invalidations, 2)
+
+
+class ClientCacheTests(BasePushpadTestCase):
+    def test_get_is_cached(self):
+        response = make_response(payload={"id": 3, "name": "My project"})
+        client, session = make_client(self.token, response=response, cache=ResponseCache())
+        self.assertIsInstance(client.projects.get(3), Project)
+        self.assertEqual(client.projects.get(3).name, "My project")
+        self.assertEqual(session.request.call_count, 1)
+        self.assertEqual(client.cache.stats().hits, 1)
+
+    def test_update_and_delete_invalidate(self):
+        response = make_response(payload={"id": 3, "name": "My sender"})
+        client, session = make_client(self.token, response=response, cache=ResponseCache())
+        client.senders.get(3)
+        client.senders.update(3, name="Renamed")
+        client.senders.get(3)
+        self.assertEqual(session.request.call_count, 3)
+        client.senders.get(3)
+        client.senders.delete(3)
+        client.senders.get(3)
+        self.assertEqual(session.request.call_count, 5)
+
+    def test_cancel_invalidates_notification(self):
+        response = make_response(payload={"id": 5, "body": "Hello"})
+        client, session = make_client(self.token, response=response, cache=ResponseCache())
+        client.notifications.get(5)
+        client.notifications.get(5)
+        client.notifications.cancel(5)
+        client.notifications.get(5)
+        self.assertEqual(session.request.call_count, 3)
+
+    def test_errors_are_not_cached(self):
+        client, session = make_client(self.token, cache=ResponseCache())
+        session.request.side_effect = [make_response(status=404), make_response(payload={"id": 3})]
+        with self.assertRaises(PushpadAPIError):
+            client.projects.get(3)
+        self.assertEqual(client.projects.get(3).id, 3)
+
+    def test_lazy_models_do_not_change_the_cache(self):
+        response = make_response(payload={"id": 3, "name": "My project"})
+        client, _ = make_client(self.token, response=response, cache=ResponseCache(), lazy_models=True)
+        client.projects.get(3).name = "Changed"
+        self.assertEqual(client.projects.get(3).name, "My project")
+
+
+    def test_changing_a_list_field_does_not_change_the_cache(self):
+        response = make_response(payload={"id": 1, "uids": ["u1"], "actions": [{"title": "Open"}]})
+        client, _ = make_client(self.token, self.project_id, response=response, cache=ResponseCache())
+        notification = client.notifications.get(1)
+        notification.uids.append("x")
+        notification.actions[0]["title"] = "Changed"
+        cached = client.notifications.get(1)
+        self.assertEqual(cached.uids, ["u1"])
+        self.assertEqual(cached.actions, [{"title": "Open"}])
+        cached.uids.append("y")
+        self.assertEqual(client.notifications.get(1).uids, ["u1"])
+
+
+class AsyncClientCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_get_is_cached_and_refreshed(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, stale_while_revalidate=5, clock=clock)
+        client, session = make_async_client("token", 1, cache=cache)
+        session.request.side_effect = [make_response(payload={"id": 3, "name": name}) for name in ("a", "b")]
+        self.assertEqual((await client.projects.get(3)).name, "a")
+        clock.now = 11
+        self.assertEqual((await client.projects.get(3)).name, "a")
+        await asyncio.gather(*cache._tasks)
+        self.assertEqual((await client.projects.get(3)).name, "b")
+        self.assertEqual(session.request.call_count, 2)
+
+    async def test_update_invalidates(self):
+        client, session = make_async_client("token", 1, make_response(payload={"id": 3}), cache=ResponseCache())
+        await client.projects.get(3)
+        await client.projects.update(3, name="Renamed")
+        await client.projects.get(3)
+        self.assertEqual(session.request.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+
+import requests
+
+from pushpad import CircuitBreaker, CircuitOpenError, CircuitState, PushpadAPIError, PushpadClientError
+
+from tests.helpers import BasePushpadTestCase, FakeClock, make_async_client, make_client, make_response
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=0.5,
+            minimum_calls=4,
+            window=4,
+            recovery_timeout=10,
+            clock=self.clock,
+        )
+
+    def test_opens_when_failure_rate_reaches_threshold(self):
+        for outcome in (True, False, True):
+            self.breaker.record_success() if outcome else self.breaker.record_failure()
+        self.assertIs(self.breaker.state, CircuitState.CLOSED)
+        self.breaker.record_failure()
+        self.assertIs(self.breaker.state, CircuitState.OPEN)
+        self.assertEqual(self.breaker.failure_rate, 0.5)
+        with self.assertRaises(CircuitOpenError) as ctx:
+            self.breaker.before_request()
+        self.assertEqual(ctx.exception.retry_after, 10)
+
+    def test_half_open_probe_closes_circuit(self):
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        self.assertIs(self.breaker.state, CircuitState.HALF_OPEN)
+        self.breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+        self.breaker.record_success()
+        self.assertIs(self.breaker.state, CircuitState.CLOSED)
+        self.assertEqual(self.breaker.failure_rate, 0)
+
+    def test_half_open_probe_failure_reopens_circuit(self):
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.before_request()
+        self.breaker.record_failure()
+        self.assertIs(self.breaker.state, CircuitState.OPEN)
+
+    def test_half_open_closes_after_enough_successful_probes(self):
+        breaker = CircuitBreaker(
+            minimum_calls=1, window=1, recovery_timeout=10, half_open_max_calls=2, clock=self.clock
+        )
+        breaker.record_failure()
+        self.clock.now += 10
+        breaker.before_request()
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_success()
+        self.assertIs(breaker.state, CircuitState.HALF_OPEN)
+        breaker.record_success()
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+
+    def test_released_probe_can_be_taken_again(self):
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.before_request()
+        self.breaker.release()
+        self.breaker.before_request()
+        self.assertIs(self.breaker.state, CircuitState.HALF_OPEN)
+
+    def test_open_error_is_a_client_error(self):
+        self.assertTrue(issubclass(CircuitOpenError, PushpadClientError))
+
+
+class ClientCircuitBreakerTests(BasePushpadTestCase):
+    def test_fails_fast_when_open(self):
+        breaker = CircuitBreaker(minimum_calls=2, window=2)
+        client, session = make_client(self.token, self.project_id, circuit_breaker=breaker)
+        session.request.side_effect = [requests.ConnectionError("down"), make_response(status=503, payload={})]
+        with self.assertRaises(PushpadClientError):
+            client.projects.get(1)
+        with self.assertRaises(PushpadAPIError):
+            client.projects.get(1)
+        self.assertIs(client.circuit_breaker.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            client.projects.get(1)
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_interrupted_probe_is_released(self):
+        breaker = CircuitBreaker(minimum_calls=1, window=1, recovery_timeout=0)
+        client, session = make_client(self.token, self.project_id, circuit_breaker=breaker)
+        session.request.side_effect = [
+            requests.ConnectionError("down"),
+            RuntimeError("unexpected"),
+            make_response(payload={"id": 1}),
+        ]
+        with self.assertRaises(PushpadClientError):
+            client.projects.get(1)
+        with self.assertRaises(RuntimeError):
+            client.projects.get(1)
+        self.assertEqual(client.projects.get(1).id, 1)
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+
+    def test_client_errors_do_not_open_the_circuit(self):
+        breaker = CircuitBreaker(minimum_calls=1, window=1)
+        response = make_response(status=404, payload={})
+        client, _ = make_client(self.token, self.project_id, response, circuit_breaker=breaker)
+        with self.assertRaises(PushpadAPIError):
+            client.projects.get(1)
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+
+
+class AsyncClientCircuitBreakerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_probe_is_released(self):
+        breaker = CircuitBreaker(minimum_calls=1, window=1, recovery_timeout=0)
+        client, session = make_async_client("token", 1, circuit_breaker=breaker)
+        responses = [make_response(status=503, payload={}), None, make_response(payload={"id": 1})]
+
+        async def request(*args, **kwargs):
+            response = responses.pop(0)
+            if response is None:
+                await asyncio.sleep(10)
+            return response
+
+        session.request.side_effect = request
+        with self.assertRaises(PushpadAPIError):
+            await client.projects.get(1)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.projects.get(1), 0.01)
+        self.assertEqual((await client.projects.get(1)).id, 1)
+        self.assertIs(breaker.state, CircuitState.CLOSED)
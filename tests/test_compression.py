@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+from pushpad import CompressionStats, Pushpad
+
+from tests.helpers import BasePushpadTestCase, LocalServerTestCase, make_client, make_response, sent_json
+
+UIDS = [f"user-{i}" for i in range(200)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        _Handler.received.append(json.loads(body))
+        self._respond({"id": 1, "scheduled": 200})
+
+    def do_GET(self):
+        self._respond([{"id": i, "uid": uid} for i, uid in enumerate(UIDS)])
+
+    def _respond(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class CompressionTests(BasePushpadTestCase):
+    def test_large_bodies_are_gzipped(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response, compression="gzip")
+        client.notifications.create(body="Hello", uids=UIDS)
+        kwargs = session.request.call_args[1]
+        self.assertEqual(kwargs["headers"], {"Content-Encoding": "gzip"})
+        self.assertEqual(json.loads(gzip.decompress(kwargs["data"])), {"body": "Hello", "uids": UIDS})
+
+    def test_small_bodies_are_not_compressed(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response, compression="gzip")
+        client.notifications.create(body="Hello")
+        self.assertIsNone(session.request.call_args[1]["headers"])
+        self.assertEqual(sent_json(session.request.call_args), {"body": "Hello"})
+        self.assertEqual(client.compression_stats().requests_compressed, 0)
+
+    def test_compression_is_disabled_by_default(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response)
+        client.notifications.create(body="Hello", uids=UIDS)
+        self.assertIsNone(session.request.call_args[1]["headers"])
+        self.assertEqual(sent_json(session.request.call_args)["uids"], UIDS)
+        self.assertIn("gzip", session.headers["Accept-Encoding"])
+
+    @unittest.skipIf(brotli is None, "brotli is not installed")
+    def test_brotli(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response, compression="br")
+        client.notifications.create(body="Hello", uids=UIDS)
+        kwargs = session.request.call_args[1]
+        self.assertEqual(kwargs["headers"], {"Content-Encoding": "br"})
+        self.assertEqual(json.loads(brotli.decompress(kwargs["data"]))["uids"], UIDS)
+        self.assertIn("br", session.headers["Accept-Encoding"])
+
+    def test_unsupported_compression(self):
+        with self.assertRaises(ValueError):
+            make_client(self.token, compression="zstd")
+
+    def test_stats(self):
+        response = make_response(payload={"id": 1})
+        response.headers = {"Content-Encoding": "gzip", "Content-Length": "10"}
+        client, _ = make_client(self.token, self.project_id, response, compression="gzip", compression_threshold=10)
+        client.notifications.create(body="Hello", uids=UIDS)
+        stats = client.compression_stats()
+        self.assertIsInstance(stats, CompressionStats)
+        self.assertEqual(stats.requests_compressed, 1)
+        self.assertEqual(stats.request_bytes, len(json.dumps({"body": "Hello", "uids": UIDS}, separators=(",", ":"))))
+        self.assertLess(stats.request_bytes_sent, stats.request_bytes)
+        self.assertEqual(stats.responses_compressed, 1)
+        self.assertEqual(stats.response_bytes, len(response.content))
+        self.assertEqual(stats.response_bytes_received, 10)
+        expected = stats.request_bytes - stats.request_bytes_sent + len(response.content) - 10
+        self.assertEqual(stats.bytes_saved, expected)
+
+
+class CompressionServerTests(LocalServerTestCase):
+    handler = _Handler
+
+    def setUp(self):
+        super().setUp()
+        _Handler.received = []
+
+    def test_round_trip(self):
+        with Pushpad(self.token, self.project_id, base_url=self.base_url, compression="gzip") as client:
+            client.notifications.create(body="Hello", uids=UIDS)
+            subscriptions = client.subscriptions.all()
+            stats = client.compression_stats()
+        self.assertEqual(_Handler.received, [{"body": "Hello", "uids": UIDS}])
+        self.assertEqual([s.uid for s in subscriptions], UIDS)
+        self.assertEqual(stats.requests_compressed, 1)
+        self.assertEqual(stats.responses_compressed, 2)
+        self.assertGreater(stats.bytes_saved, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
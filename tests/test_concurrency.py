@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+import unittest
+
+from pushpad._concurrency import async_ordered_map, ordered_map
+
+
+class OrderedMapTests(unittest.TestCase):
+    def test_preserves_input_order(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        self.assertEqual(list(ordered_map(slow_square, range(5), workers=5)), [0, 1, 4, 9, 16])
+
+    def test_bounds_pending_calls(self):
+        lock = threading.Lock()
+        started = []
+
+        def record(n):
+            with lock:
+                started.append(n)
+            return n
+
+        results = ordered_map(record, range(100), workers=2, prefetch=4)
+        self.assertEqual(next(results), 0)
+        time.sleep(0.05)
+        self.assertLessEqual(len(started), 5)
+        results.close()
+
+    def test_propagates_errors(self):
+        def fail(n):
+            if n == 2:
+                raise RuntimeError("boom")
+            return n
+
+        with self.assertRaises(RuntimeError):
+            list(ordered_map(fail, range(5), workers=2))
+
+    def test_rejects_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            list(ordered_map(str, range(3), workers=0))
+
+
+class AsyncOrderedMapTests(unittest.IsolatedAsyncioTestCase):
+    async def test_preserves_order_and_limits_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def work(n):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (10 - n))
+            in_flight -= 1
+            return n
+
+        results = [n async for n in async_ordered_map(work, range(10), concurrency=3)]
+        self.assertEqual(results, list(range(10)))
+        self.assertLessEqual(peak, 3)
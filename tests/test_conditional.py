@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import unittest
+from unittest import mock
+
+from pushpad import JSONCodec, Notification
+from pushpad._conditional import ConditionalStore
+
+from tests.helpers import BasePushpadTestCase, make_async_client, make_client, make_response
+
+PAYLOAD = {"id": 5, "successfully_sent_count": 10, "opened_count": 2, "scheduled_count": 0}
+
+
+def with_validators(response, **headers):
+    response.headers = {"Content-Type": "application/json", **headers}
+    return response
+
+
+class ConditionalRequestTests(BasePushpadTestCase):
+    def make_client(self, *responses, **options):
+        client, session = make_client(self.token, self.project_id, conditional_requests=True, **options)
+        session.request.side_effect = list(responses)
+        return client, session
+
+    def test_etag_is_sent_back_and_304_returns_the_cached_object(self):
+        first = with_validators(make_response(payload=PAYLOAD), ETag='"v1"')
+        codec = JSONCodec()
+        client, session = self.make_client(first, make_response(status=304), json_codec=codec)
+        self.assertEqual(client.notifications.get(5).opened_count, 2)
+        self.assertIsNone(session.request.call_args[1]["headers"])
+        with mock.patch.object(codec, "loads", wraps=codec.loads) as loads:
+            notification = client.notifications.get(5)
+        self.assertIsInstance(notification, Notification)
+        self.assertEqual(notification.opened_count, 2)
+        self.assertEqual(session.request.call_args[1]["headers"], {"If-None-Match": '"v1"'})
+        loads.assert_not_called()
+
+    def test_changed_response_replaces_the_cached_one(self):
+        client, session = self.make_client(
+            with_validators(make_response(payload=PAYLOAD), ETag='"v1"'),
+            with_validators(make_response(payload={**PAYLOAD, "opened_count": 3}), ETag='"v2"'),
+            make_response(status=304),
+        )
+        client.notifications.get(5)
+        self.assertEqual(client.notifications.get(5).opened_count, 3)
+        self.assertEqual(client.notifications.get(5).opened_count, 3)
+        self.assertEqual(session.request.call_args[1]["headers"], {"If-None-Match": '"v2"'})
+
+    def test_last_modified(self):
+        date = "Wed, 21 Oct 2026 07:28:00 GMT"
+        client, session = self.make_client(
+            with_validators(make_response(payload=PAYLOAD), **{"Last-Modified": date}),
+            make_response(status=304),
+        )
+        client.notifications.get(5)
+        client.notifications.get(5)
+        self.assertEqual(session.request.call_args[1]["headers"], {"If-Modified-Since": date})
+
+    def test_responses_without_validators_are_not_kept(self):
+        client, session = self.make_client(make_response(payload=PAYLOAD), make_response(payload=PAYLOAD))
+        client.notifications.get(5)
+        client.notifications.get(5)
+        self.assertIsNone(session.request.call_args[1]["headers"])
+
+    def test_lists_are_kept_by_params(self):
+        page = with_validators(make_response(payload=[{"id": 1}]), ETag='"page"')
+        client, session = self.make_client(page, make_response(payload=[]), make_response(status=304))
+        client.subscriptions.all(page=1)
+        client.subscriptions.all(page=2)
+        self.assertIsNone(session.request.call_args[1]["headers"])
+        self.assertEqual([s.id for s in client.subscriptions.all(page=1)], [1])
+        self.assertEqual(session.request.call_args[1]["headers"], {"If-None-Match": '"page"'})
+
+    def test_lazy_models_do_not_change_the_cached_object(self):
+        client, _ = self.make_client(
+            with_validators(make_response(payload=PAYLOAD), ETag='"v1"'), make_response(status=304), lazy_models=True
+        )
+        client.notifications.get(5).opened_count = 100
+        self.assertEqual(client.notifications.get(5).opened_count, 2)
+
+    def test_changing_a_list_field_does_not_change_the_cached_object(self):
+        payload = [{"id": 1, "tags": ["paid"]}]
+        client, _ = self.make_client(
+            with_validators(make_response(payload=payload), ETag='"page"'),
+            make_response(status=304),
+            make_response(status=304),
+        )
+        client.subscriptions.all()[0].tags.append("changed")
+        subscription = client.subscriptions.all()[0]
+        self.assertEqual(subscription.tags, ["paid"])
+        subscription.tags.append("changed")
+        self.assertEqual(client.subscriptions.all()[0].tags, ["paid"])
+
+    def test_disabled_by_default(self):
+        response = with_validators(make_response(payload=PAYLOAD), ETag='"v1"')
+        client, session = make_client(self.token, self.project_id, response)
+        client.notifications.get(5)
+        client.notifications.get(5)
+        self.assertIsNone(session.request.call_args[1]["headers"])
+
+
+class ConditionalStoreTests(unittest.TestCase):
+    def test_least_recently_used_are_evicted(self):
+        store = ConditionalStore(maxsize=2)
+        for path in ("/a", "/b", "/c"):
+            store.put(path, {"ETag": path}, {})
+        self.assertIsNone(store.get("/a"))
+        self.assertEqual(store.get("/c").headers(), {"If-None-Match": "/c"})
+
+
+class AsyncConditionalRequestTests(unittest.IsolatedAsyncioTestCase):
+    async def test_304_returns_the_cached_object(self):
+        client, session = make_async_client("token", 1, conditional_requests=True)
+        session.request.side_effect = [
+            with_validators(make_response(payload=PAYLOAD), ETag='"v1"'),
+            make_response(status=304),
+        ]
+        await client.notifications.get(5)
+        notification = await client.notifications.get(5)
+        self.assertEqual(notification.successfully_sent_count, 10)
+        self.assertEqual(session.request.call_args[1]["headers"], {"If-None-Match": '"v1"'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:  # pragma: no cover - optional dependency
+    TracerProvider = None
+
+from pushpad import (
+    AsyncMemoryTransport,
+    AsyncPushpad,
+    Hook,
+    MemoryResponse,
+    MemoryTransport,
+    OpenTelemetryHook,
+    PrometheusHook,
+    Pushpad,
+    PushpadAPIError,
+    PushpadClientError,
+    RetryPolicy,
+    TransportError,
+)
+from pushpad._hooks import path_template
+
+from tests.helpers import BasePushpadTestCase, LocalServerTestCase
+
+
+class RecordingHook(Hook):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(("before", event.path, event.attempt))
+
+    def after_response(self, event):
+        self.calls.append(("after", event.path, event.status))
+        self.event = event
+
+    def on_error(self, event):
+        self.calls.append(("error", event.path, type(event.error).__name__))
+        self.event = event
+
+
+def responder(*responses):
+    responses = list(responses)
+
+    def handler(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+class PathTemplateTests(unittest.TestCase):
+    def test_ids_are_replaced(self):
+        self.assertEqual(path_template("/projects/12/subscriptions"), "/projects/{pid}/subscriptions")
+        self.assertEqual(path_template("/projects/12/subscriptions/345"), "/projects/{pid}/subscriptions/{id}")
+        self.assertEqual(path_template("/projects/12"), "/projects/{id}")
+        self.assertEqual(path_template("/notifications/7/cancel"), "/notifications/{id}/cancel")
+        self.assertEqual(path_template("/senders"), "/senders")
+
+
+class HookTests(BasePushpadTestCase):
+    def make_client(self, *responses, **options):
+        transport = MemoryTransport(responder(*responses))
+        return Pushpad(self.token, self.project_id, transport=transport, **options)
+
+    def test_events(self):
+        hook = RecordingHook()
+        client = self.make_client(MemoryResponse(201, json={"id": 7, "scheduled": 2}), hooks=[hook])
+        client.notifications.create(body="Hello")
+        self.assertEqual(
+            hook.calls,
+            [("before", "/projects/{pid}/notifications", 1), ("after", "/projects/{pid}/notifications", 201)],
+        )
+        event = hook.event
+        self.assertEqual(event.method, "POST")
+        self.assertEqual(event.url, "https://pushpad.xyz/api/v1/projects/1/notifications")
+        self.assertEqual(event.bytes_sent, len(b'{"body":"Hello"}'))
+        self.assertEqual(event.bytes_received, len(b'{"id":7,"scheduled":2}'))
+        self.assertGreaterEqual(event.latency, 0)
+        self.assertEqual(event.retries, 0)
+        self.assertIsNone(event.connection_reused)
+
+    def test_error_responses_and_retries(self):
+        hook = RecordingHook()
+        client = self.make_client(
+            TransportError("refused", connect=True),
+            MemoryResponse(503),
+            MemoryResponse(404),
+            hooks=[hook],
+            retry=RetryPolicy(backoff_factor=0, max_attempts=3),
+        )
+        with self.assertRaises(PushpadAPIError):
+            client.subscriptions.get(5)
+        path = "/projects/{pid}/subscriptions/{id}"
+        self.assertEqual(
+            hook.calls,
+            [
+                ("before", path, 1),
+                ("error", path, "TransportError"),
+                ("before", path, 2),
+                ("after", path, 503),
+                ("before", path, 3),
+                ("after", path, 404),
+            ],
+        )
+        self.assertEqual(hook.event.retries, 2)
+
+    def test_add_hook(self):
+        hook = RecordingHook()
+        client = self.make_client(TransportError("timed out"))
+        client.add_hook(hook)
+        with self.assertRaises(PushpadClientError):
+            client.projects.all()
+        self.assertEqual([call[0] for call in hook.calls], ["before", "error"])
+        self.assertIsNone(hook.event.status)
+
+    def test_async_client(self):
+        hook = RecordingHook()
+        transport = AsyncMemoryTransport(responder(MemoryResponse(json=[{"id": 1}])))
+
+        async def run():
+            async with AsyncPushpad(self.token, self.project_id, transport=transport, hooks=[hook]) as client:
+                return await client.senders.all()
+
+        asyncio.run(run())
+        self.assertEqual(hook.calls, [("before", "/senders", 1), ("after", "/senders", 200)])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"[]")
+
+    def log_message(self, *args):
+        pass
+
+
+class ConnectionReuseTests(LocalServerTestCase):
+    handler = _Handler
+
+    def test_requests_transport_reports_reused_connections(self):
+        hook = RecordingHook()
+        reused = []
+        hook.after_response = lambda event: reused.append(event.connection_reused)
+        with Pushpad(self.token, base_url=self.base_url, hooks=[hook]) as client:
+            client.senders.all()
+            client.senders.all()
+        self.assertEqual(reused, [False, True])
+
+
+@unittest.skipIf(prometheus_client is None, "prometheus-client is not installed")
+class PrometheusHookTests(BasePushpadTestCase):
+    def test_metrics(self):
+        registry = prometheus_client.CollectorRegistry()
+        client = self.make_client(registry)
+        client.notifications.get(3)
+        with self.assertRaises(PushpadClientError):
+            client.notifications.get(4)
+        path = "/notifications/{id}"
+        value = registry.get_sample_value
+        self.assertEqual(value("pushpad_requests_total", {"method": "GET", "path": path, "status": "200"}), 1)
+        self.assertEqual(value("pushpad_requests_total", {"method": "GET", "path": path, "status": "503"}), 2)
+        self.assertEqual(value("pushpad_errors_total", {"method": "GET", "path": path}), 1)
+        self.assertEqual(value("pushpad_retries_total", {"method": "GET", "path": path}), 2)
+        self.assertEqual(value("pushpad_request_duration_seconds_count", {"method": "GET", "path": path}), 4)
+        self.assertEqual(value("pushpad_response_bytes_total", {"method": "GET", "path": path}), len(b'{"id":3}'))
+
+    def make_client(self, registry):
+        transport = MemoryTransport(
+            responder(
+                MemoryResponse(json={"id": 3}),
+                MemoryResponse(503),
+                MemoryResponse(503),
+                TransportError("timed out"),
+            )
+        )
+        retry = RetryPolicy(backoff_factor=0, max_attempts=3)
+        return Pushpad(self.token, transport=transport, retry=retry, hooks=[PrometheusHook(registry)])
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class OpenTelemetryHookTests(BasePushpadTestCase):
+    def test_spans(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        hook = OpenTelemetryHook(provider.get_tracer("test"))
+        transport = MemoryTransport(
+            responder(TransportError("refused", connect=True), MemoryResponse(201, json={"id": 1}))
+        )
+        retry = RetryPolicy(backoff_factor=0, retry_unprocessed_creates=True)
+        client = Pushpad(self.token, self.project_id, transport=transport, retry=retry, hooks=[hook])
+        client.notifications.create(body="Hello")
+        failed, sent = exporter.get_finished_spans()
+        self.assertEqual(sent.name, "POST /projects/{pid}/notifications")
+        self.assertEqual(sent.attributes["http.response.status_code"], 201)
+        self.assertEqual(sent.attributes["http.request.resend_count"], 1)
+        self.assertTrue(sent.status.is_ok)
+        self.assertFalse(failed.status.is_ok)
+        self.assertEqual(failed.attributes["error.type"], "TransportError")
+        self.assertEqual(failed.events[0].name, "exception")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+try:
+    import h2
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = httpx = None
+
+from pushpad import HTTP2Transport, Pushpad, PushpadAPIError, PushpadClientError, RetryPolicy
+
+from tests.helpers import BasePushpadTestCase
+
+
+@unittest.skipIf(h2 is None or httpx is None, "httpx[http2] is not installed")
+class HTTP2TransportTests(BasePushpadTestCase):
+    def make_client(self, handler, **options):
+        transport = HTTP2Transport(transport=httpx.MockTransport(handler))
+        return Pushpad(self.token, self.project_id, transport=transport, **options)
+
+    def test_http2_option_creates_http2_transport(self):
+        with Pushpad(self.token, http2=True, pool_maxsize=3) as client:
+            self.assertIsInstance(client._transport, HTTP2Transport)
+            self.assertEqual(client._transport.headers["Authorization"], f"Bearer {self.token}")
+            self.assertEqual(client.pool_stats(), [])
+
+    def test_http1_pool_options_are_rejected(self):
+        for options in ({"pool_block": True}, {"keep_alive": False}, {"pool_connections": 3}):
+            with self.subTest(**options), self.assertRaises(ValueError):
+                Pushpad(self.token, http2=True, **options)
+
+    def test_requests_and_responses(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"id": 7, "scheduled": 2})
+
+        client = self.make_client(handler)
+        result = client.notifications.create(body="Hello", uids=["u1"])
+        self.assertEqual(result.id, 7)
+        [request] = requests
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(str(request.url), "https://pushpad.xyz/api/v1/projects/1/notifications")
+        self.assertEqual(json.loads(request.content), {"body": "Hello", "uids": ["u1"]})
+        self.assertEqual(request.headers["Authorization"], f"Bearer {self.token}")
+
+    def test_error_responses_raise_api_error(self):
+        client = self.make_client(lambda request: httpx.Response(404, text="Not found"))
+        with self.assertRaises(PushpadAPIError) as ctx:
+            client.subscriptions.get(5)
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(ctx.exception.reason, "Not Found")
+        self.assertEqual(ctx.exception.response_body, "Not found")
+
+    def test_connect_errors_are_retried_for_creates(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(201, json={"id": 8})
+
+        retry = RetryPolicy(backoff_factor=0, retry_unprocessed_creates=True)
+        client = self.make_client(handler, retry=retry)
+        self.assertEqual(client.notifications.create(body="Hello").id, 8)
+        self.assertEqual(len(attempts), 2)
+
+    def test_read_errors_raise_client_error(self):
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = self.make_client(handler)
+        with self.assertRaises(PushpadClientError):
+            client.notifications.create(body="Hello")
+
+    def test_streamed_responses(self):
+        headers = {"X-Total-Count": "2"}
+        client = self.make_client(lambda request: httpx.Response(200, json=[{"id": 1}, {"id": 2}], headers=headers))
+        ids = [s.id for s in client.subscriptions.iter_all(stream=True)]
+        self.assertEqual(ids, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+from pushpad import JSONCodec, OrjsonCodec, PushpadClientError, UjsonCodec
+from pushpad._json import default_codec
+
+from tests.helpers import BasePushpadTestCase, make_client, make_response
+
+PAYLOAD = {"body": "Café ☕", "target_url": "https://example.com/a/b", "uids": ["u1"], "ttl": 60}
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class JSONCodecTests(unittest.TestCase):
+    def test_stdlib_codec_round_trip(self):
+        codec = JSONCodec()
+        data = codec.dumps(PAYLOAD)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(codec.loads(data), PAYLOAD)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec_round_trip(self):
+        codec = OrjsonCodec()
+        self.assertEqual(codec.loads(codec.dumps(PAYLOAD)), PAYLOAD)
+        with self.assertRaises(ValueError):
+            codec.loads(b"{")
+
+    @unittest.skipIf(ujson is None, "ujson is not installed")
+    def test_ujson_codec_round_trip(self):
+        codec = UjsonCodec()
+        self.assertEqual(codec.loads(codec.dumps(PAYLOAD)), PAYLOAD)
+        with self.assertRaises(ValueError):
+            codec.loads(b"{")
+
+    def test_default_codec_prefers_the_fastest_parser(self):
+        expected = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+        self.assertEqual(default_codec().name, expected)
+
+
+class ClientCodecTests(BasePushpadTestCase):
+    def test_codec_encodes_payload_and_decodes_content(self):
+        codec = RecordingCodec()
+        response = make_response(payload={"id": 3, "scheduled": 1})
+        client, session = make_client(self.token, self.project_id, response, json_codec=codec)
+        result = client.notifications.create(body="Hello")
+        self.assertEqual(result.id, 3)
+        self.assertEqual(codec.dumped, [{"body": "Hello"}])
+        self.assertEqual(codec.loaded, [response.content])
+        self.assertEqual(session.request.call_args[1]["data"], b'{"body":"Hello"}')
+        response.json.assert_not_called()
+
+    def test_requests_without_payload_have_no_body(self):
+        response = make_response(payload={"id": 3})
+        client, session = make_client(self.token, self.project_id, response)
+        client.notifications.get(3)
+        self.assertIsNone(session.request.call_args[1]["data"])
+
+    def test_invalid_json_raises_client_error(self):
+        response = make_response(payload={"id": 3})
+        response.content = b"not json"
+        client, _ = make_client(self.token, self.project_id, response)
+        with self.assertRaises(PushpadClientError):
+            client.notifications.get(3)
+
+
+if __name__ == "__main__":
+    unittest.main()
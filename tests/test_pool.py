@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import json
+from http.server import BaseHTTPRequestHandler
+
+from pushpad import PoolStats, Pushpad
+
+from tests.helpers import LocalServerTestCase, make_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"id": 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PoolTests(LocalServerTestCase):
+    handler = _Handler
+
+    def test_adapters_use_pool_options(self):
+        client = Pushpad(self.token, pool_connections=3, pool_maxsize=25, pool_block=True)
+        adapter = client._transport.session.get_adapter("https://pushpad.xyz/api/v1")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(client._transport.session.headers["Connection"], "keep-alive")
+
+    def test_keep_alive_can_be_disabled(self):
+        client = Pushpad(self.token, keep_alive=False)
+        self.assertEqual(client._transport.session.headers["Connection"], "close")
+
+    def test_pool_stats_report_reused_connections(self):
+        with Pushpad(self.token, base_url=self.base_url, pool_maxsize=4) as client:
+            self.assertEqual(client.pool_stats(), [])
+            for _ in range(3):
+                client.projects.get(1)
+            [stats] = client.pool_stats()
+        self.assertIsInstance(stats, PoolStats)
+        self.assertEqual(stats.host, "127.0.0.1")
+        self.assertEqual(stats.maxsize, 4)
+        self.assertEqual(stats.connections_created, 1)
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.idle, 1)
+
+    def test_pool_stats_with_custom_session(self):
+        client, _ = make_client(self.token)
+        self.assertEqual(client.pool_stats(), [])
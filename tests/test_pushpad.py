@@ -12,6 +12,28 @@ class PushpadClientTests(BasePushpadTestCase):
             "6627820dab00a1971f2a6d3ff16a5ad8ba4048a02b2d402820afc61aefd0b69f",
         )
 
+    def test_signature_for_uses_cache(self):
+        client, _ = make_client(self.token, self.project_id, signature_cache_size=2)
+        for uid in ("a", "b", "a", "c", "b"):
+            client.signature_for(uid)
+        info = client.signature_cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (1, 4, 2, 2))
+
+    def test_signature_cache_can_be_disabled(self):
+        client, _ = make_client(self.token, self.project_id, signature_cache_size=0)
+        self.assertEqual(
+            client.signature_for("user12345"),
+            "6627820dab00a1971f2a6d3ff16a5ad8ba4048a02b2d402820afc61aefd0b69f",
+        )
+        self.assertIsNone(client.signature_cache_info())
+
+    def test_signatures_for(self):
+        client, _ = make_client(self.token, self.project_id)
+        uids = ["user12345", "user1", "user12345"]
+        signatures = list(client.signatures_for(iter(uids)))
+        self.assertEqual(signatures, [client.signature_for(uid) for uid in uids])
+        self.assertEqual(signatures[0], "6627820dab00a1971f2a6d3ff16a5ad8ba4048a02b2d402820afc61aefd0b69f")
+
     def test_error_response(self):
         response = make_response(status=403, payload={"error": "Forbidden"})
         client, _ = make_client(self.token, self.project_id, response)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import unittest
+from unittest import mock
+
+from pushpad import RateLimiter
+
+from tests.helpers import BasePushpadTestCase, FakeClock, make_async_client, make_client, make_response
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(100.0)
+
+    def test_allows_burst_then_spaces_requests(self):
+        limiter = RateLimiter(2, burst=3, clock=self.clock)
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertEqual(limiter.reserve(), 0.5)
+        self.assertEqual(limiter.reserve(), 1.0)
+
+    def test_refills_over_time(self):
+        limiter = RateLimiter(10, burst=1, clock=self.clock)
+        self.assertEqual(limiter.reserve(), 0)
+        self.clock.now += 0.25
+        self.assertEqual(limiter.reserve(), 0)
+
+    def test_adapts_rate_to_headers(self):
+        limiter = RateLimiter(100, clock=self.clock)
+        limiter.update_from_headers({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+        self.assertEqual(limiter.rate, 2)
+        limiter.update_from_headers({"RateLimit-Remaining": "1000", "RateLimit-Reset": "1"})
+        self.assertEqual(limiter.rate, 100)
+
+    def test_waits_for_reset_when_no_requests_remain(self):
+        limiter = RateLimiter(100, clock=self.clock)
+        limiter.update_from_headers({"RateLimit-Remaining": "0", "RateLimit-Reset": "7"})
+        self.assertEqual(limiter.reserve(), 7)
+
+    def test_ignores_headers_when_not_adaptive(self):
+        limiter = RateLimiter(100, adaptive=False, clock=self.clock)
+        limiter.update_from_headers({"RateLimit-Remaining": "0", "RateLimit-Reset": "7"})
+        self.assertEqual(limiter.reserve(), 0)
+
+    def test_rejects_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+
+
+class ClientRateLimitTests(BasePushpadTestCase):
+    def test_every_request_acquires_a_token(self):
+        limiter = mock.Mock(spec=RateLimiter)
+        headers = {"RateLimit-Remaining": "5", "RateLimit-Reset": "1"}
+        response = make_response(payload={"id": 1}, headers=headers)
+        client, _ = make_client(self.token, self.project_id, response, rate_limiter=limiter)
+        client.projects.get(1)
+        client.subscriptions.get(1)
+        self.assertEqual(limiter.acquire.call_count, 2)
+        limiter.update_from_headers.assert_called_with(headers)
+
+
+class AsyncClientRateLimitTests(unittest.IsolatedAsyncioTestCase):
+    async def test_every_request_acquires_a_token(self):
+        limiter = mock.Mock(spec=RateLimiter)
+        limiter.acquire_async = mock.AsyncMock()
+        response = make_response(payload={"id": 1})
+        client, _ = make_async_client("token", 1, response, rate_limiter=limiter)
+        await client.notifications.get(1)
+        limiter.acquire_async.assert_awaited_once()
+        limiter.acquire.assert_not_called()
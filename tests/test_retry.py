@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import requests
+
+from pushpad import PushpadAPIError, PushpadClientError, RequestsTransport, RetryPolicy
+from pushpad._retry import parse_retry_after
+
+from tests.helpers import BasePushpadTestCase, make_async_client, make_client, make_response
+
+
+def make_retry_client(token, retry, responses):
+    client, session = make_client(token, 1, retry=retry)
+    session.request.side_effect = responses
+    return client, session
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_retries_idempotent_methods_on_retry_statuses(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertTrue(policy.should_retry("GET", 1, status=503))
+        self.assertTrue(policy.should_retry("DELETE", 2, error=Exception()))
+        self.assertFalse(policy.should_retry("GET", 3, status=503))
+        self.assertFalse(policy.should_retry("GET", 1, status=404))
+        self.assertFalse(policy.should_retry("POST", 1, status=503))
+        self.assertFalse(policy.should_retry("PATCH", 1, status=503))
+
+    def test_guarded_requests_retry_only_when_unprocessed(self):
+        policy = RetryPolicy(retry_unprocessed_creates=True)
+        self.assertTrue(policy.should_retry("POST", 1, status=429, guarded=True))
+        self.assertTrue(policy.should_retry("POST", 1, status=503, guarded=True))
+        self.assertTrue(policy.should_retry("POST", 1, error=Exception(), connect_error=True, guarded=True))
+        self.assertFalse(policy.should_retry("POST", 1, status=502, guarded=True))
+        self.assertFalse(policy.should_retry("POST", 1, error=Exception(), guarded=True))
+        self.assertFalse(RetryPolicy().should_retry("POST", 1, status=429, guarded=True))
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual([policy.delay(n) for n in range(1, 5)], [1, 2, 4, 5])
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_factor=1)
+        for _ in range(50):
+            self.assertTrue(0 <= policy.delay(3) <= 4)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(max_backoff=10)
+        self.assertEqual(policy.delay(1, "7"), 7)
+        self.assertIsNone(policy.delay(1, "60"))
+        self.assertTrue(0 <= RetryPolicy(respect_retry_after=False, jitter=False).delay(1, "60") <= 0.5)
+
+    def test_parse_retry_after_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.assertAlmostEqual(parse_retry_after(format_datetime(when, usegmt=True)), 30, delta=2)
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_rejects_invalid_attempts(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+@mock.patch("pushpad.pushpad.time.sleep")
+class ClientRetryTests(BasePushpadTestCase):
+    def test_no_retries_by_default(self, sleep):
+        client, session = make_retry_client(self.token, None, [make_response(status=503, payload={})])
+        with self.assertRaises(PushpadAPIError):
+            client.projects.get(1)
+        self.assertEqual(session.request.call_count, 1)
+        sleep.assert_not_called()
+
+    def test_retries_get_until_success(self, sleep):
+        responses = [
+            make_response(status=503, payload={}),
+            make_response(status=429, payload={}, headers={"Retry-After": "2"}),
+            make_response(payload={"id": 1}),
+        ]
+        client, session = make_retry_client(self.token, RetryPolicy(jitter=False), responses)
+        self.assertEqual(client.projects.get(1).id, 1)
+        self.assertEqual(session.request.call_count, 3)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [0.5, 2.0])
+
+    def test_raises_last_error_when_attempts_are_exhausted(self, sleep):
+        responses = [make_response(status=502, payload={}) for _ in range(2)]
+        client, session = make_retry_client(self.token, RetryPolicy(max_attempts=2), responses)
+        with self.assertRaises(PushpadAPIError) as ctx:
+            client.subscriptions.get(1)
+        self.assertEqual(ctx.exception.status_code, 502)
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_retries_network_errors(self, sleep):
+        responses = [requests.ConnectionError("reset"), make_response(payload=[])]
+        client, session = make_retry_client(self.token, RetryPolicy(), responses)
+        self.assertEqual(client.senders.all(), [])
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_network_errors_are_raised_after_last_attempt(self, sleep):
+        responses = [requests.ConnectionError("reset")]
+        client, _ = make_retry_client(self.token, RetryPolicy(max_attempts=1), responses)
+        with self.assertRaises(PushpadClientError):
+            client.senders.all()
+
+    def test_create_is_not_retried_by_default(self, sleep):
+        responses = [make_response(status=503, payload={})]
+        client, session = make_retry_client(self.token, RetryPolicy(), responses)
+        with self.assertRaises(PushpadAPIError):
+            client.notifications.create(body="Hello")
+        self.assertEqual(session.request.call_count, 1)
+
+    def test_create_retried_when_unprocessed(self, sleep):
+        responses = [
+            requests.ConnectTimeout("timeout"),
+            make_response(status=429, payload={}),
+            make_response(payload={"id": 9}),
+        ]
+        policy = RetryPolicy(retry_unprocessed_creates=True)
+        client, session = make_retry_client(self.token, policy, responses)
+        self.assertEqual(client.notifications.create(body="Hello").id, 9)
+        self.assertEqual(session.request.call_count, 3)
+
+    def test_connection_refused_is_a_connect_error(self, sleep):
+        with self.assertRaises(requests.ConnectionError) as ctx:
+            requests.get("http://127.0.0.1:9", timeout=1)
+        self.assertTrue(RequestsTransport._is_connect_error(ctx.exception))
+        self.assertFalse(RequestsTransport._is_connect_error(requests.ReadTimeout("slow")))
+
+    def test_create_not_retried_when_maybe_processed(self, sleep):
+        responses = [make_response(status=502, payload={}), make_response(payload={"id": 9})]
+        policy = RetryPolicy(retry_unprocessed_creates=True)
+        client, session = make_retry_client(self.token, policy, responses)
+        with self.assertRaises(PushpadAPIError):
+            client.notifications.create(body="Hello")
+        self.assertEqual(session.request.call_count, 1)
+
+
+class AsyncClientRetryTests(unittest.IsolatedAsyncioTestCase):
+    @mock.patch("pushpad.async_pushpad.asyncio.sleep", new_callable=mock.AsyncMock)
+    async def test_retries_get_until_success(self, sleep):
+        client, session = make_async_client("token", 1, retry=RetryPolicy(jitter=False))
+        session.request.side_effect = [make_response(status=503, payload={}), make_response(payload={"id": 1})]
+        self.assertEqual((await client.projects.get(1)).id, 1)
+        self.assertEqual(session.request.call_count, 2)
+        sleep.assert_awaited_once_with(0.5)
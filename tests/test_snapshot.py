@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import unittest
+
+from pushpad import (
+    AsyncMemoryTransport,
+    AsyncPushpad,
+    MemoryTransport,
+    Pushpad,
+    Subscription,
+    SubscriptionChange,
+    SubscriptionSnapshot,
+)
+from pushpad._snapshot import content_hash
+
+from tests.helpers import FakeSubscriptionsAPI
+
+
+def subscriptions(count):
+    return [{"id": id, "uid": f"u{id}", "tags": ["a"]} for id in range(1, count + 1)]
+
+
+def summary(changes):
+    return [(change.kind, change.id) for change in changes]
+
+
+class SubscriptionSyncTests(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeSubscriptionsAPI(*subscriptions(5))
+        self.client = Pushpad("token", 1, transport=MemoryTransport(self.api))
+        self.snapshot = SubscriptionSnapshot()
+        self.addCleanup(self.snapshot.close)
+
+    def sync(self, **options):
+        return list(self.client.subscriptions.sync(self.snapshot, **{"per_page": 2, **options}))
+
+    def test_first_sync_adds_every_subscription(self):
+        changes = self.sync()
+        self.assertEqual(summary(changes), [("added", id) for id in range(1, 6)])
+        self.assertIsInstance(changes[0], SubscriptionChange)
+        self.assertIsInstance(changes[0].subscription, Subscription)
+        self.assertEqual(changes[0].subscription.uid, "u1")
+        self.assertEqual(self.api.pages, [1, 2, 3])
+        self.assertEqual(len(self.snapshot), 5)
+
+    def test_only_changes_are_reported(self):
+        self.sync()
+        self.assertEqual(self.sync(), [])
+        self.api.subscriptions[2]["tags"] = ["a", "b"]
+        self.api.subscriptions[3]["last_click_at"] = "2025-07-06T10:09:14.000Z"
+        del self.api.subscriptions[5]
+        self.api.subscriptions[9] = {"id": 9, "uid": "u9", "tags": []}
+        changes = self.sync()
+        self.assertEqual(summary(changes), [("changed", 2), ("changed", 3), ("added", 9), ("removed", 5)])
+        self.assertIsNone(changes[-1].subscription)
+        self.assertNotIn(5, self.snapshot)
+        self.assertEqual(self.sync(), [])
+
+    def test_interrupted_sync_resumes_after_the_last_checkpoint(self):
+        self.sync()
+        self.api.subscriptions[1]["uid"] = "changed"
+        self.api.subscriptions[4]["uid"] = "changed"
+        del self.api.subscriptions[5]
+        self.api.pages.clear()
+        changes = self.client.subscriptions.sync(self.snapshot, per_page=2)
+        self.assertEqual(next(changes).id, 1)
+        self.assertEqual(next(changes).id, 4)
+        changes.close()
+        self.assertEqual(self.snapshot.resume_page, 2)
+        self.assertEqual(self.api.pages, [1, 2])
+
+        self.api.pages.clear()
+        self.assertEqual(summary(self.sync()), [("changed", 4), ("removed", 5)])
+        self.assertEqual(self.api.pages, [2])
+        self.assertIsNone(self.snapshot.resume_page)
+        self.assertEqual(self.sync(), [])
+
+    def test_resume_with_other_page_size_restarts_the_walk(self):
+        self.sync()
+        self.api.subscriptions[1]["uid"] = "changed"
+        self.api.subscriptions[4]["uid"] = "changed"
+        changes = self.client.subscriptions.sync(self.snapshot, per_page=2)
+        next(changes)
+        next(changes)
+        changes.close()
+        self.api.pages.clear()
+        self.assertEqual(summary(self.sync(per_page=3)), [("changed", 4)])
+        self.assertEqual(self.api.pages, [1, 2])
+
+    def test_snapshot_is_bound_to_its_filters(self):
+        self.sync()
+        with self.assertRaises(ValueError):
+            self.sync(tags=["a"])
+
+    def test_snapshot_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "subscriptions.db")
+            self.assertEqual(len(list(self.client.subscriptions.sync(path))), 5)
+            self.api.subscriptions[1]["tags"] = []
+            self.assertEqual(summary(self.client.subscriptions.sync(path)), [("changed", 1)])
+
+    def test_content_hash_ignores_tag_order_and_other_fields(self):
+        item = {"id": 1, "uid": "u1", "tags": ["a", "b"], "endpoint": "https://example.com/1"}
+        self.assertEqual(content_hash(item), content_hash({**item, "tags": ["b", "a"], "endpoint": "x"}))
+        self.assertNotEqual(content_hash(item), content_hash({**item, "uid": "u2"}))
+
+
+class AsyncSubscriptionSyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_sync(self):
+        api = FakeSubscriptionsAPI(*subscriptions(3))
+        client = AsyncPushpad("token", 1, transport=AsyncMemoryTransport(api))
+        with SubscriptionSnapshot() as snapshot:
+            changes = [change async for change in client.subscriptions.sync(snapshot, per_page=2)]
+            self.assertEqual(summary(changes), [("added", 1), ("added", 2), ("added", 3)])
+            api.subscriptions.popitem()
+            changes = [change async for change in client.subscriptions.sync(snapshot, per_page=2)]
+            self.assertEqual(summary(changes), [("removed", 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
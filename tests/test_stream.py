@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+from unittest import mock
+
+from pushpad import PushpadAPIError, PushpadClientError
+from pushpad._stream import JSONArrayParser
+
+from tests.helpers import BasePushpadTestCase, make_async_client, make_client, make_response
+
+ITEMS = [{"id": i, "uid": f'u"{i}\\', "tags": ["a}, ]", "{b"], "last_click_at": None} for i in range(1, 6)]
+
+
+def chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def make_stream_response(payload, size=7, headers=None):
+    response = make_response(status=200, headers=headers)
+    body = json.dumps(payload).encode()
+    response.iter_content.return_value = chunks(body, size)
+
+    async def aiter_bytes():
+        for chunk in chunks(body, size):
+            yield chunk
+
+    response.aiter_bytes = aiter_bytes
+    response.aclose = mock.AsyncMock()
+    return response
+
+
+class JSONArrayParserTests(unittest.TestCase):
+    def test_parses_elements_split_across_chunks(self):
+        body = json.dumps(ITEMS).encode()
+        for size in (1, 2, 5, 64, len(body)):
+            parser = JSONArrayParser(json.loads)
+            items = []
+            for chunk in chunks(body, size):
+                items.extend(parser.feed(chunk))
+            parser.close()
+            self.assertEqual(items, ITEMS)
+
+    def test_yields_elements_before_the_end_of_the_body(self):
+        parser = JSONArrayParser(json.loads)
+        self.assertEqual(parser.feed(b' [{"id": 1}, {"id"'), [{"id": 1}])
+        self.assertEqual(parser.feed(b': 2}]'), [{"id": 2}])
+        parser.close()
+
+    def test_empty_array_and_empty_body(self):
+        for body in (b"[]", b" [ ]\n", b""):
+            parser = JSONArrayParser(json.loads)
+            self.assertEqual(parser.feed(body), [])
+            parser.close()
+
+    def test_invalid_bodies(self):
+        for body in (b"{}", b"[1,]", b"[,1]", b"[1", b'["a'):
+            parser = JSONArrayParser(json.loads)
+            with self.assertRaises(ValueError):
+                parser.feed(body)
+                parser.close()
+
+
+class StreamTests(BasePushpadTestCase):
+    def test_subscriptions_iter_all_streams_pages(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "5"}
+        client, session = make_client(self.token, self.project_id)
+        first = make_stream_response(ITEMS[:3], headers=headers)
+        second = make_stream_response(ITEMS[3:], headers=headers)
+        session.request.side_effect = [first, second]
+        subscriptions = list(client.subscriptions.iter_all(per_page=3, stream=True))
+        self.assertEqual([s.id for s in subscriptions], [1, 2, 3, 4, 5])
+        self.assertEqual(subscriptions[0].uid, 'u"1\\')
+        self.assertTrue(session.request.call_args[1]["stream"])
+        first.close.assert_called_once_with()
+        second.close.assert_called_once_with()
+        first.json.assert_not_called()
+
+    def test_invalid_streamed_body_raises_client_error(self):
+        client, session = make_client(self.token, self.project_id)
+        response = make_stream_response({"error": "not a list"})
+        session.request.return_value = response
+        with self.assertRaises(PushpadClientError):
+            list(client.subscriptions.iter_all(stream=True))
+        response.close.assert_called_once_with()
+
+
+class AsyncStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def test_subscriptions_iter_all_streams_pages(self):
+        client, session = make_async_client("token", 1)
+        headers = {"Content-Type": "application/json", "X-Total-Count": "5"}
+        response = make_stream_response(ITEMS, size=3, headers=headers)
+        session.send.return_value = response
+        ids = [s.id async for s in client.subscriptions.iter_all(stream=True)]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+        session.request.assert_not_called()
+        self.assertTrue(session.send.call_args[1]["stream"])
+        response.aclose.assert_awaited()
+
+    async def test_streamed_error_response_is_read(self):
+        client, session = make_async_client("token", 1)
+        response = make_response(status=403, payload={"error": "Forbidden"})
+        response.aread = mock.AsyncMock()
+        session.send.return_value = response
+        with self.assertRaises(PushpadAPIError):
+            [s async for s in client.subscriptions.iter_all(stream=True)]
+        response.aread.assert_awaited_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
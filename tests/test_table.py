@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import math
+import unittest
+from unittest import mock
+from datetime import datetime, timezone
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+from pushpad import Subscription, SubscriptionTable
+
+from tests.helpers import BasePushpadTestCase, make_client, make_response
+
+ITEMS = [
+    {"id": 1, "uid": "u1", "tags": ["paid", "news"], "last_click_at": "2025-01-01T00:00:00.000Z"},
+    {"id": 2, "uid": "u2", "tags": ["news"], "last_click_at": None},
+    {"id": 3, "uid": "u1", "tags": [], "last_click_at": "2025-03-01T00:00:00.000Z"},
+    {"id": 4, "uid": None, "tags": ["paid"], "last_click_at": "2025-02-01T00:00:00.000Z"},
+]
+
+
+class SubscriptionTableTests(unittest.TestCase):
+    def setUp(self):
+        self.table = SubscriptionTable.from_api(ITEMS)
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(list(self.table.ids), [1, 2, 3, 4])
+        self.assertEqual(self.table.tag_names, ["paid", "news"])
+        self.assertEqual(list(self.table.tag_offsets), [0, 2, 3, 3, 4])
+        self.assertEqual(list(self.table.tag_codes), [0, 1, 1, 0])
+        self.assertTrue(math.isnan(self.table.last_click_ts[1]))
+
+    def test_rows(self):
+        self.assertEqual(self.table[0], Subscription.from_api({**ITEMS[0]}))
+        self.assertEqual(self.table[-1].tags, ["paid"])
+        self.assertEqual([s.id for s in self.table], [1, 2, 3, 4])
+        with self.assertRaises(IndexError):
+            self.table[4]
+
+    def test_from_subscriptions(self):
+        table = SubscriptionTable.from_subscriptions(Subscription.from_api(item) for item in ITEMS)
+        self.assertEqual(list(table), list(self.table))
+
+    def test_filter_by_tags(self):
+        self.assertEqual(list(self.table.filter(tags="paid").ids), [1, 4])
+        self.assertEqual(list(self.table.filter(tags=["paid", "news"]).ids), [1, 2, 4])
+        self.assertEqual(list(self.table.filter(tags="paid").filter(tags="news").ids), [1])
+        self.assertEqual(len(self.table.filter(tags="missing")), 0)
+
+    def test_filter_by_uids_and_clicks(self):
+        self.assertEqual(list(self.table.filter(uids="u1").ids), [1, 3])
+        after = datetime(2025, 1, 15, tzinfo=timezone.utc)
+        self.assertEqual(list(self.table.filter(last_click_after=after).ids), [3, 4])
+        filtered = self.table.filter(uids=["u1", "u2"], last_click_before="2025-02-01T00:00:00Z")
+        self.assertEqual(list(filtered.ids), [1])
+
+    def test_tag_counts(self):
+        self.assertEqual(self.table.tag_counts(), {"paid": 2, "news": 2})
+        self.assertEqual(self.table.filter(uids="u2").tag_counts(), {"news": 1})
+
+    def test_take(self):
+        taken = self.table.take([3, 0, -1])
+        self.assertEqual(list(taken.ids), [4, 1, 4])
+        self.assertEqual([taken.tags(row) for row in range(3)], [["paid"], ["paid", "news"], ["paid"]])
+        self.assertEqual(len(self.table.take([])), 0)
+        with self.assertRaises(IndexError):
+            self.table.take([4])
+        with mock.patch("pushpad._table.np", None):
+            self.assertEqual(list(self.table.take([3, 0, -1])), list(taken))
+        # The columns were not left exported: the table can still grow.
+        self.table.filter(last_click_after=0).take([0])
+        self.table.extend([{"id": 5}])
+        self.assertEqual(len(self.table), 5)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_and_python_filters_agree(self):
+        items = [{**item, "id": item["id"] + 10 * copy} for copy in range(3) for item in ITEMS]
+        table = SubscriptionTable.from_api(items)
+        conditions = [
+            {},
+            {"tags": "news"},
+            {"tags": ["paid", "missing"], "uids": ["u1", "u2"]},
+            {"uids": "u1", "last_click_after": "2025-02-01T00:00:00Z"},
+            {"last_click_before": 1738368000},
+        ]
+        for condition in conditions:
+            with self.subTest(**condition):
+                fast = table.filter(**condition)
+                with mock.patch("pushpad._table.np", None):
+                    slow = table.filter(**condition)
+                self.assertEqual(list(fast), list(slow))
+                self.assertEqual(list(fast.tag_offsets), list(slow.tag_offsets))
+                self.assertEqual(fast.uids, slow.uids)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_to_numpy_shares_numeric_columns(self):
+        columns = self.table.to_numpy()
+        self.assertEqual(columns["id"].tolist(), [1, 2, 3, 4])
+        self.assertFalse(columns["id"].flags.owndata)
+        self.assertEqual(columns["tag_names"][columns["tag_codes"]].tolist(), ["paid", "news", "news", "paid"])
+        self.assertEqual(int((columns["last_click_ts"] > 0).sum()), 3)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_to_arrow(self):
+        table = self.table.to_arrow()
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(table.column("id").to_pylist(), [1, 2, 3, 4])
+        self.assertEqual(table.column("tags").to_pylist(), [["paid", "news"], ["news"], [], ["paid"]])
+        self.assertEqual(table.column("uid").to_pylist(), ["u1", "u2", "u1", None])
+
+
+class ExportTableTests(BasePushpadTestCase):
+    def test_export_table(self):
+        headers = {"Content-Type": "application/json", "X-Total-Count": "4"}
+        client, session = make_client(self.token, self.project_id)
+
+        def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            return make_response(payload=ITEMS[(page - 1) * 2 : page * 2], headers=headers)
+
+        session.request.side_effect = respond
+        table = client.subscriptions.export_table(per_page=2, tags=["paid"])
+        self.assertIsInstance(table, SubscriptionTable)
+        self.assertEqual(list(table.ids), [1, 2, 3, 4])
+        self.assertEqual(session.request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from pushpad import DeadlineExceededError, PushpadAPIError, RetryPolicy, Timeout, TransportError
+
+from tests.helpers import BasePushpadTestCase, make_async_client, make_client, make_response
+
+
+class TimeoutTests(unittest.TestCase):
+    def test_coerce(self):
+        self.assertEqual(Timeout.coerce(5), Timeout(connect=5, read=5))
+        self.assertEqual(Timeout.coerce((2, 10)), Timeout(connect=2, read=10))
+        timeout = Timeout(read=3, total=4)
+        self.assertIs(Timeout.coerce(timeout), timeout)
+
+    def test_for_attempt_is_limited_by_deadline(self):
+        self.assertEqual(Timeout(2, 10).for_attempt(None), (2, 10))
+        self.assertEqual(Timeout(2, 10).for_attempt(4), (2, 4))
+        self.assertEqual(Timeout().for_attempt(4), (4, 4))
+
+
+class ClientTimeoutTests(BasePushpadTestCase):
+    def test_default_timeout(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response)
+        client.projects.get(1)
+        self.assertEqual(session.request.call_args[1]["timeout"], (30, 30))
+
+    def test_connect_and_read_timeouts(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response, timeout=(3.05, 20))
+        client.senders.get(1)
+        self.assertEqual(session.request.call_args[1]["timeout"], (3.05, 20))
+
+    def test_resource_and_call_timeouts(self):
+        response = make_response(payload=[])
+        client, session = make_client(
+            self.token,
+            self.project_id,
+            response,
+            resource_timeouts={"subscriptions": (5, 120)},
+        )
+        client.subscriptions.all()
+        self.assertEqual(session.request.call_args[1]["timeout"], (5, 120))
+        client.subscriptions.all(timeout=7)
+        self.assertEqual(session.request.call_args[1]["timeout"], (7, 7))
+        client.notifications.all()
+        self.assertEqual(session.request.call_args[1]["timeout"], (30, 30))
+
+    def test_unknown_resource_timeout(self):
+        with self.assertRaises(ValueError):
+            make_client(self.token, resource_timeouts={"users": 5})
+
+    def test_create_many_forwards_timeout(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response)
+        client.notifications.create_many([{"body": "Hello"}], timeout=2)
+        self.assertEqual(session.request.call_args[1]["timeout"], (2, 2))
+
+    def test_read_timeout_is_limited_by_total(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_client(self.token, self.project_id, response)
+        client.notifications.get(1, timeout=Timeout(connect=1, read=10, total=2))
+        connect, read = session.request.call_args[1]["timeout"]
+        self.assertEqual(connect, 1)
+        self.assertLessEqual(read, 2)
+
+    @mock.patch("pushpad.pushpad.time.sleep")
+    def test_deadline_stops_retries(self, sleep):
+        client, session = make_client(self.token, self.project_id, retry=RetryPolicy(backoff_factor=10, jitter=False))
+        session.request.return_value = make_response(status=503, payload={})
+        with self.assertRaises(PushpadAPIError):
+            client.projects.get(1, timeout=Timeout(read=5, total=5))
+        self.assertEqual(session.request.call_count, 1)
+        sleep.assert_not_called()
+
+    def test_attempt_cut_short_by_deadline_raises_deadline_error(self):
+        client, session = make_client(self.token, self.project_id)
+
+        def read_timeout(*args, **kwargs):
+            time.sleep(kwargs["timeout"][1])
+            raise requests.ReadTimeout("read timed out")
+
+        session.request.side_effect = read_timeout
+        with self.assertRaises(DeadlineExceededError) as ctx:
+            client.projects.get(1, timeout=Timeout(read=5, total=0.05))
+        self.assertIsInstance(ctx.exception.__cause__, TransportError)
+
+    @mock.patch("pushpad.pushpad.time.sleep")
+    def test_deadline_preventing_a_retry_raises_deadline_error(self, sleep):
+        client, session = make_client(self.token, self.project_id, retry=RetryPolicy(backoff_factor=10, jitter=False))
+        session.request.side_effect = requests.ConnectionError("refused")
+        with self.assertRaises(DeadlineExceededError) as ctx:
+            client.projects.get(1, timeout=Timeout(total=5))
+        self.assertIsInstance(ctx.exception.__cause__, TransportError)
+        self.assertEqual(session.request.call_count, 1)
+        sleep.assert_not_called()
+
+    def test_expired_deadline_raises(self):
+        client, session = make_client(self.token, self.project_id)
+        with mock.patch("pushpad._base.time.monotonic", side_effect=[100.0, 101.0]):
+            with self.assertRaises(DeadlineExceededError):
+                client.projects.get(1, timeout=Timeout(total=0.5))
+        session.request.assert_not_called()
+
+
+class AsyncClientTimeoutTests(unittest.IsolatedAsyncioTestCase):
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    async def test_call_timeout_is_converted_for_httpx(self):
+        response = make_response(payload={"id": 1})
+        client, session = make_async_client("token", 1, response, timeout=(2, 9))
+        await client.projects.get(1)
+        self.assertEqual(session.request.call_args[1]["timeout"], httpx.Timeout(9, connect=2))
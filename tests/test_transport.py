@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+from unittest import mock
+
+import requests
+
+from pushpad import (
+    AsyncMemoryTransport,
+    AsyncPushpad,
+    AsyncTransport,
+    MemoryResponse,
+    MemoryTransport,
+    Pushpad,
+    PushpadAPIError,
+    PushpadClientError,
+    RequestsTransport,
+    RetryPolicy,
+    Transport,
+    TransportError,
+)
+
+from tests.helpers import BasePushpadTestCase, DummySession
+
+
+class MemoryTransportTests(BasePushpadTestCase):
+    def make_client(self, handler, **options):
+        transport = MemoryTransport(handler)
+        return Pushpad(self.token, self.project_id, transport=transport, **options), transport
+
+    def test_requests_are_recorded(self):
+        client, transport = self.make_client(lambda request: MemoryResponse(201, json={"id": 7, "scheduled": 2}))
+        result = client.notifications.create(body="Hello", uids=["u1"])
+        self.assertEqual(result.id, 7)
+        [request] = transport.requests
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.url, "https://pushpad.xyz/api/v1/projects/1/notifications")
+        self.assertEqual(request.json(), {"body": "Hello", "uids": ["u1"]})
+        self.assertEqual(request.headers["Authorization"], f"Bearer {self.token}")
+        self.assertEqual(request.timeout, (30, 30))
+
+    def test_error_responses_raise_api_error(self):
+        client, _ = self.make_client(lambda request: MemoryResponse(404, content=b"Not found"))
+        with self.assertRaises(PushpadAPIError) as ctx:
+            client.subscriptions.get(5)
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(ctx.exception.reason, "Not Found")
+        self.assertEqual(ctx.exception.response_body, "Not found")
+
+    def test_connect_errors_are_retried_for_creates(self):
+        responses = [TransportError("refused", connect=True), MemoryResponse(201, json={"id": 8})]
+
+        def handler(request):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        retry = RetryPolicy(backoff_factor=0, retry_unprocessed_creates=True)
+        client, transport = self.make_client(handler, retry=retry)
+        self.assertEqual(client.notifications.create(body="Hello").id, 8)
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_errors_raise_client_error(self):
+        def handler(request):
+            raise TransportError("timed out")
+
+        client, _ = self.make_client(handler)
+        with self.assertRaises(PushpadClientError) as ctx:
+            client.notifications.create(body="Hello")
+        self.assertIsInstance(ctx.exception.original_exception, TransportError)
+
+    def test_streamed_responses(self):
+        headers = {"X-Total-Count": "2"}
+        response = MemoryResponse(json=[{"id": 1}, {"id": 2}], headers=headers)
+        client, transport = self.make_client(lambda request: response)
+        self.assertEqual([s.id for s in client.subscriptions.iter_all(stream=True)], [1, 2])
+        self.assertTrue(transport.requests[0].stream)
+
+    def test_async_client(self):
+        async def handler(request):
+            return MemoryResponse(201, json={"id": 9})
+
+        transport = AsyncMemoryTransport(handler)
+
+        async def run():
+            async with AsyncPushpad(self.token, self.project_id, transport=transport) as client:
+                return await client.notifications.create(body="Hello")
+
+        self.assertEqual(asyncio.run(run()).id, 9)
+        self.assertEqual(transport.requests[0].json(), {"body": "Hello"})
+        self.assertEqual(transport.requests[0].headers["Authorization"], f"Bearer {self.token}")
+
+
+class TransportInterfaceTests(unittest.TestCase):
+    def test_transports_without_request_cannot_be_created(self):
+        class Incomplete(Transport):
+            headers = {}
+
+        class AsyncIncomplete(AsyncTransport):
+            headers = {}
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+        with self.assertRaises(TypeError):
+            AsyncIncomplete()
+
+    def test_only_request_must_be_implemented(self):
+        class Minimal(Transport):
+            headers = {}
+
+            def request(self, method, url, **options):
+                return MemoryResponse(200, json={"id": 3, "name": "Project"})
+
+        client = Pushpad("token", transport=Minimal())
+        self.assertEqual(client.projects.get(3).id, 3)
+        self.assertEqual(client.pool_stats(), [])
+        client.close()
+
+
+class RequestsTransportTests(BasePushpadTestCase):
+    def test_requests_errors_are_wrapped(self):
+        session = DummySession()
+        session.request.side_effect = requests.ConnectTimeout("refused")
+        transport = RequestsTransport(session)
+        with self.assertRaises(TransportError) as ctx:
+            transport.request("GET", "https://pushpad.xyz/api/v1/projects")
+        self.assertTrue(ctx.exception.connect)
+        self.assertIsInstance(ctx.exception.__cause__, requests.ConnectTimeout)
+
+    def test_client_error_keeps_original_exception(self):
+        session = DummySession()
+        session.request.side_effect = requests.ReadTimeout("slow")
+        client = Pushpad(self.token, self.project_id, session=session)
+        with self.assertRaises(PushpadClientError) as ctx:
+            client.subscriptions.get(5)
+        self.assertIsInstance(ctx.exception.original_exception, requests.ReadTimeout)
+
+    def test_close_closes_session(self):
+        session = mock.Mock(headers={})
+        Pushpad(self.token, session=session).close()
+        session.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
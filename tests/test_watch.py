@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from pushpad import (
+    AsyncMemoryTransport,
+    AsyncPushpad,
+    MemoryResponse,
+    MemoryTransport,
+    Notification,
+    NotificationChange,
+    Pushpad,
+    PushpadAPIError,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+)
+from pushpad._watch import STATS_FIELDS, WatchSchedule
+
+from tests.helpers import FakeClock
+
+
+def notification(id, **fields):
+    stats = {"successfully_sent_count": 0, "opened_count": 0, "scheduled_count": 0, "cancelled": False}
+    return {"id": id, **stats, **fields}
+
+
+class FakeAPI:
+    def __init__(self, *notifications):
+        self.notifications = {item["id"]: item for item in notifications}
+        self.errors = []
+        self.requests = 0
+        self.blocked = {}
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        id = int(request.url.rsplit("/", 1)[1])
+        if id in self.blocked:
+            self.blocked[id].wait(5)
+        with self.lock:
+            self.threads.add(threading.current_thread())
+            self.requests += 1
+            if self.errors:
+                return self.errors.pop(0)
+            if id not in self.notifications:
+                return MemoryResponse(404, content=b"Not found")
+            return MemoryResponse(200, json=dict(self.notifications[id]))
+
+    def update(self, id, **fields):
+        with self.lock:
+            self.notifications[id].update(fields)
+
+
+class WatchScheduleTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.schedule = WatchSchedule(
+            min_interval=10, max_interval=100, backoff=2, age_factor=0.01, max_age=3600, clock=self.clock
+        )
+
+    def test_unchanged_stats_back_off_and_changes_reset_the_interval(self):
+        self.schedule.add(1)
+        self.assertEqual(self.schedule.due(10), [1])
+        change = self.schedule.record(1, Notification.from_api(notification(1)))
+        self.assertIsNone(change.previous)
+        self.assertEqual(self.schedule.wait_time(), 10)
+        self.clock.now = 10
+        self.schedule.due(10)
+        self.assertIsNone(self.schedule.record(1, Notification.from_api(notification(1))))
+        self.assertEqual(self.schedule.wait_time(), 20)
+        self.clock.now = 30
+        self.schedule.due(10)
+        change = self.schedule.record(1, Notification.from_api(notification(1, opened_count=4)))
+        self.assertEqual(change.changed, ("opened_count",))
+        self.assertEqual(change.previous.opened_count, 0)
+        self.assertEqual(self.schedule.wait_time(), 10)
+
+    def test_older_notifications_are_refreshed_less_often(self):
+        created_at = (datetime.now(timezone.utc) - timedelta(minutes=50)).isoformat().replace("+00:00", "Z")
+        self.schedule.add(1)
+        self.schedule.due(10)
+        self.schedule.record(1, Notification.from_api(notification(1, created_at=created_at)))
+        self.assertAlmostEqual(self.schedule.wait_time(), 30, delta=1)
+
+    def test_finished_notifications_are_dropped(self):
+        created_at = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        for id in (1, 2, 3):
+            self.schedule.add(id)
+        self.schedule.due(10)
+        self.assertTrue(self.schedule.record(1, Notification.from_api(notification(1, cancelled=True))).finished)
+        self.assertTrue(self.schedule.record(2, Notification.from_api(notification(2, created_at=created_at))).finished)
+        self.assertIsNone(self.schedule.record(3, PushpadAPIError(404)))
+        self.assertEqual(len(self.schedule), 0)
+        self.assertIsNone(self.schedule.wait_time())
+
+    def test_errors_back_off(self):
+        self.schedule.add(1)
+        self.schedule.due(10)
+        self.assertIsNone(self.schedule.record(1, PushpadAPIError(500)))
+        self.assertEqual(self.schedule.wait_time(), 20)
+        self.assertEqual(len(self.schedule), 1)
+
+    def test_due_is_limited_and_most_overdue_first(self):
+        for id in (3, 1, 2):
+            self.schedule.add(id)
+        self.assertEqual(self.schedule.due(2), [3, 1])
+        self.assertEqual(self.schedule.due(2), [2])
+        self.assertEqual(self.schedule.due(2), [])
+
+
+class NotificationWatcherTests(unittest.TestCase):
+    def make_watcher(self, api, ids, **options):
+        client = Pushpad("token", 1, transport=MemoryTransport(api), retry=RetryPolicy(max_attempts=1))
+        options = {"min_interval": 0.01, "max_interval": 0.02, "budget": 1000, **options}
+        return client.notifications.watch(ids, **options)
+
+    def test_changes_are_yielded_until_the_notifications_are_finished(self):
+        api = FakeAPI(notification(1), notification(2))
+        watcher = self.make_watcher(api, [1, 2])
+        changes = []
+        for change in watcher:
+            changes.append(change)
+            if len(changes) == 2:
+                api.update(1, successfully_sent_count=5)
+            elif len(changes) == 3:
+                api.update(1, cancelled=True)
+                api.update(2, cancelled=True)
+        self.assertIsInstance(changes[0], NotificationChange)
+        self.assertEqual([change.id for change in changes[:2]], [1, 2])
+        self.assertEqual([change.changed for change in changes[:2]], [STATS_FIELDS, STATS_FIELDS])
+        self.assertEqual(changes[2].id, 1)
+        self.assertEqual(changes[2].changed, ("successfully_sent_count",))
+        self.assertEqual(changes[2].notification.successfully_sent_count, 5)
+        self.assertEqual({change.id for change in changes if change.finished}, {1, 2})
+        self.assertEqual(len(watcher.schedule), 0)
+
+    def test_callbacks_and_stop(self):
+        api = FakeAPI(notification(1))
+        api.errors.append(MemoryResponse(500, content=b"Oops"))
+        errors, changes = [], []
+
+        def on_change(change):
+            changes.append(change)
+            watcher.stop()
+
+        def on_error(id, exc):
+            errors.append((id, exc.status_code))
+
+        watcher = self.make_watcher(api, [1, 2], on_change=on_change, on_error=on_error, concurrency=1)
+        watcher.run()
+        self.assertEqual([change.id for change in changes], [1])
+        self.assertEqual(errors, [(1, 500), (2, 404)])
+        self.assertEqual(len(watcher.schedule), 1)
+
+    def test_budget_limits_the_requests(self):
+        api = FakeAPI(*(notification(id) for id in range(4)))
+        watcher = self.make_watcher(api, range(4), budget=RateLimiter(50, burst=1), min_interval=0.001)
+        timer = threading.Timer(0.2, watcher.stop)
+        timer.start()
+        watcher.run()
+        # 50 requests per second for 0.2s, plus those of the refreshes in progress when stopped.
+        self.assertGreaterEqual(api.requests, 4)
+        self.assertLessEqual(api.requests, 15)
+
+    def test_a_slow_refresh_does_not_hold_back_the_others(self):
+        api = FakeAPI(notification(1), notification(2))
+        api.blocked[1] = threading.Event()
+        changes = []
+        with self.make_watcher(api, [1, 2], concurrency=2) as watcher:
+            for change in watcher:
+                changes.append(change.id)
+                if change.id == 1:
+                    break
+                if len(changes) == 3:
+                    api.blocked[1].set()
+                api.update(2, opened_count=len(changes))
+        self.assertEqual(changes, [2, 2, 2, 1])
+        # The same threads did all the refreshes.
+        self.assertEqual(len(api.threads), 2)
+        self.assertGreaterEqual(api.requests, 4)
+        self.assertEqual(list(watcher), [])
+
+    def test_cache_is_bypassed(self):
+        api = FakeAPI(notification(1))
+        client = Pushpad("token", 1, transport=MemoryTransport(api), cache=ResponseCache())
+        client.notifications.get(1)
+        api.update(1, cancelled=True)
+        [change] = list(client.notifications.watch([1]))
+        self.assertTrue(change.finished)
+
+
+class AsyncNotificationWatcherTests(unittest.IsolatedAsyncioTestCase):
+    async def test_changes_are_yielded(self):
+        api = FakeAPI(notification(1), notification(2))
+        client = AsyncPushpad("token", 1, transport=AsyncMemoryTransport(api))
+        watcher = client.notifications.watch([1, 2, 3], min_interval=0.01, max_interval=0.02, budget=1000)
+        changes = []
+        async for change in watcher:
+            changes.append(change)
+            if change.previous is None:
+                api.update(change.id, cancelled=True)
+        self.assertEqual(sorted(change.id for change in changes if change.finished), [1, 2])
+        self.assertEqual(len(watcher.schedule), 0)
+
+    async def test_a_slow_refresh_does_not_hold_back_the_others(self):
+        release = asyncio.Event()
+        api = FakeAPI(notification(1), notification(2))
+
+        async def handler(request):
+            if request.url.endswith("/1"):
+                await release.wait()
+            return api(request)
+
+        client = AsyncPushpad("token", 1, transport=AsyncMemoryTransport(handler))
+        watcher = client.notifications.watch([1, 2], min_interval=0.01, max_interval=0.02, budget=1000)
+        changes = []
+        async for change in watcher:
+            changes.append(change.id)
+            if change.id == 1:
+                watcher.stop()
+            elif len(changes) == 3:
+                release.set()
+            api.update(2, opened_count=len(changes))
+        self.assertEqual(changes, [2, 2, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()